@@ -0,0 +1,53 @@
+"""add composite and partial indexes for hot queries
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    # Client portal: requirements by email, newest first
+    ("ix_requirements_email_created_at", "requirements", ["email", sa.text("created_at DESC")], None),
+    # Admin keyset pages, unfiltered and filtered by status
+    ("ix_requirements_created_at_id", "requirements", ["created_at", "id"], None),
+    ("ix_requirements_status_created_at_id", "requirements", ["status", "created_at", "id"], None),
+    # Notes on a requirement, newest first (Postgres does not index FKs)
+    ("ix_notes_requirement_id_created_at", "notes", ["requirement_id", "created_at", "id"], None),
+    ("ix_users_created_at_id", "users", ["created_at", "id"], None),
+    # Public lists only ever read active rows
+    ("ix_case_studies_active_order", "case_studies", ["display_order", sa.text("created_at DESC")], "is_active"),
+    ("ix_services_active_order", "services", ["display_order", sa.text("created_at DESC")], "is_active"),
+    ("ix_testimonials_active_created_at", "testimonials", [sa.text("created_at DESC")], "is_active"),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, but it
+    # doesn't block writes while the index builds.
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _where in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
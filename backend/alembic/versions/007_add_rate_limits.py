@@ -0,0 +1,36 @@
+"""add rate_limits table for shared limiter storage
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Counters are short-lived and rebuilt on their own, so skip the WAL
+    op.create_table(
+        "rate_limits",
+        sa.Column("key", sa.String(), primary_key=True),
+        sa.Column("window", sa.BigInteger(), nullable=False),
+        sa.Column("current", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("previous", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+        prefixes=["UNLOGGED"],
+    )
+    op.create_index("ix_rate_limits_expires_at", "rate_limits", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rate_limits_expires_at", table_name="rate_limits")
+    op.drop_table("rate_limits")
@@ -0,0 +1,53 @@
+"""add content-addressed uploads and their references
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "uploads",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False, unique=True),
+        sa.Column("sha256", sa.String(64), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+    op.create_index("ix_uploads_sha256", "uploads", ["sha256"])
+
+    op.create_table(
+        "upload_references",
+        sa.Column(
+            "upload_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("uploads.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("owner_table", sa.String(), primary_key=True),
+        sa.Column("owner_id", postgresql.UUID(as_uuid=True), primary_key=True),
+    )
+    op.create_index(
+        "ix_upload_references_owner", "upload_references", ["owner_table", "owner_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_upload_references_owner", table_name="upload_references")
+    op.drop_table("upload_references")
+    op.drop_index("ix_uploads_sha256", table_name="uploads")
+    op.drop_table("uploads")
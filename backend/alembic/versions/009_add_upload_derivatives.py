@@ -0,0 +1,36 @@
+"""add image derivative fields to uploads
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("uploads", sa.Column("width", sa.Integer(), nullable=True))
+    op.add_column("uploads", sa.Column("height", sa.Integer(), nullable=True))
+    op.add_column("uploads", sa.Column("placeholder", sa.Text(), nullable=True))
+    op.add_column("uploads", sa.Column("variants", postgresql.JSON(), nullable=True))
+    op.add_column(
+        "uploads", sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("uploads", "processed_at")
+    op.drop_column("uploads", "variants")
+    op.drop_column("uploads", "placeholder")
+    op.drop_column("uploads", "height")
+    op.drop_column("uploads", "width")
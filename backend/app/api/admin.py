@@ -1,19 +1,33 @@
-import os
 import secrets
-import uuid as uuid_mod
-from pathlib import Path
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.config import ALLOWED_EXTENSIONS, FRONTEND_URL, MAX_UPLOAD_SIZE, UPLOAD_DIR
-from app.core.database import get_db
+from app.core.cache import catalog_cache
+from app.core.config import FRONTEND_URL
+from app.core.database import get_async_db, get_db
 from app.core.deps import CurrentUser, require_admin, require_admin_or_editor
+from app.core.limiter import COST_UPLOAD, budget
+from app.core.pagination import PageParams, keyset_page
+from app.core.revocation import CATALOG_CHANNEL, notify_revoked
 from app.models.case_study import CaseStudy
 from app.models.note import Note
-from app.models.requirement import Requirement, RequirementStatus
+from app.models.requirement import Requirement, RequirementStatus, RequirementType
 from app.models.site_content import SiteContent
 from app.models.user import User, UserRole
 from app.schemas.case_study import (
@@ -33,6 +47,9 @@ from app.schemas.site_content import (
     SiteContentResponse,
     SiteContentUpdate,
 )
+from app.schemas.upload import UploadResponse, UploadSessionCreate, UploadSessionResponse
+from app.services import upload_sessions
+from app.services.uploads import check_upload, register_upload, store_stream, track_references
 
 router = APIRouter()
 
@@ -67,13 +84,25 @@ def _create_client_invitation(requirement: Requirement, db: Session) -> Optional
 
 @router.get("/requirements", response_model=list[RequirementResponse])
 def list_requirements(
+    response: Response,
+    status_filter: Optional[RequirementStatus] = Query(None, alias="status"),
+    type_filter: Optional[RequirementType] = Query(None, alias="type"),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    page: PageParams = Depends(),
     user: CurrentUser = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    requirements = (
-        db.query(Requirement).order_by(Requirement.created_at.desc()).all()
-    )
-    return requirements
+    query = db.query(Requirement)
+    if status_filter is not None:
+        query = query.filter(Requirement.status == status_filter)
+    if type_filter is not None:
+        query = query.filter(Requirement.type == type_filter)
+    if created_after is not None:
+        query = query.filter(Requirement.created_at >= created_after)
+    if created_before is not None:
+        query = query.filter(Requirement.created_at < created_before)
+    return keyset_page(query, Requirement, page, response)
 
 
 @router.get("/requirements/{requirement_id}", response_model=RequirementStatusResponse)
@@ -188,6 +217,8 @@ def create_note(
 )
 def list_notes(
     requirement_id: UUID,
+    response: Response,
+    page: PageParams = Depends(),
     user: CurrentUser = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
@@ -199,42 +230,100 @@ def list_notes(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Requirement not found",
         )
-    notes = (
-        db.query(Note)
-        .filter(Note.requirement_id == requirement_id)
-        .order_by(Note.created_at.desc())
-        .all()
-    )
-    return notes
+    query = db.query(Note).filter(Note.requirement_id == requirement_id)
+    return keyset_page(query, Note, page, response)
 
 
 # ── File Uploads (admin or editor) ──────────────────────────
 
 
-@router.post("/uploads")
+@router.post("/uploads", response_model=UploadResponse)
+@budget(COST_UPLOAD)
 async def upload_file(
+    request: Request,
     file: UploadFile,
     user: CurrentUser = Depends(require_admin_or_editor),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    ext = Path(file.filename or "").suffix.lower()
-    if ext not in ALLOWED_EXTENSIONS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File type '{ext}' not allowed. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}",
-        )
-    contents = await file.read()
-    if len(contents) > MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Max size: {MAX_UPLOAD_SIZE // (1024 * 1024)} MB",
-        )
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-    safe_name = Path(file.filename or "upload").name.replace(" ", "_")
-    unique_name = f"{uuid_mod.uuid4().hex[:12]}_{safe_name}"
-    file_path = os.path.join(UPLOAD_DIR, unique_name)
-    with open(file_path, "wb") as f:
-        f.write(contents)
-    return {"url": f"/uploads/{unique_name}"}
+    check_upload(file.filename)
+    # The multipart parser has spooled the body; stream it from there in
+    # chunks on a worker thread instead of reading it all into memory here.
+    stored = await run_in_threadpool(store_stream, file.file, file.filename)
+    return await _registered(db, stored, file.filename)
+
+
+async def _registered(db: AsyncSession, stored, filename: str) -> UploadResponse:
+    upload = await register_upload(db, stored, filename)
+    return UploadResponse(id=str(upload.id), url=f"/uploads/{upload.name}")
+
+
+# Resumable uploads: create a session, PATCH the bytes in pieces with
+# Upload-Offset set to the current offset (GET the session to find it after
+# a dropped connection), then complete it.
+
+
+def _session_response(session, offset: int) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        id=session.id, filename=session.filename, size=session.size, offset=offset
+    )
+
+
+@router.post(
+    "/uploads/sessions",
+    response_model=UploadSessionResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+@budget(COST_UPLOAD)
+async def create_upload_session(
+    request: Request,
+    body: UploadSessionCreate,
+    user: CurrentUser = Depends(require_admin_or_editor),
+):
+    session = await run_in_threadpool(
+        upload_sessions.create_session, user.id, body.filename, body.size
+    )
+    return _session_response(session, 0)
+
+
+@router.get("/uploads/sessions/{session_id}", response_model=UploadSessionResponse)
+async def get_upload_session(
+    session_id: UUID,
+    user: CurrentUser = Depends(require_admin_or_editor),
+):
+    session = upload_sessions.load_session(session_id.hex, user.id)
+    return _session_response(session, upload_sessions.session_offset(session))
+
+
+@router.patch("/uploads/sessions/{session_id}", response_model=UploadSessionResponse)
+async def append_upload_chunk(
+    session_id: UUID,
+    request: Request,
+    upload_offset: int = Header(ge=0),
+    user: CurrentUser = Depends(require_admin_or_editor),
+):
+    session = upload_sessions.load_session(session_id.hex, user.id)
+    offset = await upload_sessions.append_chunk(session, upload_offset, request.stream())
+    return _session_response(session, offset)
+
+
+@router.post("/uploads/sessions/{session_id}/complete", response_model=UploadResponse)
+async def complete_upload_session(
+    session_id: UUID,
+    user: CurrentUser = Depends(require_admin_or_editor),
+    db: AsyncSession = Depends(get_async_db),
+):
+    session = upload_sessions.load_session(session_id.hex, user.id)
+    stored = await run_in_threadpool(upload_sessions.complete_session, session)
+    return await _registered(db, stored, session.filename)
+
+
+@router.delete("/uploads/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_upload_session(
+    session_id: UUID,
+    user: CurrentUser = Depends(require_admin_or_editor),
+):
+    session = upload_sessions.load_session(session_id.hex, user.id)
+    upload_sessions.delete_session(session.id)
 
 
 # ── Case Studies (admin or editor) ──────────────────────────
@@ -307,7 +396,11 @@ def create_case_study(
         is_active=body.is_active,
     )
     db.add(study)
+    db.flush()
+    track_references(db, study, study.gallery)
+    notify_revoked(db, CaseStudy.__tablename__, CATALOG_CHANNEL)
     db.commit()
+    catalog_cache.invalidate(CaseStudy.__tablename__)
     db.refresh(study)
     return CaseStudyAdminResponse.from_orm_model(study)
 
@@ -352,7 +445,11 @@ def update_case_study(
         ]
     for field, value in update_data.items():
         setattr(study, field, value)
+    if "gallery" in update_data:
+        track_references(db, study, study.gallery)
+    notify_revoked(db, CaseStudy.__tablename__, CATALOG_CHANNEL)
     db.commit()
+    catalog_cache.invalidate(CaseStudy.__tablename__)
     db.refresh(study)
     return CaseStudyAdminResponse.from_orm_model(study)
 
@@ -373,7 +470,9 @@ def delete_case_study(
             detail="Case study not found",
         )
     study.is_active = False
+    notify_revoked(db, CaseStudy.__tablename__, CATALOG_CHANNEL)
     db.commit()
+    catalog_cache.invalidate(CaseStudy.__tablename__)
 
 
 # ── Site Content (admin or editor) ──────────────────────────
@@ -411,7 +510,11 @@ def create_site_content(
         metadata_=body.metadata,
     )
     db.add(item)
+    db.flush()
+    track_references(db, item, item.metadata_)
+    notify_revoked(db, SiteContent.__tablename__, CATALOG_CHANNEL)
     db.commit()
+    catalog_cache.invalidate(SiteContent.__tablename__)
     db.refresh(item)
     return SiteContentResponse.from_orm_model(item)
 
@@ -443,7 +546,11 @@ def update_site_content(
         update_data["metadata_"] = update_data.pop("metadata")
     for field, value in update_data.items():
         setattr(item, field, value)
+    if "metadata_" in update_data:
+        track_references(db, item, item.metadata_)
+    notify_revoked(db, SiteContent.__tablename__, CATALOG_CHANNEL)
     db.commit()
+    catalog_cache.invalidate(SiteContent.__tablename__)
     db.refresh(item)
     return SiteContentResponse.from_orm_model(item)
 
@@ -463,5 +570,8 @@ def delete_site_content(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Site content not found",
         )
+    track_references(db, item)
     db.delete(item)
+    notify_revoked(db, SiteContent.__tablename__, CATALOG_CHANNEL)
     db.commit()
+    catalog_cache.invalidate(SiteContent.__tablename__)
@@ -1,10 +1,15 @@
-from bcrypt import hashpw, gensalt
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.core.limiter import limiter
-from app.core.security import verify_password, create_access_token
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.core.limiter import COST_PASSWORD, address_key, budget, limiter
+from app.core.security import (
+    create_access_token,
+    hash_password,
+    password_executor,
+    verify_and_update,
+)
 from app.models.user import User, UserRole
 from app.schemas.auth import (
     InviteAcceptRequest,
@@ -17,24 +22,45 @@ from app.schemas.auth import (
 router = APIRouter()
 
 
+# bcrypt is deliberately slow, so hashing and verification run on the
+# dedicated password executor rather than blocking the event loop.
+
+
 @router.post("/login", response_model=LoginResponse)
-@limiter.limit("10/minute")
-def login(request: Request, body: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == body.email).first()
-    if not user or not user.password_hash or not verify_password(body.password, user.password_hash):
+@limiter.limit("10/minute", key_func=address_key)
+@budget(COST_PASSWORD, key_func=address_key)
+async def login(request: Request, body: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(User).where(User.email == body.email))
+    user = result.scalars().first()
+    verified, new_hash = False, None
+    if user and user.password_hash:
+        verified, new_hash = await password_executor.run(
+            verify_and_update, body.password, user.password_hash
+        )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
+    if new_hash:
+        # The stored hash used an outdated cost; upgrade it now we know the password
+        user.password_hash = new_hash
+        await db.commit()
 
-    token = create_access_token(str(user.id), user.role.value)
+    token = create_access_token(
+        str(user.id), user.role.value, user.email, user.token_version
+    )
     return LoginResponse(access_token=token, role=user.role.value)
 
 
 @router.post("/accept-invite", response_model=InviteAcceptResponse)
-def accept_invite(body: InviteAcceptRequest, db: Session = Depends(get_db)):
+@budget(COST_PASSWORD, key_func=address_key)
+async def accept_invite(
+    request: Request, body: InviteAcceptRequest, db: AsyncSession = Depends(get_async_db)
+):
     """Client accepts an invitation by setting their password."""
-    user = db.query(User).filter(User.invite_token == body.token).first()
+    result = await db.execute(select(User).where(User.invite_token == body.token))
+    user = result.scalars().first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -47,19 +73,21 @@ def accept_invite(body: InviteAcceptRequest, db: Session = Depends(get_db)):
             detail="Invitation already accepted",
         )
 
-    password_hash = hashpw(body.password.encode("utf-8"), gensalt()).decode("utf-8")
-    user.password_hash = password_hash
+    user.password_hash = await password_executor.run(hash_password, body.password)
     user.invite_token = None
-    db.commit()
+    await db.commit()
 
-    token = create_access_token(str(user.id), user.role.value)
+    token = create_access_token(
+        str(user.id), user.role.value, user.email, user.token_version
+    )
     return InviteAcceptResponse(access_token=token, role=user.role.value)
 
 
 @router.get("/invite-info")
-def get_invite_info(token: str, db: Session = Depends(get_db)):
+async def get_invite_info(token: str, db: AsyncSession = Depends(get_async_db)):
     """Returns basic info about an invitation so the frontend can display it."""
-    user = db.query(User).filter(User.invite_token == token).first()
+    result = await db.execute(select(User).where(User.invite_token == token))
+    user = result.scalars().first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -74,10 +102,12 @@ def get_invite_info(token: str, db: Session = Depends(get_db)):
 
 
 @router.post("/register", response_model=LoginResponse, status_code=status.HTTP_201_CREATED)
-@limiter.limit("5/minute")
-def register(request: Request, body: RegisterRequest, db: Session = Depends(get_db)):
+@limiter.limit("5/minute", key_func=address_key)
+@budget(COST_PASSWORD, key_func=address_key)
+async def register(request: Request, body: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
     """Public client self-registration."""
-    existing = db.query(User).filter(User.email == body.email).first()
+    result = await db.execute(select(User).where(User.email == body.email))
+    existing = result.scalars().first()
 
     if existing:
         if existing.password_hash:
@@ -86,23 +116,25 @@ def register(request: Request, body: RegisterRequest, db: Session = Depends(get_
                 detail="An account with this email already exists. Please sign in.",
             )
         # Invite-only user hasn't set password yet — claim the account
-        password_hash = hashpw(body.password.encode("utf-8"), gensalt()).decode("utf-8")
-        existing.password_hash = password_hash
+        existing.password_hash = await password_executor.run(hash_password, body.password)
         existing.invite_token = None
-        db.commit()
-        token = create_access_token(str(existing.id), existing.role.value)
+        await db.commit()
+        token = create_access_token(
+            str(existing.id), existing.role.value, existing.email, existing.token_version
+        )
         return LoginResponse(access_token=token, role=existing.role.value)
 
     # New user
-    password_hash = hashpw(body.password.encode("utf-8"), gensalt()).decode("utf-8")
     user = User(
         email=body.email,
-        password_hash=password_hash,
+        password_hash=await password_executor.run(hash_password, body.password),
         role=UserRole.client,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
-    token = create_access_token(str(user.id), user.role.value)
+    token = create_access_token(
+        str(user.id), user.role.value, user.email, user.token_version
+    )
     return LoginResponse(access_token=token, role=user.role.value)
@@ -1,14 +1,15 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_async_read_db
 from app.core.deps import CurrentUser, require_client
+from app.core.limiter import COST_WRITE, budget
 from app.models.note import Note
 from app.models.requirement import Requirement, RequirementStatus
 from app.models.testimonial import Testimonial
-from app.models.user import User
 from app.schemas.note import NoteResponse
 from app.schemas.requirement import RequirementResponse
 from app.schemas.testimonial import ClientTestimonialCreate, TestimonialResponse
@@ -16,84 +17,61 @@ from app.schemas.testimonial import ClientTestimonialCreate, TestimonialResponse
 router = APIRouter()
 
 
-def _get_client_user(user: CurrentUser, db: Session) -> User:
-    """Look up the User row for the current client, converting the JWT string id to UUID."""
-    client_user = db.query(User).filter(User.id == UUID(user.id)).first()
-    if not client_user:
+async def _get_own_requirement(
+    requirement_id: UUID, user: CurrentUser, db: AsyncSession
+) -> Requirement:
+    result = await db.execute(
+        select(Requirement).where(
+            Requirement.id == requirement_id,
+            Requirement.email == user.email,
+        )
+    )
+    requirement = result.scalars().first()
+    if not requirement:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
+            detail="Requirement not found",
         )
-    return client_user
+    return requirement
 
 
 @router.get("/requirements", response_model=list[RequirementResponse])
-def list_my_requirements(
+async def list_my_requirements(
     user: CurrentUser = Depends(require_client),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """Client sees only requirements matching their email."""
-    client_user = _get_client_user(user, db)
-    requirements = (
-        db.query(Requirement)
-        .filter(Requirement.email == client_user.email)
+    result = await db.execute(
+        select(Requirement)
+        .where(Requirement.email == user.email)
         .order_by(Requirement.created_at.desc())
-        .all()
     )
-    return requirements
+    return result.scalars().all()
 
 
 @router.get("/requirements/{requirement_id}", response_model=RequirementResponse)
-def get_my_requirement(
+async def get_my_requirement(
     requirement_id: UUID,
     user: CurrentUser = Depends(require_client),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    client_user = _get_client_user(user, db)
-    requirement = (
-        db.query(Requirement)
-        .filter(
-            Requirement.id == requirement_id,
-            Requirement.email == client_user.email,
-        )
-        .first()
-    )
-    if not requirement:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Requirement not found",
-        )
-    return requirement
+    return await _get_own_requirement(requirement_id, user, db)
 
 
 @router.get("/requirements/{requirement_id}/notes", response_model=list[NoteResponse])
-def list_my_notes(
+async def list_my_notes(
     requirement_id: UUID,
     user: CurrentUser = Depends(require_client),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """Client can see notes on their own requirements."""
-    client_user = _get_client_user(user, db)
-    requirement = (
-        db.query(Requirement)
-        .filter(
-            Requirement.id == requirement_id,
-            Requirement.email == client_user.email,
-        )
-        .first()
-    )
-    if not requirement:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Requirement not found",
-        )
-    notes = (
-        db.query(Note)
-        .filter(Note.requirement_id == requirement_id)
+    await _get_own_requirement(requirement_id, user, db)
+    result = await db.execute(
+        select(Note)
+        .where(Note.requirement_id == requirement_id)
         .order_by(Note.created_at.desc())
-        .all()
     )
-    return notes
+    return result.scalars().all()
 
 
 @router.post(
@@ -101,27 +79,16 @@ def list_my_notes(
     response_model=TestimonialResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def submit_testimonial(
+@budget(COST_WRITE)
+async def submit_testimonial(
+    request: Request,
     requirement_id: UUID,
     body: ClientTestimonialCreate,
     user: CurrentUser = Depends(require_client),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Client can submit a testimonial once their project is completed."""
-    client_user = _get_client_user(user, db)
-    requirement = (
-        db.query(Requirement)
-        .filter(
-            Requirement.id == requirement_id,
-            Requirement.email == client_user.email,
-        )
-        .first()
-    )
-    if not requirement:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Requirement not found",
-        )
+    requirement = await _get_own_requirement(requirement_id, user, db)
 
     if requirement.status != RequirementStatus.completed:
         raise HTTPException(
@@ -143,6 +110,6 @@ def submit_testimonial(
         featured=False,
     )
     db.add(testimonial)
-    db.commit()
-    db.refresh(testimonial)
+    await db.commit()
+    await db.refresh(testimonial)
     return testimonial
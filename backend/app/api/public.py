@@ -1,20 +1,36 @@
-from typing import Optional
+from contextlib import nullcontext
+from typing import Awaitable, Callable, NamedTuple, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
-from app.core.database import get_db
-from app.core.limiter import limiter
+from app.core.cache import catalog_cache
+from app.core.database import (
+    AsyncSessionLocal,
+    get_async_db,
+    get_async_read_db,
+    reads_from_replica,
+)
+from app.core.deps import revocations
+from app.core.etag import REVALIDATE, compute_etag, etag_matches, not_modified
+from app.core.limiter import COST_WRITE, address_key, budget, limiter
+from app.core.responses import FastJSONResponse, json_object
 from app.models.case_study import CaseStudy
 from app.models.requirement import Requirement
 from app.models.service import Service
 from app.models.site_content import SiteContent
 from app.models.testimonial import Testimonial
-from app.schemas.case_study import CaseStudyResponse
+from app.models.upload import Upload
+from app.schemas.bundle import PageBundleResponse
+from app.schemas.case_study import CaseStudyResponse, CaseStudySummary
 from app.schemas.requirement import RequirementCreate, RequirementResponse
 from app.schemas.service import ServiceResponse
 from app.schemas.site_content import SiteContentResponse
 from app.schemas.testimonial import TestimonialResponse
+from app.services.uploads import URL_PREFIX, referenced_names
 
 router = APIRouter()
 
@@ -24,8 +40,11 @@ router = APIRouter()
     response_model=RequirementResponse,
     status_code=status.HTTP_201_CREATED,
 )
-@limiter.limit("5/minute")
-def create_requirement(request: Request, body: RequirementCreate, db: Session = Depends(get_db)):
+@limiter.limit("5/minute", key_func=address_key)
+@budget(COST_WRITE, key_func=address_key)
+async def create_requirement(
+    request: Request, body: RequirementCreate, db: AsyncSession = Depends(get_async_db)
+):
     requirement = Requirement(
         name=body.name,
         email=body.email,
@@ -37,55 +56,227 @@ def create_requirement(request: Request, body: RequirementCreate, db: Session =
         timeline=body.timeline,
     )
     db.add(requirement)
-    db.commit()
-    db.refresh(requirement)
+    await db.commit()
+    await db.refresh(requirement)
     return requirement
 
 
-@router.get("/case-studies", response_model=list[CaseStudyResponse])
-def list_case_studies(db: Session = Depends(get_db)):
-    studies = (
-        db.query(CaseStudy)
-        .filter(CaseStudy.is_active == True)
+# ── Catalog loaders (cached, see app.core.cache) ────────────
+
+
+class _CatalogPart(NamedTuple):
+    """One cacheable catalog read: its cache key, source table and loader."""
+
+    key: tuple
+    model: type
+    load: Callable[[AsyncSession], Awaitable[bytes]]
+
+
+async def _catalog_etag(db: AsyncSession, part: _CatalogPart) -> str:
+    """ETag for a catalog read, derived from the table's row count and
+    latest updated_at so every worker computes the same value."""
+    result = await db.execute(
+        select(func.count(part.model.id), func.max(part.model.updated_at))
+    )
+    return compute_etag(part.key, *result.one())
+
+
+def _combined_etag(etags: list[str]) -> str:
+    return etags[0] if len(etags) == 1 else compute_etag(*etags)
+
+
+async def _conditional_catalog(
+    request: Request,
+    db: AsyncSession,
+    parts: list[_CatalogPart],
+    build: Callable[[list[bytes]], bytes] = lambda payloads: payloads[0],
+) -> Response:
+    """Serve cached catalog reads, answering 304 when If-None-Match is current.
+
+    Cache entries pair each part's encoded JSON with an ETag taken before its
+    rows were loaded, so a stored ETag never claims a newer version than its
+    body. The response ETag combines the ETags of every part. While this
+    worker may be missing other workers' invalidations, the cache is
+    bypassed and every part is read from the database."""
+    cached = revocations.trusted()
+    entries = [catalog_cache.get(part.key) if cached else None for part in parts]
+    # A table written to moments ago may not have reached the replica yet;
+    # read it from the primary so the reload cached after the write is fresh.
+    lagging = reads_from_replica(db) and any(
+        catalog_cache.recently_invalidated(part.key[0]) for part in parts
+    )
+    async with AsyncSessionLocal() if lagging else nullcontext(db) as primary:
+        sessions = [
+            primary if catalog_cache.recently_invalidated(part.key[0]) else db for part in parts
+        ]
+        etags = [
+            entry[0] if entry is not None else await _catalog_etag(source, part)
+            for part, entry, source in zip(parts, entries, sessions)
+        ]
+        if etag_matches(request, _combined_etag(etags)):
+            return not_modified(_combined_etag(etags))
+
+        for i, (part, etag, source) in enumerate(zip(parts, etags, sessions)):
+            if entries[i] is None and not cached:
+                entries[i] = await _stamped(etag, part.load(source))
+            elif entries[i] is None:
+                entries[i] = await catalog_cache.get_or_load(
+                    part.key,
+                    lambda part=part, etag=etag, source=source: _stamped(etag, part.load(source)),
+                )
+    # A concurrent load may have stored a different version than we stamped.
+    etag = _combined_etag([entry[0] for entry in entries])
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return FastJSONResponse(
+        build([entry[1] for entry in entries]),
+        headers={"ETag": etag, "Cache-Control": REVALIDATE},
+    )
+
+
+# Precompiled list serializers: rows are validated once when the response
+# models are built, then encoded straight to JSON bytes.
+_case_study_list = TypeAdapter(list[CaseStudySummary])
+_service_list = TypeAdapter(list[ServiceResponse])
+_testimonial_list = TypeAdapter(list[TestimonialResponse])
+_site_content_list = TypeAdapter(list[SiteContentResponse])
+
+
+async def _stamped(etag: str, payload: Awaitable[bytes]) -> tuple[str, bytes]:
+    return etag, await payload
+
+
+async def _encode(adapter: TypeAdapter, rows: Awaitable[list]) -> bytes:
+    return adapter.dump_json(await rows)
+
+
+async def _load_case_studies(db: AsyncSession) -> list[CaseStudySummary]:
+    # Only fetch the summary columns; the heavy Text/JSON narrative columns
+    # stay deferred and are never loaded for list reads.
+    result = await db.execute(
+        select(CaseStudy)
+        .options(
+            load_only(
+                CaseStudy.id,
+                CaseStudy.slug,
+                CaseStudy.title,
+                CaseStudy.role,
+                CaseStudy.description,
+                CaseStudy.industry,
+                CaseStudy.technologies,
+                CaseStudy.featured,
+                CaseStudy.metrics,
+                CaseStudy.visual_color,
+                CaseStudy.visual_icon,
+                CaseStudy.created_at,
+                CaseStudy.updated_at,
+                raiseload=True,
+            )
+        )
+        .where(CaseStudy.is_active == True)
         .order_by(CaseStudy.display_order, CaseStudy.created_at.desc())
-        .all()
     )
-    return [CaseStudyResponse.from_orm_model(s) for s in studies]
+    return [CaseStudySummary.from_orm_model(s) for s in result.scalars()]
+
+
+async def _load_services(db: AsyncSession) -> list[ServiceResponse]:
+    result = await db.execute(
+        select(Service)
+        .where(Service.is_active == True)
+        .order_by(Service.display_order, Service.created_at.desc())
+    )
+    return _service_list.validate_python(result.scalars().all(), from_attributes=True)
+
+
+async def _load_testimonials(db: AsyncSession) -> list[TestimonialResponse]:
+    result = await db.execute(
+        select(Testimonial)
+        .where(Testimonial.is_active == True)
+        .order_by(Testimonial.created_at.desc())
+    )
+    return _testimonial_list.validate_python(result.scalars().all(), from_attributes=True)
+
+
+async def _load_site_content(
+    db: AsyncSession, keys: Optional[tuple[str, ...]]
+) -> list[SiteContentResponse]:
+    query = select(SiteContent)
+    if keys:
+        query = query.where(SiteContent.key.in_(keys))
+    result = await db.execute(query)
+    return [SiteContentResponse.from_orm_model(c) for c in result.scalars()]
+
+
+def _case_studies_part() -> _CatalogPart:
+    return _CatalogPart(
+        (CaseStudy.__tablename__,),
+        CaseStudy,
+        lambda db: _encode(_case_study_list, _load_case_studies(db)),
+    )
+
+
+def _services_part() -> _CatalogPart:
+    return _CatalogPart(
+        (Service.__tablename__,),
+        Service,
+        lambda db: _encode(_service_list, _load_services(db)),
+    )
+
+
+def _testimonials_part() -> _CatalogPart:
+    return _CatalogPart(
+        (Testimonial.__tablename__,),
+        Testimonial,
+        lambda db: _encode(_testimonial_list, _load_testimonials(db)),
+    )
+
+
+def _site_content_part(keys: Optional[tuple[str, ...]]) -> _CatalogPart:
+    return _CatalogPart(
+        (SiteContent.__tablename__, keys),
+        SiteContent,
+        lambda db: _encode(_site_content_list, _load_site_content(db, keys)),
+    )
+
+
+# ── Public catalog ──────────────────────────────────────────
+
+
+@router.get("/case-studies", response_model=list[CaseStudySummary])
+async def list_case_studies(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    return await _conditional_catalog(request, db, [_case_studies_part()])
 
 
 @router.get("/case-studies/{slug}", response_model=CaseStudyResponse)
-def get_case_study(slug: str, db: Session = Depends(get_db)):
-    study = (
-        db.query(CaseStudy)
-        .filter(CaseStudy.slug == slug, CaseStudy.is_active == True)
-        .first()
+async def get_case_study(slug: str, db: AsyncSession = Depends(get_async_read_db)):
+    result = await db.execute(
+        select(CaseStudy).where(CaseStudy.slug == slug, CaseStudy.is_active == True)
     )
+    study = result.scalars().first()
     if not study:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Case study not found",
         )
-    return CaseStudyResponse.from_orm_model(study)
+    names = referenced_names(study.gallery)
+    uploads = {}
+    if names:
+        rows = await db.scalars(select(Upload).where(Upload.name.in_(names)))
+        uploads = {URL_PREFIX + u.name: u for u in rows}
+    return FastJSONResponse(CaseStudyResponse.from_orm_model(study, uploads))
 
 
 @router.get("/services", response_model=list[ServiceResponse])
-def list_services(db: Session = Depends(get_db)):
-    services = (
-        db.query(Service)
-        .filter(Service.is_active == True)
-        .order_by(Service.display_order, Service.created_at.desc())
-        .all()
-    )
-    return services
+async def list_services(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    return await _conditional_catalog(request, db, [_services_part()])
 
 
 @router.get("/services/{slug}", response_model=ServiceResponse)
-def get_service(slug: str, db: Session = Depends(get_db)):
-    service = (
-        db.query(Service)
-        .filter(Service.slug == slug, Service.is_active == True)
-        .first()
+async def get_service(slug: str, db: AsyncSession = Depends(get_async_read_db)):
+    result = await db.execute(
+        select(Service).where(Service.slug == slug, Service.is_active == True)
     )
+    service = result.scalars().first()
     if not service:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -95,19 +286,72 @@ def get_service(slug: str, db: Session = Depends(get_db)):
 
 
 @router.get("/testimonials", response_model=list[TestimonialResponse])
-def list_testimonials(db: Session = Depends(get_db)):
-    testimonials = (
-        db.query(Testimonial)
-        .filter(Testimonial.is_active == True)
-        .order_by(Testimonial.created_at.desc())
-        .all()
-    )
-    return testimonials
+async def list_testimonials(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    return await _conditional_catalog(request, db, [_testimonials_part()])
 
 
 @router.get("/site-content", response_model=list[SiteContentResponse])
-def list_site_content(key: Optional[str] = None, db: Session = Depends(get_db)):
-    query = db.query(SiteContent)
-    if key:
-        query = query.filter(SiteContent.key == key)
-    return [SiteContentResponse.from_orm_model(c) for c in query.all()]
+async def list_site_content(
+    request: Request,
+    key: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    keys = (key,) if key else None
+    return await _conditional_catalog(request, db, [_site_content_part(keys)])
+
+
+# ── Page bundles ────────────────────────────────────────────
+
+# Site content keys each page reads, mirroring the frontend pages.
+PAGE_SITE_CONTENT_KEYS = {
+    "home": ("hero_description", "home_services"),
+    "portfolio": ("portfolio_hero",),
+    "about": (
+        "about_hero",
+        "about_story",
+        "about_why_platform",
+        "about_philosophy",
+        "about_tech_stack",
+    ),
+}
+
+
+@router.get("/bundle/home", response_model=PageBundleResponse)
+async def get_home_bundle(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    """Everything HomePage renders, in one session and one response."""
+    return await _conditional_catalog(
+        request, db,
+        [
+            _case_studies_part(),
+            _testimonials_part(),
+            _site_content_part(PAGE_SITE_CONTENT_KEYS["home"]),
+        ],
+        lambda p: json_object(case_studies=p[0], testimonials=p[1], site_content=p[2]),
+    )
+
+
+@router.get("/bundle/portfolio", response_model=PageBundleResponse)
+async def get_portfolio_bundle(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    """Everything PortfolioPage renders, in one session and one response."""
+    return await _conditional_catalog(
+        request, db,
+        [
+            _case_studies_part(),
+            _site_content_part(PAGE_SITE_CONTENT_KEYS["portfolio"]),
+        ],
+        lambda p: json_object(case_studies=p[0], testimonials=b"[]", site_content=p[1]),
+    )
+
+
+@router.get("/bundle/about", response_model=PageBundleResponse)
+async def get_about_bundle(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    """Everything AboutPage renders, in one session and one response."""
+    return await _conditional_catalog(
+        request, db,
+        [
+            _case_studies_part(),
+            _testimonials_part(),
+            _site_content_part(PAGE_SITE_CONTENT_KEYS["about"]),
+        ],
+        lambda p: json_object(case_studies=p[0], testimonials=p[1], site_content=p[2]),
+    )
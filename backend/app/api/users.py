@@ -1,11 +1,14 @@
+from typing import Optional
 from uuid import UUID
 
-from bcrypt import hashpw, gensalt
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.deps import CurrentUser, require_admin
+from app.core.deps import CurrentUser, identity_cache, require_admin
+from app.core.pagination import PageParams, keyset_page
+from app.core.revocation import notify_revoked
+from app.core.security import hash_password, password_executor
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
 
@@ -14,11 +17,16 @@ router = APIRouter()
 
 @router.get("/", response_model=list[UserResponse])
 def list_users(
+    response: Response,
+    role: Optional[UserRole] = None,
+    page: PageParams = Depends(),
     user: CurrentUser = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    users = db.query(User).order_by(User.created_at.desc()).all()
-    return users
+    query = db.query(User)
+    if role is not None:
+        query = query.filter(User.role == role)
+    return keyset_page(query, User, page, response)
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -34,10 +42,9 @@ def create_user(
             detail="Email already registered",
         )
 
-    password_hash = hashpw(body.password.encode("utf-8"), gensalt()).decode("utf-8")
     new_user = User(
         email=body.email,
-        password_hash=password_hash,
+        password_hash=password_executor.call(hash_password, body.password),
         role=UserRole(body.role),
     )
     db.add(new_user)
@@ -60,12 +67,20 @@ def update_user(
             detail="User not found",
         )
 
-    if body.role is not None:
+    changed = False
+    if body.role is not None and UserRole(body.role) != target.role:
         target.role = UserRole(body.role)
-    if body.email is not None:
+        changed = True
+    if body.email is not None and body.email != target.email:
         target.email = body.email
+        changed = True
+    if changed:
+        # Tokens carry the role and email, so revoke the ones issued before
+        target.token_version += 1
 
+    notify_revoked(db, str(target.id))
     db.commit()
+    identity_cache.invalidate(str(target.id))
     db.refresh(target)
     return target
 
@@ -88,4 +103,6 @@ def delete_user(
             detail="Cannot delete yourself",
         )
     db.delete(target)
+    notify_revoked(db, str(user_id))
     db.commit()
+    identity_cache.invalidate(str(user_id))
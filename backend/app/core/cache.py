@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from app.core.config import CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS, DB_REPLICA_LAG_SECONDS
+
+
+class TTLCache:
+    """LRU cache with a per-entry TTL and single-flight loading.
+
+    Keys are tuples whose first element is the entity (table) name, so a
+    write to one table can drop every cached read derived from it. Loads
+    happen on the event loop; invalidate() is also safe to call from the
+    threadpool that runs sync admin handlers.
+
+    Entities invalidated within the last recent_window seconds are reported
+    by recently_invalidated(), so callers can avoid reloading them from a
+    lagging replica."""
+
+    def __init__(self, max_entries: int, ttl: float, recent_window: float = 0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.recent_window = recent_window
+        self._invalidated: dict = {}  # entity -> monotonic time, pruned after recent_window
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self._flights: dict = {}  # key -> asyncio.Future
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Hashable, ...]) -> Any:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    async def get_or_load(
+        self, key: tuple[Hashable, ...], loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, awaiting loader on a miss.
+        Concurrent misses for the same key share a single loader call."""
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if entry[0] > time.monotonic():
+                        self._entries.move_to_end(key)
+                        return entry[1]
+                    del self._entries[key]
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = asyncio.get_running_loop().create_future()
+                    self._flights[key] = flight
+
+            if leader:
+                return await self._lead(key, flight, loader)
+            try:
+                # Shield so a cancelled waiter does not cancel the shared load.
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                # The leader's request was cancelled, not ours: load it here.
+                if flight.cancelled() and not asyncio.current_task().cancelling():
+                    continue
+                raise
+
+    async def _lead(self, key, flight: asyncio.Future, loader) -> Any:
+        # The loader runs in the leader's task (it may use the leader's DB
+        # session), so the leader's cancellation cancels the flight and any
+        # waiters retry.
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            flight.exception()  # mark retrieved when nobody was waiting
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                # invalidate() drops the flights it races, so a flight no
+                # longer registered may predate the write: hand its value to
+                # the waiters but don't keep it.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                    if not flight.cancelled() and flight.exception() is None:
+                        self._store(key, flight.result())
+
+    def invalidate(self, entity: str) -> None:
+        """Drop every cached entry and in-flight load for an entity."""
+        with self._lock:
+            now = time.monotonic()
+            self._invalidated = {
+                e: at for e, at in self._invalidated.items() if at + self.recent_window > now
+            }
+            if self.recent_window > 0:
+                self._invalidated[entity] = now
+            for key in [k for k in self._entries if k[0] == entity]:
+                del self._entries[key]
+            for key in [k for k in self._flights if k[0] == entity]:
+                del self._flights[key]
+
+    def recently_invalidated(self, entity: str) -> bool:
+        with self._lock:
+            at = self._invalidated.get(entity)
+        return at is not None and at + self.recent_window > time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._flights.clear()
+            self._invalidated.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key, value) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+catalog_cache = TTLCache(
+    max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, recent_window=DB_REPLICA_LAG_SECONDS
+)
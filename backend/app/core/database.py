@@ -1,12 +1,153 @@
+import asyncio
+import itertools
+import threading
+import time
+
 from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import (
+    ASYNC_DATABASE_URL,
+    DATABASE_REPLICA_URLS,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_REPLICA_CONNECT_TIMEOUT,
+    DB_REPLICA_RETRY_SECONDS,
+)
+
+
+class CheckoutWaitStats:
+    """Running totals of how long callers waited for a pooled resource."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "count": self.count,
+                "total_seconds": round(self.total_seconds, 6),
+                "max_seconds": round(self.max_seconds, 6),
+            }
+
+
+class _TimedCheckout:
+    """Pool mixin that records checkout wait times."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = CheckoutWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.checkout_wait.observe(time.perf_counter() - start)
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep the running totals.
+        pool = super().recreate()
+        pool.checkout_wait = self.checkout_wait
+        return pool
 
-from app.core.config import DATABASE_URL
 
-engine = create_engine(DATABASE_URL)
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+_pool_options = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+
+engine = create_engine(DATABASE_URL, poolclass=TimedQueuePool, **_pool_options)
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+# Async routes run on the event loop instead of holding a threadpool token
+# for the whole round trip. Objects stay loaded after commit because async
+# sessions cannot lazy-load expired attributes.
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, poolclass=TimedAsyncQueuePool, **_pool_options
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+class ReplicaRouter:
+    """Round-robins reads across replica engines, skipping any replica that
+    recently failed to connect until retry_after seconds have passed."""
+
+    def __init__(self, engines: list, retry_after: float):
+        self.engines = list(engines)
+        self.retry_after = retry_after
+        self._down_until = [0.0] * len(self.engines)
+        self._turn = itertools.count()
+
+    def candidates(self):
+        """Healthy replicas, starting from the next one in rotation."""
+        if not self.engines:
+            return
+        start = next(self._turn)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self._down_until[index] <= time.monotonic():
+                yield self.engines[index]
+
+    def mark_down(self, engine) -> None:
+        index = self.engines.index(engine)
+        self._down_until[index] = time.monotonic() + self.retry_after
+
+    def status(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {"healthy": until <= now, **pool_status(engine.pool)}
+            for engine, until in zip(self.engines, self._down_until)
+        ]
+
+
+def _replica_url(url: str) -> str:
+    return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+replica_router = ReplicaRouter(
+    [
+        create_async_engine(
+            _replica_url(url), poolclass=TimedAsyncQueuePool, **_pool_options
+        )
+        for url in DATABASE_REPLICA_URLS
+    ],
+    retry_after=DB_REPLICA_RETRY_SECONDS,
+)
+
+ReadSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -16,3 +157,77 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    """Session for read-only routes. Uses a healthy replica when any are
+    configured and falls back to the primary otherwise. Routes that write,
+    or read back what they just wrote, must use get_async_db instead."""
+    for replica in replica_router.candidates():
+        db = ReadSessionLocal(bind=replica)
+        try:
+            # Check out the connection now so an unreachable replica is
+            # caught here rather than halfway through the handler.
+            await asyncio.wait_for(db.connection(), DB_REPLICA_CONNECT_TIMEOUT)
+        except (DBAPIError, OSError, asyncio.TimeoutError):
+            await db.close()
+            replica_router.mark_down(replica)
+            continue
+        async with db:
+            yield db
+        return
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def reads_from_replica(db) -> bool:
+    """Whether a session from get_async_read_db is bound to a replica."""
+    return db.bind in replica_router.engines
+
+
+def pool_status(pool) -> dict:
+    """Point-in-time pool usage plus cumulative checkout wait times."""
+    status = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+    }
+    if isinstance(pool, _TimedCheckout):
+        status["checkout_wait"] = pool.checkout_wait.snapshot()
+    return status
+
+
+def warm_pool(count: int) -> None:
+    """Open count connections up front so early requests skip connection setup."""
+    connections = []
+    try:
+        for _ in range(min(count, DB_POOL_SIZE)):
+            connections.append(engine.connect())
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+async def warm_async_pool(count: int) -> None:
+    async def open_connection():
+        conn = async_engine.connect()
+        await conn.start()
+        return conn
+
+    results = await asyncio.gather(
+        *(open_connection() for _ in range(min(count, DB_POOL_SIZE))),
+        return_exceptions=True,
+    )
+    opened = [r for r in results if not isinstance(r, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in opened))
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
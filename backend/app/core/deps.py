@@ -1,9 +1,17 @@
 from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache, catalog_cache
+from app.core.config import AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS
+from app.core.database import get_async_db
+from app.core.revocation import CATALOG_CHANNEL, IDENTITY_CHANNEL, RevocationListener
 from app.core.security import verify_access_token
+from app.models.user import User
 
 bearer_scheme = HTTPBearer()
 
@@ -12,25 +20,63 @@ bearer_scheme = HTTPBearer()
 class CurrentUser:
     id: str
     role: str
+    email: Optional[str] = None
 
 
-def get_current_user(
+# (user id, token version) -> CurrentUser, or None for a revoked token.
+# users.py revokes a user's entries in every worker whenever it changes or
+# deletes them (app.core.revocation).
+identity_cache = TTLCache(max_entries=AUTH_CACHE_MAX_ENTRIES, ttl=AUTH_CACHE_TTL_SECONDS)
+# Applies other workers' identity revocations and catalog writes here.
+revocations = RevocationListener(
+    {IDENTITY_CHANNEL: identity_cache, CATALOG_CHANNEL: catalog_cache}
+)
+
+
+async def _load_identity(
+    user_id: UUID, token_version: int, db: AsyncSession
+) -> Optional[CurrentUser]:
+    user = await db.get(User, user_id)
+    if user is None or user.token_version != token_version:
+        return None
+    return CurrentUser(id=str(user.id), role=user.role.value, email=user.email)
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_async_db),
 ) -> CurrentUser:
     """FastAPI dependency that extracts and validates a Bearer token.
-    Returns a CurrentUser with id and role on success.
-    Raises 401 if the token is missing, invalid, or expired."""
+    Returns a CurrentUser with id, role and email on success.
+    Raises 401 if the token is missing, invalid, expired, or revoked.
+
+    The user row is only read on an identity cache miss (or while this
+    worker is not receiving revocations); the session does not check out a
+    connection until then."""
+    unauthorized = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
     payload = verify_access_token(credentials.credentials)
     if payload is None or "sub" not in payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
+        raise unauthorized
+    try:
+        user_id = UUID(payload["sub"])
+    except (TypeError, ValueError):
+        raise unauthorized
+    token_version = payload.get("ver", 0)
+
+    if revocations.trusted():
+        user = await identity_cache.get_or_load(
+            (str(user_id), token_version),
+            lambda: _load_identity(user_id, token_version, db),
         )
-    return CurrentUser(
-        id=payload["sub"],
-        role=payload.get("role", "admin"),
-    )
+    else:
+        user = await _load_identity(user_id, token_version, db)
+    if user is None:
+        raise unauthorized
+    return user
 
 
 def require_role(*roles: str):
@@ -0,0 +1,32 @@
+import hashlib
+
+from fastapi import Request, Response, status
+
+# Clients may reuse a cached catalog response but must revalidate it first.
+REVALIDATE = "no-cache"
+
+
+def compute_etag(*parts) -> str:
+    """Build a strong ETag from the string form of each part."""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match header covers etag.
+    If-None-Match uses weak comparison, so a W/ prefix is ignored."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str, cache_control: str = REVALIDATE) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
@@ -0,0 +1,85 @@
+"""Readiness checks behind /health/ready.
+
+A worker is ready when it can serve a request now: the primary database
+answers within HEALTH_DB_TIMEOUT and is at the migration head, the
+connection pools have a free slot, and the threadpool that runs sync
+routes is not saturated. Liveness (/health/live) only says the event loop
+is turning; failing it gets the process restarted, so it checks nothing
+a restart would not fix."""
+
+import asyncio
+import logging
+from typing import Optional
+
+import anyio.to_thread
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app.core.cache import TTLCache
+from app.core.config import HEALTH_CACHE_SECONDS, HEALTH_DB_TIMEOUT
+from app.core.database import async_engine, engine
+from app.core.migrations import current_revision, head_revision
+
+logger = logging.getLogger(__name__)
+
+health_cache = TTLCache(max_entries=1, ttl=HEALTH_CACHE_SECONDS)
+
+
+def pool_headroom(pool) -> Optional[str]:
+    """A failure message when every connection the pool may open is in use."""
+    if not isinstance(pool, QueuePool) or pool._max_overflow < 0:
+        return None  # unbounded
+    limit = pool.size() + pool._max_overflow
+    if pool.checkedout() >= limit:
+        return f"all {limit} connections checked out"
+    return None
+
+
+def threadpool_headroom() -> Optional[str]:
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if limiter.borrowed_tokens >= limiter.total_tokens:
+        return f"all {limiter.total_tokens:g} threads busy"
+    return None
+
+
+async def _database() -> tuple[Optional[str], Optional[str]]:
+    """(database failure, migrations failure) from one short round trip."""
+    try:
+        async with asyncio.timeout(HEALTH_DB_TIMEOUT):
+            async with async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                current = await conn.run_sync(current_revision)
+    except TimeoutError:
+        return f"no answer within {HEALTH_DB_TIMEOUT:g}s", "unknown"
+    except Exception:
+        # The error names hosts and users; /health/ready is public, the log is not.
+        logger.exception("Readiness check could not query the database")
+        return "unavailable", "unknown"
+    expected = head_revision()
+    if current != expected:
+        return None, f"at {current or 'no revision'}, expected {expected}"
+    return None, None
+
+
+async def _check() -> dict:
+    database, migrations = await _database()
+    pools = {"sync": engine.pool, "async": async_engine.pool}
+    exhausted = [
+        f"{name}: {failure}" for name, pool in pools.items() if (failure := pool_headroom(pool))
+    ]
+    failures = {
+        "database": database,
+        "migrations": migrations,
+        "db_pool": "; ".join(exhausted) or None,
+        "threadpool": threadpool_headroom(),
+    }
+    return {
+        "status": "ok" if not any(failures.values()) else "unavailable",
+        "checks": {name: failure or "ok" for name, failure in failures.items()},
+    }
+
+
+async def readiness() -> dict:
+    """The latest check result, at most HEALTH_CACHE_SECONDS old. Probes
+    arriving together share one check."""
+    return await health_cache.get_or_load(("health",), _check)
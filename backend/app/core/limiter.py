@@ -1,4 +1,134 @@
+import asyncio
+import functools
+from ipaddress import ip_address, ip_network
+from typing import Callable, Optional
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-limiter = Limiter(key_func=get_remote_address)
+import app.core.rate_limit_storage  # noqa: F401  registers the sql+ storage schemes
+from app.core.config import (
+    RATE_LIMIT_BUDGET,
+    RATE_LIMIT_EVICT_INTERVAL,
+    RATE_LIMIT_POOL_SIZE,
+    RATE_LIMIT_STORAGE_URI,
+    TRUSTED_PROXIES,
+)
+from app.core.security import verify_access_token
+
+_trusted_networks = [ip_network(proxy, strict=False) for proxy in TRUSTED_PROXIES]
+
+# Budget spent per request on routes that share RATE_LIMIT_BUDGET. Cached
+# public reads are not metered at all, so they never touch the limiter store.
+COST_PASSWORD = 10  # a bcrypt hash or verify
+COST_UPLOAD = 5
+COST_WRITE = 2
+
+
+def _is_trusted(address: str) -> bool:
+    try:
+        ip = ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _trusted_networks)
+
+
+def client_address(request: Request) -> str:
+    """The client's IP address as seen by the first trusted proxy.
+
+    Forwarding headers are only believed when the direct peer is a trusted
+    proxy. X-Forwarded-For is read right to left, skipping trusted hops, so
+    a client can't pick its own key by sending the header itself."""
+    peer = get_remote_address(request)
+    if not _is_trusted(peer):
+        return peer
+
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not _is_trusted(hop):
+                return hop
+        if hops:
+            return hops[0]
+
+    real_ip = request.headers.get("x-real-ip", "").strip()
+    return real_ip or peer
+
+
+def address_key(request: Request) -> str:
+    """Limit per client address whatever the request carries. Routes that
+    don't require a signed-in user pass this as key_func, since anyone can
+    register for a fresh token and with it a fresh bucket."""
+    return f"ip:{client_address(request)}"
+
+
+def rate_limit_key(request: Request) -> str:
+    """Authenticated requests are limited per user, everything else per client
+    address, so users behind one NAT don't share a bucket once signed in."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        payload = verify_access_token(token)
+        if payload and payload.get("sub"):
+            return f"user:{payload['sub']}"
+    return address_key(request)
+
+
+class ThreadedLimiter(Limiter):
+    """Limiter whose checks for async routes run in the threadpool.
+
+    slowapi calls the storage synchronously from its async wrapper, and the
+    SQL storage is a blocking database round trip per limit, so on the
+    event loop every check would stall the whole worker. This checks first
+    on a thread and marks the request done, so slowapi's own wrapper skips
+    its check and only adds the headers. Sync routes already run on a
+    thread and are left to slowapi."""
+
+    def limit(self, *args, **kwargs):
+        return self._off_loop(super().limit(*args, **kwargs))
+
+    def shared_limit(self, *args, **kwargs):
+        return self._off_loop(super().shared_limit(*args, **kwargs))
+
+    def _off_loop(self, decorator):
+        def decorate(func):
+            wrapped = decorator(func)
+            if not asyncio.iscoroutinefunction(func):
+                return wrapped
+
+            @functools.wraps(wrapped)
+            async def checked(*args, **kwargs):
+                request = kwargs.get("request")
+                if (
+                    self.enabled
+                    and isinstance(request, Request)
+                    and not getattr(request.state, "_rate_limiting_complete", False)
+                ):
+                    await run_in_threadpool(self._check_request_limit, request, func, False)
+                    request.state._rate_limiting_complete = True
+                return await wrapped(*args, **kwargs)
+
+            return checked
+
+        return decorate
+
+
+limiter = ThreadedLimiter(
+    key_func=rate_limit_key,
+    strategy="sliding-window-counter",
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    storage_options=(
+        {"evict_interval": RATE_LIMIT_EVICT_INTERVAL, "pool_size": RATE_LIMIT_POOL_SIZE}
+        if RATE_LIMIT_STORAGE_URI.startswith("sql+")
+        else {}
+    ),
+    # If the shared store is unreachable, limit per process rather than fail requests
+    in_memory_fallback_enabled=True,
+)
+
+
+def budget(cost: int, key_func: Optional[Callable[[Request], str]] = None):
+    """Charge cost against the client's shared RATE_LIMIT_BUDGET."""
+    return limiter.shared_limit(RATE_LIMIT_BUDGET, scope="budget", cost=cost, key_func=key_func)
@@ -0,0 +1,54 @@
+"""Schema version checks against the alembic migration scripts.
+
+Migrations run once per deploy (python -m app.scripts.init_db), never from
+a web worker. Workers only confirm the database is at the revision their
+code expects. Alembic is imported on first use, keeping it off the import
+path of app.main."""
+
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy.engine import Connection
+
+from app.core.database import engine
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def alembic_config() -> "Config":
+    """The project's alembic.ini, independent of the working directory."""
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    return config
+
+
+@lru_cache(maxsize=1)
+def head_revision() -> Optional[str]:
+    """The newest migration script; fixed for the life of the process."""
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(conn: Connection) -> Optional[str]:
+    from alembic.runtime.migration import MigrationContext
+
+    return MigrationContext.configure(conn).get_current_revision()
+
+
+def check_schema() -> None:
+    """Raise unless the database has every migration this code expects."""
+    expected = head_revision()
+    with engine.connect() as conn:
+        current = current_revision(conn)
+    if current != expected:
+        raise RuntimeError(
+            f"Database schema is at {current or 'no revision'}, expected {expected}. "
+            "Run `python -m app.scripts.init_db` before starting the app."
+        )
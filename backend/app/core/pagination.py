@@ -0,0 +1,89 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query as ORMQuery, aliased
+
+MAX_PAGE_SIZE = 200
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def encode_cursor(created_at: datetime, id_: UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(id_)]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id_ = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(id_)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+class PageParams:
+    """Query parameters shared by every keyset-paginated list endpoint."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        include_total: bool = False,
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.include_total = include_total
+
+
+def keyset_page(query: ORMQuery, model, page: PageParams, response: Response) -> list:
+    """Return one page of query ordered by (created_at, id) descending.
+
+    The cursor for the following page is sent in X-Next-Cursor. With
+    include_total the count of every row matching the query's filters is
+    sent in X-Total-Count; it is computed by a window function in the same
+    statement instead of a separate count() round trip. An empty page
+    reached through a cursor has no rows to carry it, so it omits the header
+    (the earlier pages already reported the total). Without a limit
+    the rest of the result set is returned, as before pagination existed."""
+    if page.include_total:
+        subq = query.add_columns(func.count().over().label("total_count")).subquery()
+        entity = aliased(model, subq)
+        page_query = query.session.query(entity, subq.c.total_count)
+    else:
+        entity = model
+        page_query = query
+
+    if page.cursor:
+        created_at, id_ = decode_cursor(page.cursor)
+        page_query = page_query.filter(
+            tuple_(entity.created_at, entity.id) < tuple_(created_at, id_)
+        )
+    page_query = page_query.order_by(None).order_by(
+        entity.created_at.desc(), entity.id.desc()
+    )
+    if page.limit is not None:
+        page_query = page_query.limit(page.limit + 1)
+    rows = page_query.all()
+
+    if page.include_total:
+        if rows:
+            response.headers[TOTAL_COUNT_HEADER] = str(rows[0][1])
+        elif not page.cursor:
+            response.headers[TOTAL_COUNT_HEADER] = "0"
+        rows = [row[0] for row in rows]
+
+    if page.limit is not None and len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return rows
@@ -0,0 +1,200 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+from sqlalchemy import case, create_engine, delete, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.rate_limit import RateLimitCounter
+
+counters = RateLimitCounter.__table__
+
+
+class SQLStorage(Storage, SlidingWindowCounterSupport):
+    """limits storage backed by the rate_limits table, so every worker and
+    replica shares the same counters.
+
+    sql+postgresql://... uses the application database (migration 007).
+    sql+sqlite:////path/to/file.db is a shared-file backend for several
+    workers on one host; the table is created on first use.
+
+    Each key is a single row holding the current and previous window
+    counts, and every hit is one atomic upsert. A daemon thread deletes
+    expired rows every evict_interval seconds."""
+
+    STORAGE_SCHEME = ["sql+postgresql", "sql+postgresql+psycopg2", "sql+sqlite"]
+
+    def __init__(
+        self,
+        uri: str,
+        wrap_exceptions: bool = False,
+        evict_interval: float = 60,
+        pool_size: int = 4,
+        **options,
+    ):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+        url = uri.split("+", 1)[1]
+        self.dialect = urlparse(url).scheme.split("+")[0]
+        if self.dialect == "sqlite":
+            self.engine = create_engine(url, connect_args={"check_same_thread": False})
+            counters.create(self.engine, checkfirst=True)
+        else:
+            # Checks hold a request's thread, so never wait long for a
+            # connection. The pool is part of the worker's connection budget.
+            self.engine = create_engine(
+                url, pool_size=pool_size, max_overflow=0, pool_timeout=2, pool_pre_ping=True
+            )
+        self.evict_interval = evict_interval
+        self._evictor = None
+        self._evictor_lock = threading.Lock()
+
+    @property
+    def base_exceptions(self):
+        return SQLAlchemyError
+
+    # ── Eviction ──
+
+    def _start_evictor(self) -> None:
+        if self._evictor is not None:
+            return
+        with self._evictor_lock:
+            if self._evictor is None:
+                self._evictor = threading.Thread(
+                    target=self._evict_loop, name="rate-limit-evictor", daemon=True
+                )
+                self._evictor.start()
+
+    def _evict_loop(self) -> None:
+        while True:
+            time.sleep(self.evict_interval)
+            try:
+                self.evict_expired()
+            except SQLAlchemyError:
+                pass  # try again next interval
+
+    def evict_expired(self) -> int:
+        with self.engine.begin() as conn:
+            result = conn.execute(delete(counters).where(counters.c.expires_at <= time.time()))
+        return result.rowcount
+
+    # ── Fixed window ──
+
+    def _insert(self):
+        return (postgresql if self.dialect == "postgresql" else sqlite).insert(counters)
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        self._start_evictor()
+        now = time.time()
+        expired = counters.c.expires_at <= now
+        stmt = self._insert().values(
+            key=key, window=0, current=amount, previous=0, expires_at=now + expiry
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[counters.c.key],
+            set_={
+                "current": case((expired, 0), else_=counters.c.current) + amount,
+                "expires_at": case((expired, now + expiry), else_=counters.c.expires_at),
+            },
+        ).returning(counters.c.current)
+        with self.engine.begin() as conn:
+            return conn.execute(stmt).scalar_one()
+
+    def get(self, key: str) -> int:
+        with self.engine.connect() as conn:
+            current = conn.execute(
+                select(counters.c.current).where(
+                    counters.c.key == key, counters.c.expires_at > time.time()
+                )
+            ).scalar()
+        return current or 0
+
+    def get_expiry(self, key: str) -> float:
+        with self.engine.connect() as conn:
+            expires_at = conn.execute(
+                select(counters.c.expires_at).where(counters.c.key == key)
+            ).scalar()
+        return expires_at or time.time()
+
+    # ── Sliding window counter ──
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+        self._start_evictor()
+        now = time.time()
+        window = int(now // expiry)
+        # Share of the previous window still inside the sliding window
+        weight = 1 - (now / expiry) % 1
+
+        row = counters.c
+        previous = case(
+            (row.window == window, row.previous),
+            (row.window == window - 1, row.current),
+            else_=0,
+        )
+        current = case((row.window == window, row.current), else_=0)
+        # The previous window has fully slid out by the end of the next one
+        expires_at = (window + 2) * expiry
+
+        stmt = self._insert().values(
+            key=key, window=window, current=amount, previous=0, expires_at=expires_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[row.key],
+            set_={
+                "previous": previous,
+                "current": current + amount,
+                "window": window,
+                "expires_at": expires_at,
+            },
+            # floor(weighted) + amount <= limit, without floor() for SQLite
+            where=previous * weight + current < limit - amount + 1,
+        ).returning(row.current)
+        with self.engine.begin() as conn:
+            return conn.execute(stmt).first() is not None
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        now = time.time()
+        window = int(now // expiry)
+        with self.engine.connect() as conn:
+            stored = conn.execute(
+                select(counters.c.window, counters.c.current, counters.c.previous).where(
+                    counters.c.key == key
+                )
+            ).first()
+
+        previous_count = current_count = 0
+        if stored is not None:
+            if stored.window == window:
+                previous_count, current_count = stored.previous, stored.current
+            elif stored.window == window - 1:
+                previous_count = stored.current
+
+        previous_ttl = (1 - (now / expiry) % 1) * expiry if previous_count else 0.0
+        current_ttl = (1 - (now / expiry) % 1) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        self.clear(key)
+
+    # ── Housekeeping ──
+
+    def clear(self, key: str) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(delete(counters).where(counters.c.key == key))
+
+    def reset(self) -> int:
+        with self.engine.begin() as conn:
+            return conn.execute(delete(counters)).rowcount
+
+    def check(self) -> bool:
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return True
+        except SQLAlchemyError:
+            return False
@@ -0,0 +1,21 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+_any_adapter = TypeAdapter(Any)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes with pydantic-core straight to bytes.
+    Content that is already encoded JSON bytes is sent unchanged."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return _any_adapter.dump_json(content)
+
+
+def json_object(**members: bytes) -> bytes:
+    """Join already-encoded JSON values into a JSON object without decoding them."""
+    return b"{" + b",".join(b'"%s":%s' % (k.encode(), v) for k, v in members.items()) + b"}"
@@ -0,0 +1,97 @@
+"""Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+Each web worker keeps its own identity cache (app.core.deps) and catalog
+cache (app.core.cache). When a user's role, email or existence changes, or
+an admin edits a catalog table, the writing transaction queues a NOTIFY on
+that cache's channel with the key to drop; Postgres delivers it on commit
+to a listener connection in every worker, which invalidates the key there.
+While a worker's listener is disconnected its caches cannot be trusted, so
+reads go to the database until it reconnects."""
+
+import asyncio
+import contextlib
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import ASYNC_DATABASE_URL
+
+IDENTITY_CHANNEL = "identity_revoked"  # payload: user id
+CATALOG_CHANNEL = "catalog_invalidated"  # payload: table name
+RECONNECT_DELAY = 1  # seconds
+PING_INTERVAL = 30  # seconds; notices a silently dropped connection
+
+
+def notify_revoked(db: Session, key: str, channel: str = IDENTITY_CHANNEL) -> None:
+    """Tell every worker, once db's transaction commits, to invalidate key in
+    the cache listening on channel. A no-op off Postgres."""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_notify(channel, key)))
+
+
+class RevocationListener:
+    """Applies invalidations from other workers to this worker's caches,
+    one channel per cache, over a single connection."""
+
+    def __init__(self, caches: dict[str, TTLCache], url: str = ASYNC_DATABASE_URL):
+        self.caches = caches
+        self.url = make_url(url)
+        self.connected = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.url.get_backend_name() == "postgresql"
+
+    def trusted(self) -> bool:
+        """Whether the caches can be used. Without Postgres there is nothing
+        to listen to and a single process is assumed."""
+        return self.connected or not self.enabled
+
+    async def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.caches[channel].invalidate(payload)
+
+    async def _run(self) -> None:
+        import asyncpg
+
+        dsn = self.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        while True:
+            try:
+                conn = await asyncpg.connect(dsn, timeout=RECONNECT_DELAY * 5)
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError):
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+            lost = asyncio.Event()
+            conn.add_termination_listener(lambda _: lost.set())
+            try:
+                for channel in self.caches:
+                    await conn.add_listener(channel, self._on_notify)
+                # Invalidations sent while we were not listening are gone.
+                for cache in self.caches.values():
+                    cache.clear()
+                self.connected = True
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), PING_INTERVAL)
+                    except asyncio.TimeoutError:
+                        await conn.fetchval("SELECT 1", timeout=PING_INTERVAL)
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                pass
+            finally:
+                self.connected = False
+                conn.terminate()
+            await asyncio.sleep(RECONNECT_DELAY)
@@ -1,9 +1,26 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import jwt
-from bcrypt import checkpw
+from bcrypt import checkpw, gensalt, hashpw
+from fastapi import HTTPException, status
 
-from app.core.config import JWT_SECRET, JWT_EXPIRES_IN
+from app.core.config import (
+    BCRYPT_ROUNDS,
+    JWT_EXPIRES_IN,
+    JWT_SECRET,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_WORKERS,
+)
+from app.core.database import CheckoutWaitStats
+
+
+def hash_password(password: str) -> str:
+    return hashpw(password.encode("utf-8"), gensalt(BCRYPT_ROUNDS)).decode("utf-8")
 
 
 def verify_password(plain_password: str, password_hash: str) -> bool:
@@ -12,11 +29,103 @@ def verify_password(plain_password: str, password_hash: str) -> bool:
     )
 
 
-def create_access_token(user_id: str, role: str = "admin") -> str:
+def password_needs_rehash(password_hash: str) -> bool:
+    """True when a hash was made with a cost other than BCRYPT_ROUNDS.
+    bcrypt hashes look like $2b$12$<salt+hash>, with the cost second."""
+    try:
+        return int(password_hash.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+def verify_and_update(plain_password: str, password_hash: str) -> tuple[bool, Optional[str]]:
+    """Verify a password and, if it matches a hash with an outdated cost,
+    return a fresh hash to store. Both happen in one executor call."""
+    if not verify_password(plain_password, password_hash):
+        return False, None
+    if password_needs_rehash(password_hash):
+        return True, hash_password(plain_password)
+    return True, None
+
+
+class PasswordExecutor:
+    """Bounded executor for bcrypt calls.
+
+    Keeps password hashing off the event loop and out of the shared anyio
+    threadpool, so a login burst can't starve other routes. Once every
+    worker is busy and max_pending calls are queued, further calls fail
+    fast with 503 rather than queueing behind a credential-stuffing wave."""
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_wait = CheckoutWaitStats()
+        self.rejected = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+
+    def _submit(self, func, *args):
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many sign-in attempts in progress, please retry",
+                    headers={"Retry-After": "1"},
+                )
+            self._in_flight += 1
+
+        submitted = time.perf_counter()
+
+        def call():
+            self.queue_wait.observe(time.perf_counter() - submitted)
+            return func(*args)
+
+        future = self._executor.submit(call)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, func, *args):
+        """Await func(*args) on the executor from async code."""
+        return await asyncio.wrap_future(self._submit(func, *args))
+
+    def call(self, func, *args):
+        """Run func(*args) on the executor from a sync route and wait for it."""
+        return self._submit(func, *args).result()
+
+    def status(self) -> dict:
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": in_flight,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.snapshot(),
+        }
+
+
+password_executor = PasswordExecutor(
+    workers=PASSWORD_HASH_WORKERS, max_pending=PASSWORD_HASH_MAX_PENDING
+)
+
+
+def create_access_token(
+    user_id: str, role: str = "admin", email: str = None, token_version: int = 0
+) -> str:
+    """Sign a token for a user. token_version must match users.token_version
+    for the token to be accepted, so bumping it revokes outstanding tokens."""
     now = datetime.now(timezone.utc)
     payload = {
         "sub": user_id,
         "role": role,
+        "email": email,
+        "ver": token_version,
         "iat": now,
         "exp": now + timedelta(minutes=JWT_EXPIRES_IN),
     }
@@ -0,0 +1,138 @@
+import os
+import re
+from typing import Optional
+from urllib.parse import quote
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+# Upload names are never reused for different bytes, so caches may keep them
+# for a year without revalidating.
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# ab/<sha256>.png or ab/<sha256>-640.avif (see app.services.uploads / images)
+CONTENT_NAME = re.compile(r"^[0-9a-f]{2}/(?P<tag>[0-9a-f]{64}(?:-\d+)?)\.[a-z0-9]+$")
+
+SINGLE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def byte_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """The inclusive (start, end) asked for by a single-range Range header.
+
+    None means serve the whole file: the header is malformed or asks for
+    several ranges, which RFC 9110 lets a server ignore. A range that starts
+    past the end of the file raises 416."""
+    match = SINGLE_RANGE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    else:  # bytes=-N, the last N bytes
+        start, end = max(size - int(last), 0), size - 1
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=416, headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+
+class FileRangeResponse(Response):
+    """206 response streaming bytes start..end (inclusive) of a file."""
+
+    chunk_size = 64 * 1024
+
+    def __init__(self, path: str, start: int, end: int, headers: dict):
+        self.path, self.start, self.end = path, start, end
+        self.status_code = 206
+        self.background = None
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {"type": "http.response.start", "status": 206, "headers": self.raw_headers}
+        )
+        remaining = 0 if scope["method"] == "HEAD" else self.end - self.start + 1
+        if remaining:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await file.seek(self.start)
+                while remaining:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": remaining > 0}
+                    )
+        if remaining or scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class UploadFiles(StaticFiles):
+    """StaticFiles for UPLOAD_DIR.
+
+    Every response is cacheable as immutable, and content-addressed names
+    use their hash as the ETag. Single byte ranges are honoured. With
+    accel_prefix set, the response carries no body, only an X-Accel-Redirect
+    to accel_prefix + name, and nginx sends the file itself (sendfile, ranges
+    and all) from an internal location aliased to the same directory.
+    Dot-prefixed paths (partial uploads in .incoming) are never served."""
+
+    def __init__(self, *, accel_prefix: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.accel_prefix = accel_prefix
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if any(part.startswith(".") for part in path.split(os.sep)):
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        name = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        response.headers["Cache-Control"] = IMMUTABLE
+        if match := CONTENT_NAME.match(name):
+            response.headers["ETag"] = f'"{match["tag"]}"'
+
+        request_headers = Headers(scope=scope)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+
+        if self.accel_prefix:
+            headers = {
+                key: response.headers[key]
+                for key in ("content-type", "cache-control", "etag", "last-modified")
+            }
+            headers["X-Accel-Redirect"] = self.accel_prefix + quote(name)
+            return Response(status_code=status_code, headers=headers)
+
+        response.headers["Accept-Ranges"] = "bytes"
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if (
+            range_header is None
+            or status_code != 200
+            or if_range not in (None, response.headers["etag"], response.headers["last-modified"])
+        ):
+            return response
+        requested = byte_range(range_header, stat_result.st_size)
+        if requested is None:
+            return response
+        start, end = requested
+        headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+        headers["Content-Range"] = f"bytes {start}-{end}/{stat_result.st_size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return FileRangeResponse(full_path, start, end, headers)
@@ -1,29 +1,57 @@
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
 
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy.orm import Session
 
 from app.api import public, auth, admin, client as client_api, users
-from app.core.config import CORS_ORIGINS, UPLOAD_DIR
+from app.core.config import CORS_ORIGINS, DB_POOL_WARM, UPLOAD_DIR, UPLOADS_ACCEL_REDIRECT
+from app.core.database import (
+    async_engine,
+    engine,
+    get_db,
+    pool_status,
+    replica_router,
+    warm_async_pool,
+    warm_pool,
+)
+from app.core.deps import revocations
+from app.core.health import readiness
 from app.core.limiter import limiter
-from app.scripts.init_db import init_db
+from app.core.migrations import check_schema
+from app.core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from app.core.responses import FastJSONResponse
+from app.core.security import password_executor
+from app.core.static import UploadFiles
+from app.services.jobs import queue_status
 
 
 @asynccontextmanager
 async def lifespan(app):
-    init_db()
+    # Migrations and seeding run before deploy (app.scripts.init_db)
+    check_schema()
     os.makedirs(UPLOAD_DIR, exist_ok=True)
+    warm_pool(DB_POOL_WARM)
+    await warm_async_pool(DB_POOL_WARM)
+    await revocations.start()
     yield
+    await revocations.stop()
+    await async_engine.dispose()
+    for replica in replica_router.engines:
+        await replica.dispose()
 
 
-app = FastAPI(title="Consulting Platform API", lifespan=lifespan)
+app = FastAPI(
+    title="Consulting Platform API",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
@@ -46,6 +74,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
 )
 
 app.include_router(public.router, prefix="/api/public", tags=["public"])
@@ -59,9 +88,43 @@ try:
     os.makedirs(UPLOAD_DIR, exist_ok=True)
 except OSError:
     pass
-app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR, check_dir=False), name="uploads")
+app.mount(
+    "/uploads",
+    UploadFiles(
+        directory=UPLOAD_DIR, check_dir=False, accel_prefix=UPLOADS_ACCEL_REDIRECT or None
+    ),
+    name="uploads",
+)
 
 
 @app.get("/health")
-def health_check():
+@app.get("/health/live")
+async def health_check():
+    """Liveness: the process is up and serving requests."""
     return {"status": "ok"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness: 503 while this worker cannot serve traffic (see
+    app.core.health), so load balancers route around it."""
+    result = await readiness()
+    ok = result["status"] == "ok"
+    return FastJSONResponse(
+        result, status_code=status.HTTP_200_OK if ok else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+
+
+@app.get("/metrics")
+def metrics(db: Session = Depends(get_db)):
+    """Connection pool, password executor and job queue telemetry. Served
+    outside /api, so nginx does not expose it."""
+    return {
+        "db_pool": {
+            "sync": pool_status(engine.pool),
+            "async": pool_status(async_engine.pool),
+            "replicas": replica_router.status(),
+        },
+        "password_hashing": password_executor.status(),
+        "jobs": queue_status(db),
+    }
@@ -5,6 +5,9 @@ from app.models.case_study import CaseStudy
 from app.models.service import Service
 from app.models.testimonial import Testimonial
 from app.models.site_content import SiteContent
+from app.models.rate_limit import RateLimitCounter
+from app.models.upload import Upload, UploadReference
+from app.models.job import Job
 
 __all__ = [
     "User",
@@ -17,4 +20,8 @@ __all__ = [
     "Service",
     "Testimonial",
     "SiteContent",
+    "RateLimitCounter",
+    "Upload",
+    "UploadReference",
+    "Job",
 ]
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSON, UUID
 
 from app.core.database import Base
@@ -39,3 +39,8 @@ class CaseStudy(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    # Public lists only read active rows, so index just those.
+    __table_args__ = (
+        Index("ix_case_studies_active_order", display_order, created_at.desc(), postgresql_where=is_active),
+    )
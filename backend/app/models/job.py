@@ -0,0 +1,34 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSON
+
+from app.core.database import Base
+
+
+class Job(Base):
+    """Background work for python -m app.worker (see app.services.jobs).
+
+    A job is deleted once it succeeds. Until then it is ready when run_at
+    has passed and nobody holds its lease; failed_at marks one that ran out
+    of attempts and is kept for inspection."""
+
+    __tablename__ = "jobs"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    kind = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    priority = Column(Integer, nullable=False, default=0)  # higher runs first
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    locked_by = Column(String, nullable=True)
+    last_error = Column(Text, nullable=True)
+    failed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    # The dequeue scan, over live jobs only
+    __table_args__ = (
+        Index("ix_jobs_ready", priority.desc(), run_at, id, postgresql_where=failed_at.is_(None)),
+    )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -22,3 +22,7 @@ class Note(Base):
     )
 
     requirement = relationship("Requirement", back_populates="notes")
+
+    __table_args__ = (
+        Index("ix_notes_requirement_id_created_at", requirement_id, created_at, id),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Column, Float, Integer, String
+
+from app.core.database import Base
+
+
+class RateLimitCounter(Base):
+    """One row per rate limit key, shared by every worker.
+
+    Holds the counts for the current and previous window only, so each key
+    takes fixed space however many hits it sees."""
+
+    __tablename__ = "rate_limits"
+
+    key = Column(String, primary_key=True)
+    window = Column(BigInteger, nullable=False)  # time.time() // expiry
+    current = Column(Integer, nullable=False, default=0)
+    previous = Column(Integer, nullable=False, default=0)
+    expires_at = Column(Float, nullable=False, index=True)  # unix seconds
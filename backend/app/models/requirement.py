@@ -1,7 +1,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -51,3 +51,9 @@ class Requirement(Base):
     )
 
     notes = relationship("Note", back_populates="requirement")
+
+    __table_args__ = (
+        Index("ix_requirements_email_created_at", email, created_at.desc()),
+        Index("ix_requirements_created_at_id", created_at, id),
+        Index("ix_requirements_status_created_at_id", status, created_at, id),
+    )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSON, UUID
 
 from app.core.database import Base
@@ -26,3 +26,7 @@ class Service(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    __table_args__ = (
+        Index("ix_services_active_order", display_order, created_at.desc(), postgresql_where=is_active),
+    )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -27,3 +27,7 @@ class Testimonial(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    __table_args__ = (
+        Index("ix_testimonials_active_created_at", created_at.desc(), postgresql_where=is_active),
+    )
@@ -0,0 +1,47 @@
+import uuid
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSON, UUID
+
+from app.core.database import Base
+
+
+class Upload(Base):
+    """One row per stored file. Files are named after the SHA-256 of their
+    bytes, so uploading the same image again returns the existing row."""
+
+    __tablename__ = "uploads"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name = Column(String, unique=True, nullable=False)  # path under UPLOAD_DIR
+    sha256 = Column(String(64), nullable=False, index=True)
+    size = Column(BigInteger, nullable=False)
+    filename = Column(String, nullable=False)  # as first uploaded
+    # Filled in by the derivative pipeline (app.services.derivatives)
+    width = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+    placeholder = Column(Text, nullable=True)  # data: URI
+    variants = Column(JSON, nullable=True)  # [{"name": "", "width": 640, "format": "avif"}]
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class UploadReference(Base):
+    """Links an upload to each row whose JSON (CaseStudy.gallery,
+    SiteContent.metadata) points at it."""
+
+    __tablename__ = "upload_references"
+
+    upload_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("uploads.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    owner_table = Column(String, primary_key=True)
+    owner_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_upload_references_owner", owner_table, owner_id),
+    )
@@ -1,7 +1,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, String, func
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -21,8 +21,12 @@ class User(Base):
     password_hash = Column(String, nullable=True)
     role = Column(Enum(UserRole), nullable=False, default=UserRole.client)
     invite_token = Column(String, unique=True, nullable=True, index=True)
+    # Bumped on role/email changes to revoke tokens issued before the change
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
     )
+
+    __table_args__ = (Index("ix_users_created_at_id", created_at, id),)
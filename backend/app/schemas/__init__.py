@@ -5,10 +5,11 @@ from app.schemas.requirement import (
     ProgressUpdate,
 )
 from app.schemas.note import NoteCreate
-from app.schemas.case_study import CaseStudyResponse
+from app.schemas.case_study import CaseStudyResponse, CaseStudySummary
 from app.schemas.service import ServiceResponse
 from app.schemas.testimonial import TestimonialResponse
 from app.schemas.site_content import SiteContentResponse
+from app.schemas.bundle import PageBundleResponse
 
 __all__ = [
     "RequirementCreate",
@@ -17,7 +18,9 @@ __all__ = [
     "ProgressUpdate",
     "NoteCreate",
     "CaseStudyResponse",
+    "CaseStudySummary",
     "ServiceResponse",
     "TestimonialResponse",
     "SiteContentResponse",
+    "PageBundleResponse",
 ]
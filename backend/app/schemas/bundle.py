@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from app.schemas.case_study import CaseStudySummary
+from app.schemas.site_content import SiteContentResponse
+from app.schemas.testimonial import TestimonialResponse
+
+
+class PageBundleResponse(BaseModel):
+    case_studies: list[CaseStudySummary] = []
+    testimonials: list[TestimonialResponse] = []
+    site_content: list[SiteContentResponse] = []
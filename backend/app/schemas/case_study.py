@@ -26,6 +26,75 @@ class GalleryItem(BaseModel):
     type: str
 
 
+class ImageSource(BaseModel):
+    type: str  # MIME type, e.g. image/avif
+    srcset: str  # "/uploads/ab/ab...-640.avif 640w, ..."
+
+
+class GalleryImage(GalleryItem):
+    """Public gallery entry. Processed uploads add their intrinsic size, a
+    blur placeholder and one source per derivative format, best first."""
+
+    width: Optional[int] = None
+    height: Optional[int] = None
+    placeholder: Optional[str] = None
+    sources: list[ImageSource] = []
+
+    @classmethod
+    def from_entry(cls, entry: dict, upload=None):
+        item = cls(**entry)
+        if upload is None or upload.processed_at is None:
+            return item
+        item.width, item.height, item.placeholder = upload.width, upload.height, upload.placeholder
+        srcsets: dict[str, list[str]] = {}
+        for variant in upload.variants or []:
+            srcsets.setdefault(variant["format"], []).append(
+                f"/uploads/{variant['name']} {variant['width']}w"
+            )
+        item.sources = [
+            ImageSource(type=f"image/{fmt}", srcset=", ".join(candidates))
+            for fmt, candidates in srcsets.items()
+        ]
+        return item
+
+
+class CaseStudySummary(BaseModel):
+    """List representation for portfolio grids; the long-form narrative and
+    gallery are only returned by the detail endpoint."""
+
+    id: UUID
+    slug: str
+    title: str
+    role: str
+    description: str
+    industry: str
+    technologies: list[TechnologyItem]
+    featured: bool
+    metrics: Optional[list[MetricItem]] = None
+    visual: VisualConfig
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+    @classmethod
+    def from_orm_model(cls, obj):
+        return cls(
+            id=obj.id,
+            slug=obj.slug,
+            title=obj.title,
+            role=obj.role,
+            description=obj.description,
+            industry=obj.industry,
+            technologies=obj.technologies or [],
+            featured=obj.featured,
+            metrics=obj.metrics,
+            visual=VisualConfig(color=obj.visual_color, icon=obj.visual_icon),
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
+
+
 class CaseStudyResponse(BaseModel):
     id: UUID
     slug: str
@@ -43,7 +112,7 @@ class CaseStudyResponse(BaseModel):
     architecture: Optional[str] = None
     challenges: Optional[str] = None
     impact: Optional[str] = None
-    gallery: Optional[list[GalleryItem]] = None
+    gallery: Optional[list[GalleryImage]] = None
     visual: VisualConfig
     created_at: datetime
     updated_at: datetime
@@ -51,7 +120,9 @@ class CaseStudyResponse(BaseModel):
     model_config = {"from_attributes": True}
 
     @classmethod
-    def from_orm_model(cls, obj):
+    def from_orm_model(cls, obj, uploads: Optional[dict] = None):
+        """uploads maps gallery URLs to their Upload rows, for srcset data."""
+        uploads = uploads or {}
         return cls(
             id=obj.id,
             slug=obj.slug,
@@ -69,7 +140,11 @@ class CaseStudyResponse(BaseModel):
             architecture=obj.architecture,
             challenges=obj.challenges,
             impact=obj.impact,
-            gallery=obj.gallery,
+            gallery=(
+                [GalleryImage.from_entry(g, uploads.get(g["url"])) for g in obj.gallery]
+                if obj.gallery is not None
+                else None
+            ),
             visual=VisualConfig(color=obj.visual_color, icon=obj.visual_icon),
             created_at=obj.created_at,
             updated_at=obj.updated_at,
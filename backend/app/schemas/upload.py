@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+class UploadResponse(BaseModel):
+    id: str
+    url: str
+
+
+class UploadSessionCreate(BaseModel):
+    filename: str
+    size: int = Field(gt=0)  # total bytes the client will send
+
+
+class UploadSessionResponse(BaseModel):
+    id: str
+    filename: str
+    size: int
+    offset: int  # bytes received so far; send the next chunk from here
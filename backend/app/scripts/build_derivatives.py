@@ -0,0 +1,34 @@
+"""
+Queue derivative builds for every upload that does not have them yet.
+
+New uploads queue their own build; this covers a backlog, such as uploads
+made before the worker existed, or everything after a change to
+IMAGE_VARIANT_WIDTHS. The jobs run at low priority so fresh uploads go
+first, and python -m app.worker does the work. Variant files already on
+disk are kept.
+
+Run from backend/:
+    python -m app.scripts.build_derivatives
+
+To rebuild everything, clear uploads.processed_at first.
+"""
+
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models.upload import Upload
+from app.services.derivatives import BUILD_DERIVATIVES
+from app.services.jobs import enqueue
+
+
+def main() -> None:
+    with SessionLocal() as db:
+        pending = db.scalars(select(Upload.id).where(Upload.processed_at.is_(None))).all()
+        for upload_id in pending:
+            enqueue(db, BUILD_DERIVATIVES, {"upload_id": str(upload_id)}, priority=-1)
+        db.commit()
+    print(f"Queued {len(pending)} uploads")
+
+
+if __name__ == "__main__":
+    main()
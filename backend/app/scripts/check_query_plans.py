@@ -0,0 +1,201 @@
+"""
+Query plan regression check.
+
+Seeds enough rows that the planner should prefer the indexes from migration
+005, runs EXPLAIN for the queries the routers issue, and exits non-zero if
+any plan sequentially scans a seeded table. Everything runs in a single
+transaction that is rolled back, so the database is left as it was.
+
+Run against a migrated local Postgres:
+    DATABASE_URL=postgresql://... python -m app.scripts.check_query_plans
+
+Keep QUERIES in step with the WHERE / ORDER BY shapes in app/api when
+adding or changing a route.
+"""
+
+import json
+import sys
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select, text, tuple_
+
+from app.core.database import engine
+from app.models.case_study import CaseStudy
+from app.models.note import Note
+from app.models.requirement import Requirement, RequirementStatus
+from app.models.service import Service
+from app.models.testimonial import Testimonial
+from app.models.user import User, UserRole
+
+PAGE = 51  # an admin page of 50 plus the look-ahead row
+
+USERS = 2_000
+REQUIREMENTS = 20_000
+NOTES_PER_REQUIREMENT = 3
+CATALOG_ROWS = 5_000  # per catalog table, one in twenty active
+
+SEED = [
+    ("users", """
+        INSERT INTO users (id, email, role, created_at)
+        SELECT gen_random_uuid(), 'plan-check-' || g || '@example.com', 'client',
+               now() - g * interval '1 minute'
+        FROM generate_series(1, :users) g
+    """),
+    ("requirements", """
+        INSERT INTO requirements
+            (id, name, email, title, description, type, status, progress, created_at, updated_at)
+        SELECT gen_random_uuid(), 'Plan Check', 'plan-check-' || (1 + g % :users) || '@example.com',
+               'Requirement ' || g, 'Seeded by check_query_plans', 'contract',
+               (ARRAY['new', 'accepted', 'in_progress', 'completed', 'rejected'])[1 + g % 5]::requirementstatus,
+               0, now() - g * interval '1 minute', now()
+        FROM generate_series(1, :requirements) g
+    """),
+    ("notes", """
+        INSERT INTO notes (id, requirement_id, content, created_at)
+        SELECT gen_random_uuid(), r.id, 'Seeded note', r.created_at + g * interval '1 hour'
+        FROM requirements r CROSS JOIN generate_series(1, :notes_per_requirement) g
+        WHERE r.email LIKE 'plan-check-%'
+    """),
+    ("case_studies", """
+        INSERT INTO case_studies
+            (id, slug, title, role, description, industry, display_order, is_active, created_at, updated_at)
+        SELECT gen_random_uuid(), 'plan-check-' || g, 'Case study ' || g, 'Lead', 'Seeded',
+               'Software', g % 10, g % 20 = 0, now() - g * interval '1 minute', now()
+        FROM generate_series(1, :catalog_rows) g
+    """),
+    ("services", """
+        INSERT INTO services
+            (id, slug, title, description, display_order, is_active, created_at, updated_at)
+        SELECT gen_random_uuid(), 'plan-check-' || g, 'Service ' || g, 'Seeded',
+               g % 10, g % 20 = 0, now() - g * interval '1 minute', now()
+        FROM generate_series(1, :catalog_rows) g
+    """),
+    ("testimonials", """
+        INSERT INTO testimonials
+            (id, author_name, author_role, author_company, author_initials, content,
+             is_active, created_at, updated_at)
+        SELECT gen_random_uuid(), 'Plan Check', 'CTO', 'Example', 'PC', 'Seeded',
+               g % 20 = 0, now() - g * interval '1 minute', now()
+        FROM generate_series(1, :catalog_rows) g
+    """),
+]
+
+SEEDED_TABLES = {table for table, _sql in SEED}
+
+
+def seed(conn) -> None:
+    params = {
+        "users": USERS,
+        "requirements": REQUIREMENTS,
+        "notes_per_requirement": NOTES_PER_REQUIREMENT,
+        "catalog_rows": CATALOG_ROWS,
+    }
+    for table, sql in SEED:
+        conn.execute(text(sql), params)
+        conn.execute(text(f"ANALYZE {table}"))
+
+
+def sample_requirement(conn) -> tuple[UUID, str, datetime]:
+    """A requirement from the middle of the seeded rows to use as parameters."""
+    return conn.execute(
+        select(Requirement.id, Requirement.email, Requirement.created_at)
+        .where(Requirement.email.like("plan-check-%"))
+        .order_by(Requirement.created_at.desc())
+        .offset(REQUIREMENTS // 2)
+        .limit(1)
+    ).one()
+
+
+def router_queries(requirement_id: UUID, email: str, created_at: datetime) -> list:
+    cursor = tuple_(created_at, requirement_id)
+    return [
+        # client.py
+        ("client: list requirements",
+         select(Requirement).where(Requirement.email == email)
+         .order_by(Requirement.created_at.desc())),
+        ("client: get requirement",
+         select(Requirement).where(Requirement.id == requirement_id, Requirement.email == email)),
+        ("client: list notes",
+         select(Note).where(Note.requirement_id == requirement_id)
+         .order_by(Note.created_at.desc())),
+        # auth.py
+        ("auth: user by email", select(User).where(User.email == email)),
+        ("auth: user by invite token", select(User).where(User.invite_token == "plan-check")),
+        # public.py
+        ("public: case studies",
+         select(CaseStudy).where(CaseStudy.is_active == True)
+         .order_by(CaseStudy.display_order, CaseStudy.created_at.desc())),
+        ("public: case study by slug",
+         select(CaseStudy).where(CaseStudy.slug == "plan-check-20", CaseStudy.is_active == True)),
+        ("public: services",
+         select(Service).where(Service.is_active == True)
+         .order_by(Service.display_order, Service.created_at.desc())),
+        ("public: service by slug",
+         select(Service).where(Service.slug == "plan-check-20", Service.is_active == True)),
+        ("public: testimonials",
+         select(Testimonial).where(Testimonial.is_active == True)
+         .order_by(Testimonial.created_at.desc())),
+        # admin.py / users.py keyset pages
+        ("admin: requirements page",
+         select(Requirement).where(tuple_(Requirement.created_at, Requirement.id) < cursor)
+         .order_by(Requirement.created_at.desc(), Requirement.id.desc()).limit(PAGE)),
+        ("admin: requirements page by status",
+         select(Requirement).where(
+             Requirement.status == RequirementStatus.new,
+             tuple_(Requirement.created_at, Requirement.id) < cursor,
+         )
+         .order_by(Requirement.created_at.desc(), Requirement.id.desc()).limit(PAGE)),
+        ("admin: notes page",
+         select(Note).where(Note.requirement_id == requirement_id)
+         .order_by(Note.created_at.desc(), Note.id.desc()).limit(PAGE)),
+        ("admin: users page",
+         select(User).where(User.role == UserRole.client)
+         .order_by(User.created_at.desc(), User.id.desc()).limit(PAGE)),
+    ]
+
+
+def seq_scans(plan: dict):
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from seq_scans(child)
+
+
+def explain(conn, stmt) -> dict:
+    sql = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar_one()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def check() -> int:
+    if engine.dialect.name != "postgresql":
+        print("The query plan check needs PostgreSQL (set DATABASE_URL).")
+        return 2
+
+    failures = []
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            seed(conn)
+            for name, stmt in router_queries(*sample_requirement(conn)):
+                scanned = sorted(set(seq_scans(explain(conn, stmt))) & SEEDED_TABLES)
+                if scanned:
+                    failures.append(name)
+                    print(f"FAIL  {name}: sequential scan on {', '.join(scanned)}")
+                else:
+                    print(f"ok    {name}")
+        finally:
+            trans.rollback()
+
+    if failures:
+        print(f"{len(failures)} quer{'y' if len(failures) == 1 else 'ies'} fell back to a sequential scan.")
+        return 1
+    print("No sequential scans on seeded tables.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(check())
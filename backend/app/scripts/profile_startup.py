@@ -0,0 +1,146 @@
+"""
+Startup time report.
+
+Imports app.main in a fresh interpreter under `python -X importtime` and
+prints where the time went, grouped by package (app modules individually).
+Then starts uvicorn and times how long it takes to answer GET /health, which
+includes the lifespan (schema check and pool warm-up), so it needs the
+database the app is configured for.
+
+    python -m app.scripts.profile_startup [--top 15] [--no-serve]
+        [--import-budget-ms 1500] [--request-budget-ms 3000]
+
+Exits non-zero when a budget is exceeded, so it can guard CI.
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from typing import NamedTuple, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SERVE_TIMEOUT = 60
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """The `import time: self | cumulative | name` lines of -X importtime."""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # the column header
+        rows.append(ImportTime(name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def group(module: str) -> str:
+    """Report app modules individually and everything else by package."""
+    parts = module.split(".")
+    return module if parts[0] == "app" else parts[0]
+
+
+def import_times(module: str = "app.main") -> list[ImportTime]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.exit(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def report_imports(rows: list[ImportTime], top: int) -> float:
+    """Print the slowest groups by self time; return the total in ms."""
+    by_group = defaultdict(int)
+    for row in rows:
+        by_group[group(row.module)] += row.self_us
+    total_us = sum(by_group.values())
+
+    print(f"Import of app.main: {total_us / 1000:.0f} ms across {len(rows)} modules")
+    for name, self_us in sorted(by_group.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {self_us / 1000:8.1f} ms  {100 * self_us / total_us:5.1f}%  {name}")
+    return total_us / 1000
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request() -> Optional[float]:
+    """Seconds from launching uvicorn to a 200 from /health, or None if the
+    server exited or did not answer within SERVE_TIMEOUT."""
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        while time.perf_counter() - start < SERVE_TIMEOUT:
+            if server.poll() is not None:
+                print(f"Server exited during startup:\n{server.stderr.read()[-2000:]}")
+                return None
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as res:
+                    if res.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                time.sleep(0.02)
+        print(f"No response from /health within {SERVE_TIMEOUT}s.")
+        return None
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=15, help="groups to list")
+    parser.add_argument("--no-serve", action="store_true", help="skip time to first request")
+    parser.add_argument("--import-budget-ms", type=float)
+    parser.add_argument("--request-budget-ms", type=float)
+    args = parser.parse_args()
+
+    over_budget = []
+    import_ms = report_imports(import_times(), args.top)
+    if args.import_budget_ms is not None and import_ms > args.import_budget_ms:
+        over_budget.append(f"import {import_ms:.0f} ms > {args.import_budget_ms:.0f} ms")
+
+    if not args.no_serve:
+        elapsed = time_to_first_request()
+        if elapsed is None:
+            return 2
+        request_ms = elapsed * 1000
+        print(f"Time to first request: {request_ms:.0f} ms")
+        if args.request_budget_ms is not None and request_ms > args.request_budget_ms:
+            over_budget.append(f"first request {request_ms:.0f} ms > {args.request_budget_ms:.0f} ms")
+
+    for line in over_budget:
+        print(f"Over budget: {line}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Production web server.
+
+A gunicorn arbiter imports the app once and forks WEB_CONCURRENCY uvicorn
+workers from it (by default one per available CPU, as far as the database
+connection budget in app.core.config allows), so the workers share the
+pages holding the imported code and data. The garbage collector is
+paused during the import and everything it created is then frozen with
+gc.freeze(), so collections in the workers never write to those pages and
+copy them. Workers use uvloop and httptools when installed and are replaced
+gracefully after WEB_MAX_REQUESTS requests.
+
+Run from backend/:
+    python -m app.server
+"""
+
+import gc
+import os
+
+from gunicorn.app.base import BaseApplication
+
+from app.core.config import (
+    WEB_BIND,
+    WEB_CONCURRENCY,
+    WEB_GRACEFUL_TIMEOUT,
+    WEB_KEEPALIVE_SECONDS,
+    WEB_MAX_REQUESTS,
+    WEB_MAX_REQUESTS_JITTER,
+)
+
+
+def post_fork(server, worker):
+    # The engines were created by the arbiter's import. Forget any pooled
+    # connections inherited from it without closing the arbiter's sockets.
+    from app.core.database import async_engine, engine, replica_router
+
+    engine.dispose(close=False)
+    for aengine in (async_engine, *replica_router.engines):
+        aengine.sync_engine.dispose(close=False)
+
+
+class Server(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        gc.disable()
+        from app.main import app
+
+        gc.freeze()
+        gc.enable()
+        return app
+
+
+def options() -> dict:
+    return {
+        "bind": WEB_BIND,
+        "workers": WEB_CONCURRENCY,
+        "worker_class": "uvicorn_worker.UvicornWorker",
+        "preload_app": True,
+        "keepalive": WEB_KEEPALIVE_SECONDS,
+        "max_requests": WEB_MAX_REQUESTS,
+        "max_requests_jitter": WEB_MAX_REQUESTS_JITTER,
+        "graceful_timeout": WEB_GRACEFUL_TIMEOUT,
+        # Heartbeat files on tmpfs, not the container's overlay filesystem
+        "worker_tmp_dir": "/dev/shm" if os.path.isdir("/dev/shm") else None,
+        "accesslog": "-",
+        "post_fork": post_fork,
+    }
+
+
+def main() -> None:
+    Server(options()).run()
+
+
+if __name__ == "__main__":
+    main()
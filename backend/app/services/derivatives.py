@@ -0,0 +1,35 @@
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.upload import Upload
+from app.services.jobs import handler
+
+# Job kind that builds an upload's derivatives (app.services.images).
+BUILD_DERIVATIVES = "image.derivatives"
+
+UNPROCESSABLE = {"width": None, "height": None, "placeholder": None, "variants": []}
+
+
+@handler(BUILD_DERIVATIVES)
+def build_derivatives(db: Session, payload: dict) -> None:
+    """Render an upload's derivatives and record them on its row. Uploads
+    already processed are skipped, so a duplicate job is harmless."""
+    # Pillow loads here, in the worker, rather than in every web process
+    # that imports BUILD_DERIVATIVES to enqueue jobs.
+    from PIL import Image, UnidentifiedImageError
+
+    from app.services.images import render
+
+    upload = db.get(Upload, UUID(payload["upload_id"]))
+    if upload is None or upload.processed_at is not None:
+        return
+    try:
+        fields = render(upload.name)
+    except (UnidentifiedImageError, Image.DecompressionBombError):
+        # Not an image Pillow will open; record it so it is not retried.
+        fields = UNPROCESSABLE
+    for field, value in fields.items():
+        setattr(upload, field, value)
+    upload.processed_at = func.now()
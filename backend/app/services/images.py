@@ -0,0 +1,84 @@
+"""Image derivatives: resized variants in modern formats and a tiny blurred
+placeholder. Pure functions of the stored file, run on the job worker's
+threads (app.worker) by the app.services.derivatives handler."""
+
+import base64
+import io
+import os
+import tempfile
+
+from PIL import Image, ImageOps
+
+from app.core.config import IMAGE_VARIANT_FORMATS, IMAGE_VARIANT_WIDTHS, UPLOAD_DIR
+
+# GIFs may be animated and SVGs scale already, so only these are resized.
+RASTER_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+PLACEHOLDER_WIDTH = 16
+
+SAVE_OPTIONS = {
+    "avif": {"format": "AVIF", "quality": 55},
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+}
+
+
+def _save(image: Image.Image, path: str, fmt: str) -> None:
+    """Write image to path through a temp file, so an interrupted run never
+    leaves a truncated variant under its final name."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            image.save(out, **SAVE_OPTIONS[fmt])
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _placeholder(image: Image.Image) -> str:
+    """A PLACEHOLDER_WIDTH px WebP as a data: URI, shown blurred while the
+    real image loads."""
+    small = image.copy()
+    small.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH))
+    buffer = io.BytesIO()
+    small.save(buffer, format="WEBP", quality=40)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def render(name: str) -> dict:
+    """Build the derivatives of the upload stored at name under UPLOAD_DIR.
+
+    Variants go next to the original as <stem>-<width>.<format>. Widths are
+    never upscaled: any above the original collapse to its own width. Files
+    that already exist are kept, so rerunning after a crash only does the
+    remaining work. Returns the fields to record on the upload row."""
+    stem, ext = os.path.splitext(name)
+    if ext.lower() not in RASTER_EXTENSIONS:
+        return {"width": None, "height": None, "placeholder": None, "variants": []}
+
+    with Image.open(os.path.join(UPLOAD_DIR, name)) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+        width, height = image.size
+
+        variants = []
+        for w in sorted({min(w, width) for w in IMAGE_VARIANT_WIDTHS}):
+            resized = None
+            for fmt in IMAGE_VARIANT_FORMATS:
+                variant = f"{stem}-{w}.{fmt}"
+                path = os.path.join(UPLOAD_DIR, variant)
+                if not os.path.exists(path):
+                    if resized is None:
+                        resized = image.resize(
+                            (w, max(1, round(height * w / width))), Image.Resampling.LANCZOS
+                        )
+                    _save(resized, path, fmt)
+                variants.append({"name": variant, "width": w, "format": fmt})
+
+        return {
+            "width": width,
+            "height": height,
+            "placeholder": _placeholder(image),
+            "variants": variants,
+        }
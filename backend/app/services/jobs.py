@@ -0,0 +1,199 @@
+"""Durable background jobs, stored in the jobs table.
+
+Request handlers enqueue() work in their own transaction, so a job exists
+exactly when the change that asked for it commits. Workers (python -m
+app.worker) claim ready jobs with SELECT ... FOR UPDATE SKIP LOCKED, so any
+number of them can poll the table without handing the same job out twice.
+
+A handler runs in the worker's session. Its changes and the deletion of the
+job commit together; if it raises, both roll back and the job is retried
+with exponential backoff until max_attempts."""
+
+import logging
+import os
+import socket
+import threading
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import (
+    JOB_BACKOFF_MAX_SECONDS,
+    JOB_BACKOFF_SECONDS,
+    JOB_LEASE_SECONDS,
+    JOB_MAX_ATTEMPTS,
+    JOB_POLL_INTERVAL,
+)
+from app.core.database import SessionLocal
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Longest a worker waits before retrying after the database failed it.
+WORKER_ERROR_BACKOFF_MAX_SECONDS = 60
+
+Handler = Callable[[Session, dict], None]
+
+HANDLERS: dict[str, Handler] = {}
+
+
+def handler(kind: str) -> Callable[[Handler], Handler]:
+    """Register the function run for jobs of this kind."""
+
+    def register(func: Handler) -> Handler:
+        HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+def enqueue(
+    db,
+    kind: str,
+    payload: Optional[dict] = None,
+    *,
+    priority: int = 0,
+    delay: float = 0,
+    max_attempts: int = JOB_MAX_ATTEMPTS,
+) -> Job:
+    """Add a job to db's transaction (sync or async session); workers see it
+    once the caller commits."""
+    job = Job(
+        kind=kind,
+        payload=payload or {},
+        priority=priority,
+        max_attempts=max_attempts,
+        run_at=datetime.now(timezone.utc) + timedelta(seconds=delay),
+    )
+    db.add(job)
+    return job
+
+
+def backoff(attempts: int) -> float:
+    """Seconds to wait before retrying a job that has failed attempts times."""
+    return min(JOB_BACKOFF_SECONDS * 2 ** (attempts - 1), JOB_BACKOFF_MAX_SECONDS)
+
+
+def claim(db: Session, worker_id: str) -> Optional[Job]:
+    """Lease the next ready job to worker_id, highest priority first, and
+    commit the lease. Returns None when nothing is ready.
+
+    A job whose lease expired on its last attempt most likely took its
+    worker down with it; it is marked failed instead of being handed out
+    again."""
+    while True:
+        now = datetime.now(timezone.utc)
+        job = db.scalar(
+            select(Job)
+            .where(
+                Job.failed_at.is_(None),
+                Job.run_at <= now,
+                or_(
+                    Job.locked_at.is_(None),
+                    Job.locked_at < now - timedelta(seconds=JOB_LEASE_SECONDS),
+                ),
+            )
+            .order_by(Job.priority.desc(), Job.run_at, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if job is None:
+            db.rollback()
+            return None
+        if job.attempts >= job.max_attempts:
+            job.last_error = (
+                f"Lease held by {job.locked_by} expired after {job.attempts} attempts"
+            )
+            job.locked_at = None
+            job.locked_by = None
+            job.failed_at = now
+            db.commit()
+            continue
+        job.locked_at = now
+        job.locked_by = worker_id
+        job.attempts += 1
+        db.commit()
+        return job
+
+
+def run_job(db: Session, job: Job) -> bool:
+    """Run a claimed job. True if it succeeded and was removed."""
+    try:
+        func = HANDLERS.get(job.kind)
+        if func is None:
+            raise LookupError(f"No handler registered for job kind {job.kind!r}")
+        func(db, job.payload)
+        db.delete(job)
+        db.commit()
+        return True
+    except Exception:
+        db.rollback()
+        job.locked_at = None
+        job.locked_by = None
+        job.last_error = traceback.format_exc()[-4000:]
+        if job.attempts >= job.max_attempts:
+            job.failed_at = datetime.now(timezone.utc)
+        else:
+            job.run_at = datetime.now(timezone.utc) + timedelta(seconds=backoff(job.attempts))
+        db.commit()
+        return False
+
+
+class Worker:
+    """Claims and runs jobs until stopped. app.worker runs several of these
+    on threads; each holds at most one database connection."""
+
+    def __init__(self, sessions: sessionmaker = SessionLocal, name: Optional[str] = None):
+        self.sessions = sessions
+        self.id = name or f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+    def run_once(self) -> bool:
+        """Run the next ready job, if any. False when the queue was empty."""
+        with self.sessions() as db:
+            job = claim(db, self.id)
+            if job is None:
+                return False
+            run_job(db, job)
+            return True
+
+    def run(self, stop: threading.Event, poll_interval: float = JOB_POLL_INTERVAL) -> None:
+        """Poll until stop is set. An error outside a handler (the database
+        going away, say) is logged and retried after a growing pause rather
+        than ending the thread."""
+        errors = 0
+        while not stop.is_set():
+            try:
+                ran = self.run_once()
+            except Exception:
+                errors += 1
+                delay = min(poll_interval * 2**errors, WORKER_ERROR_BACKOFF_MAX_SECONDS)
+                logger.exception("Job worker %s failed; retrying in %gs", self.id, delay)
+                stop.wait(delay)
+                continue
+            errors = 0
+            if not ran:
+                stop.wait(poll_interval)
+
+
+def queue_status(db: Session) -> dict:
+    """Job counts per kind: ready, scheduled (backing off or delayed),
+    running and failed."""
+    now = datetime.now(timezone.utc)
+    lease_start = now - timedelta(seconds=JOB_LEASE_SECONDS)
+    running = (Job.locked_at.is_not(None)) & (Job.locked_at >= lease_start)
+    rows = db.execute(
+        select(
+            Job.kind,
+            func.count().filter(Job.failed_at.is_not(None)),
+            func.count().filter(Job.failed_at.is_(None), running),
+            func.count().filter(Job.failed_at.is_(None), ~running, Job.run_at <= now),
+            func.count().filter(Job.failed_at.is_(None), ~running, Job.run_at > now),
+        ).group_by(Job.kind)
+    )
+    return {
+        kind: {"failed": failed, "running": busy, "ready": ready, "scheduled": scheduled}
+        for kind, failed, busy, ready, scheduled in rows
+    }
@@ -0,0 +1,159 @@
+"""Resumable uploads: a client declares the file, appends it in pieces at
+the offset the server reports, and completes it once every byte is in.
+
+Each session is a data file plus a small JSON description under
+INCOMING_DIR/sessions. The data file's length is the session's offset, so
+every worker sharing UPLOAD_DIR sees the same state and a dropped
+connection loses only the piece in flight."""
+
+import fcntl
+import json
+import os
+import time
+import uuid
+from typing import AsyncIterator, NamedTuple
+
+import anyio
+from fastapi import HTTPException, status
+
+from app.core.config import UPLOAD_SESSION_TTL_SECONDS
+from app.services.uploads import INCOMING_DIR, StoredFile, check_upload, store_file
+
+SESSIONS_DIR = os.path.join(INCOMING_DIR, "sessions")
+
+
+class UploadSession(NamedTuple):
+    id: str
+    owner: str  # user id
+    filename: str
+    size: int  # declared total bytes
+
+
+def _data_path(session_id: str) -> str:
+    return os.path.join(SESSIONS_DIR, session_id)
+
+
+def _meta_path(session_id: str) -> str:
+    return os.path.join(SESSIONS_DIR, f"{session_id}.json")
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Upload session not found",
+    )
+
+
+def _offset_conflict(offset: int, detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=detail,
+        headers={"Upload-Offset": str(offset)},
+    )
+
+
+def prune_sessions() -> int:
+    """Delete sessions untouched for UPLOAD_SESSION_TTL_SECONDS."""
+    cutoff = time.time() - UPLOAD_SESSION_TTL_SECONDS
+    removed = 0
+    for entry in os.scandir(SESSIONS_DIR):
+        if entry.name.endswith(".json"):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                delete_session(entry.name)
+                removed += 1
+        except FileNotFoundError:
+            pass  # completed or pruned concurrently
+    return removed
+
+
+def create_session(owner: str, filename: str, size: int) -> UploadSession:
+    """Validate the declared file and open an empty session for it.
+    Blocking: call it through run_in_threadpool."""
+    check_upload(filename, size)
+    os.makedirs(SESSIONS_DIR, exist_ok=True)
+    prune_sessions()
+    session = UploadSession(uuid.uuid4().hex, owner, filename, size)
+    open(_data_path(session.id), "xb").close()
+    with open(_meta_path(session.id), "x") as meta:
+        json.dump(session._asdict(), meta)
+    return session
+
+
+def load_session(session_id: str, owner: str) -> UploadSession:
+    """The caller's session, or 404 (also for someone else's session)."""
+    try:
+        with open(_meta_path(session_id)) as meta:
+            session = UploadSession(**json.load(meta))
+    except FileNotFoundError:
+        raise _not_found()
+    if session.owner != owner:
+        raise _not_found()
+    return session
+
+
+def session_offset(session: UploadSession) -> int:
+    try:
+        return os.path.getsize(_data_path(session.id))
+    except FileNotFoundError:
+        raise _not_found()
+
+
+async def append_chunk(
+    session: UploadSession, offset: int, chunks: AsyncIterator[bytes]
+) -> int:
+    """Append the request body at offset and return the new offset.
+
+    offset must equal the bytes already received, otherwise 409 carries the
+    current offset in Upload-Offset for the client to resume from. A body
+    running past the declared size is refused with 400 and cut back to
+    offset; memory use is one network chunk at a time."""
+    try:
+        file = await anyio.open_file(_data_path(session.id), "ab")
+    except FileNotFoundError:
+        raise _not_found()
+    async with file:
+        try:
+            # One writer per session; a retry racing the original gets 409
+            fcntl.flock(file.wrapped.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise _offset_conflict(offset, "Another chunk for this upload is in progress")
+        # Sized under the lock: another writer may have appended since open
+        current = os.fstat(file.wrapped.fileno()).st_size
+        if offset != current:
+            raise _offset_conflict(current, f"Upload-Offset must be {current}")
+        async for chunk in chunks:
+            if current + len(chunk) > session.size:
+                await file.truncate(offset)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Upload exceeds its declared size of {session.size} bytes",
+                )
+            await file.write(chunk)
+            current += len(chunk)
+    return current
+
+
+def complete_session(session: UploadSession) -> StoredFile:
+    """Move a fully received upload into the content store and close the
+    session. Blocking: call it through run_in_threadpool."""
+    offset = session_offset(session)
+    if offset != session.size:
+        raise _offset_conflict(
+            offset, f"Upload incomplete: {offset} of {session.size} bytes received"
+        )
+    try:
+        stored = store_file(_data_path(session.id), session.filename)
+    except FileNotFoundError:
+        raise _not_found()  # completed by a concurrent request
+    delete_session(session.id)
+    return stored
+
+
+def delete_session(session_id: str) -> None:
+    for path in (_data_path(session_id), _meta_path(session_id)):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,170 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import ALLOWED_EXTENSIONS, MAX_UPLOAD_SIZE, UPLOAD_DIR
+from app.models.upload import Upload, UploadReference
+from app.services.derivatives import BUILD_DERIVATIVES
+from app.services.jobs import enqueue
+
+CHUNK_SIZE = 256 * 1024
+URL_PREFIX = "/uploads/"
+
+# Partial files are written here, on the same filesystem as UPLOAD_DIR so
+# the final rename is atomic, and outside the names /uploads serves.
+INCOMING_DIR = os.path.join(UPLOAD_DIR, ".incoming")
+
+
+class StoredFile(NamedTuple):
+    name: str  # path inside UPLOAD_DIR
+    sha256: str
+    size: int
+
+
+def content_name(sha256: str, filename: str) -> str:
+    """ab/ab12...ef.png: named by content, fanned out over 256 directories."""
+    return f"{sha256[:2]}/{sha256}{Path(filename or '').suffix.lower()}"
+
+
+def file_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"File too large. Max size: {MAX_UPLOAD_SIZE // (1024 * 1024)} MB",
+    )
+
+
+def check_upload(filename: str, size: Optional[int] = None) -> None:
+    """400 unless filename has an allowed extension and size, when known up
+    front, is within MAX_UPLOAD_SIZE."""
+    ext = Path(filename or "").suffix.lower()
+    if ext not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File type '{ext}' not allowed. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}",
+        )
+    if size is not None and size > MAX_UPLOAD_SIZE:
+        raise file_too_large()
+
+
+def _move_into_place(tmp_path: str, sha256: str, filename: str) -> str:
+    """Rename a complete file to its content name, or drop it if that
+    content is already stored. Returns the name."""
+    name = content_name(sha256, filename)
+    path = os.path.join(UPLOAD_DIR, name)
+    if os.path.exists(path):
+        os.unlink(tmp_path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+    return name
+
+
+def store_stream(source: BinaryIO, filename: str) -> StoredFile:
+    """Copy source into UPLOAD_DIR in CHUNK_SIZE pieces, hashing as it goes.
+
+    The bytes land in a temp file that is renamed to its content name once
+    complete, so a partial upload is never visible under its final name, and
+    a file whose content is already stored is dropped. Copying stops with 400
+    as soon as more than MAX_UPLOAD_SIZE bytes have been read.
+    Blocking: call it through run_in_threadpool."""
+    os.makedirs(INCOMING_DIR, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=INCOMING_DIR)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := source.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_SIZE:
+                    raise file_too_large()
+                digest.update(chunk)
+                out.write(chunk)
+            out.flush()
+            os.fsync(out.fileno())
+        name = _move_into_place(tmp_path, digest.hexdigest(), filename)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return StoredFile(name=name, sha256=digest.hexdigest(), size=size)
+
+
+def store_file(path: str, filename: str) -> StoredFile:
+    """Move a complete file from INCOMING_DIR into the content store,
+    hashing it in CHUNK_SIZE pieces. Blocking, like store_stream."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as source:
+        while chunk := source.read(CHUNK_SIZE):
+            size += len(chunk)
+            digest.update(chunk)
+        os.fsync(source.fileno())
+    name = _move_into_place(path, digest.hexdigest(), filename)
+    return StoredFile(name=name, sha256=digest.hexdigest(), size=size)
+
+
+async def register_upload(db: AsyncSession, stored: StoredFile, filename: str) -> Upload:
+    """Return the uploads row for stored, creating it on first upload along
+    with the job that builds its derivatives."""
+    query = select(Upload).where(Upload.name == stored.name)
+    upload = await db.scalar(query)
+    if upload is not None:
+        return upload
+    upload = Upload(
+        name=stored.name,
+        sha256=stored.sha256,
+        size=stored.size,
+        filename=Path(filename or "upload").name,
+    )
+    db.add(upload)
+    await db.flush()
+    enqueue(db, BUILD_DERIVATIVES, {"upload_id": str(upload.id)})
+    try:
+        await db.commit()
+    except IntegrityError:
+        # The same bytes were registered by a concurrent request
+        await db.rollback()
+    return await db.scalar(query)
+
+
+# ── Reference tracking ──
+
+
+def referenced_names(value: Any) -> set[str]:
+    """Names of the uploads whose /uploads/ URLs appear anywhere in value."""
+    if isinstance(value, str):
+        return {value[len(URL_PREFIX):]} if value.startswith(URL_PREFIX) else set()
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return set().union(*(referenced_names(v) for v in value))
+    return set()
+
+
+def track_references(db: Session, owner, *values: Any) -> None:
+    """Replace owner's upload_references with the uploads named in values.
+
+    owner is a flushed ORM row (its __tablename__ and id identify it). URLs
+    that are not registered uploads are ignored. Runs in the caller's
+    transaction."""
+    table, owner_id = owner.__tablename__, owner.id
+    db.execute(
+        delete(UploadReference).where(
+            UploadReference.owner_table == table, UploadReference.owner_id == owner_id
+        )
+    )
+    names = set().union(*(referenced_names(v) for v in values))
+    if not names:
+        return
+    for upload_id in db.scalars(select(Upload.id).where(Upload.name.in_(names))):
+        db.add(UploadReference(upload_id=upload_id, owner_table=table, owner_id=owner_id))
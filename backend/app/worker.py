@@ -0,0 +1,42 @@
+"""
+Background job worker.
+
+Runs JOB_WORKER_CONCURRENCY threads, each claiming jobs from the jobs table
+(app.services.jobs) until SIGTERM or SIGINT, then finishing the job in hand.
+Start as many of these processes as the queue needs; they coordinate
+through the database.
+
+Run from backend/:
+    python -m app.worker
+"""
+
+import logging
+import signal
+import threading
+
+from app.core.config import JOB_WORKER_CONCURRENCY
+from app.services import derivatives  # noqa: F401  (registers its job handlers)
+from app.services.jobs import HANDLERS, Worker
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    stop = threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda *_: stop.set())
+
+    threads = [
+        threading.Thread(target=Worker().run, args=(stop,), name=f"worker-{i}")
+        for i in range(JOB_WORKER_CONCURRENCY)
+    ]
+    for thread in threads:
+        thread.start()
+    print(f"Worker running {len(threads)} threads for: {', '.join(sorted(HANDLERS))}")
+    # Joining with a timeout keeps the main thread responsive to signals.
+    for thread in threads:
+        while thread.is_alive():
+            thread.join(timeout=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark: login throughput while the public catalog is under load.
+
+Runs the app in-process over a temporary SQLite database. One group of
+clients loops on POST /api/auth/login while another loops on
+GET /api/public/case-studies. Reports successful logins per second, logins
+shed with 503 by the password executor, catalog latency percentiles, and
+how long bcrypt calls queued for a worker.
+
+Run from backend/:
+    python -m benchmarks.login_throughput [seconds] [login_clients] [catalog_clients]
+
+Tune PASSWORD_HASH_WORKERS / PASSWORD_HASH_MAX_PENDING through the
+environment to compare executor sizes.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, get_async_db, get_async_read_db
+from app.core.limiter import limiter
+from app.core.security import hash_password, password_executor
+from app.main import app
+from app.models.case_study import CaseStudy
+from app.models.user import User, UserRole
+
+EMAIL = "bench@example.com"
+PASSWORD = "benchmark-password"
+
+
+def setup_database() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(User(email=EMAIL, password_hash=hash_password(PASSWORD), role=UserRole.client))
+        db.add_all(
+            CaseStudy(
+                slug=f"case-study-{i}",
+                title=f"Case Study {i}",
+                role="Lead Engineer",
+                description="Benchmark row",
+                industry="Software",
+                technologies=[{"name": "Python", "category": "Backend"}],
+            )
+            for i in range(50)
+        )
+        db.commit()
+
+    sessions = async_sessionmaker(
+        bind=create_async_engine(f"sqlite+aiosqlite:///{path}"),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    async def override():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override
+    app.dependency_overrides[get_async_read_db] = override
+    limiter.enabled = False
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
+
+
+async def run(seconds: float, login_clients: int, catalog_clients: int) -> None:
+    logins: Counter = Counter()
+    catalog: list[float] = []
+    deadline = time.perf_counter() + seconds
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+
+        async def login_loop():
+            while time.perf_counter() < deadline:
+                res = await client.post(
+                    "/api/auth/login", json={"email": EMAIL, "password": PASSWORD}
+                )
+                logins[res.status_code] += 1
+                if res.status_code == 503:
+                    await asyncio.sleep(float(res.headers["retry-after"]))
+
+        async def catalog_loop():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                res = await client.get("/api/public/case-studies")
+                res.raise_for_status()
+                catalog.append(time.perf_counter() - start)
+
+        await asyncio.gather(
+            *(login_loop() for _ in range(login_clients)),
+            *(catalog_loop() for _ in range(catalog_clients)),
+        )
+
+    executor = password_executor.status()
+    wait = executor["queue_wait"]
+    print(f"{seconds:.0f}s, {login_clients} login clients, {catalog_clients} catalog clients, "
+          f"{executor['workers']} bcrypt workers, {executor['max_pending']} max pending")
+    print(f"  logins ok       {logins[200] / seconds:8.1f} /s")
+    print(f"  logins shed 503 {logins[503]:8d}")
+    print(f"  catalog         {len(catalog) / seconds:8.1f} req/s  "
+          f"p50 {percentile(catalog, 50) * 1000:.2f} ms  "
+          f"p95 {percentile(catalog, 95) * 1000:.2f} ms  "
+          f"p99 {percentile(catalog, 99) * 1000:.2f} ms")
+    if wait["count"]:
+        print(f"  bcrypt queue    mean {wait['total_seconds'] / wait['count'] * 1000:.2f} ms  "
+              f"max {wait['max_seconds'] * 1000:.2f} ms")
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    login_clients = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    catalog_clients = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    setup_database()
+    asyncio.run(run(seconds, login_clients, catalog_clients))
+
+
+if __name__ == "__main__":
+    main()
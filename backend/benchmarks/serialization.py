@@ -0,0 +1,123 @@
+"""
+Microbenchmark: per-row cost of serializing the public case study list.
+
+Compares the old path (build response models, then let FastAPI validate them
+against response_model and encode through jsonable_encoder + JSONResponse)
+with the single-pass path used by app.api.public (build response models once,
+encode with a precompiled TypeAdapter straight to bytes), both for the full
+representation and for the CaseStudySummary the list endpoint now returns.
+
+Run from backend/: python -m benchmarks.serialization [rows] [repeats]
+"""
+
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import TypeAdapter
+
+from app.api.public import _case_study_list
+from app.core.responses import FastJSONResponse
+from app.models.case_study import CaseStudy
+from app.schemas.case_study import CaseStudyResponse, CaseStudySummary
+
+LONG_TEXT = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+
+
+def make_rows(n: int) -> list[CaseStudy]:
+    now = datetime.now(timezone.utc)
+    return [
+        CaseStudy(
+            id=uuid.uuid4(),
+            slug=f"case-study-{i}",
+            title=f"Case Study {i}",
+            role="Lead Engineer",
+            description=LONG_TEXT[:200],
+            industry="Healthcare",
+            technologies=[
+                {"name": "Python", "category": "Language"},
+                {"name": "FastAPI", "category": "Framework"},
+                {"name": "PostgreSQL", "category": "Data & Messaging"},
+            ],
+            featured=i == 0,
+            metrics=[{"value": "60%", "label": "Faster"}],
+            problem=LONG_TEXT,
+            solution=LONG_TEXT,
+            role_description=LONG_TEXT,
+            key_features=["Feature A", "Feature B", "Feature C"],
+            architecture=LONG_TEXT,
+            challenges=LONG_TEXT,
+            impact=LONG_TEXT,
+            gallery=[{"url": "/uploads/a.png", "caption": "Screen", "type": "screenshot"}],
+            visual_color="healthcare",
+            visual_icon="activity",
+            display_order=i,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+_response_field = create_model_field("Response", list[CaseStudyResponse], mode="serialization")
+_detail_list = TypeAdapter(list[CaseStudyResponse])
+
+
+def before(rows: list[CaseStudy]) -> bytes:
+    models = [CaseStudyResponse.from_orm_model(r) for r in rows]
+    content = asyncio.run(
+        serialize_response(field=_response_field, response_content=models)
+    )
+    return JSONResponse(content).body
+
+
+def after(rows: list[CaseStudy]) -> bytes:
+    models = [CaseStudyResponse.from_orm_model(r) for r in rows]
+    return FastJSONResponse(_detail_list.dump_json(models)).body
+
+
+def summary(rows: list[CaseStudy]) -> bytes:
+    models = [CaseStudySummary.from_orm_model(r) for r in rows]
+    return FastJSONResponse(_case_study_list.dump_json(models)).body
+
+
+def cached(payload: bytes) -> bytes:
+    return FastJSONResponse(payload).body
+
+
+def timeit(fn, arg, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rows = make_rows(n)
+
+    t_before = timeit(before, rows, repeats)
+    t_after = timeit(after, rows, repeats)
+    t_summary = timeit(summary, rows, repeats)
+    t_cached = timeit(cached, summary(rows), repeats)
+
+    print(f"{n} case studies, best of {repeats}")
+    print(f"  before (model + response_model + jsonable_encoder): {t_before / n * 1e6:8.2f} us/row")
+    print(f"  after  (model + TypeAdapter.dump_json):             {t_after / n * 1e6:8.2f} us/row")
+    print(f"  summary (CaseStudySummary + TypeAdapter.dump_json): {t_summary / n * 1e6:8.2f} us/row")
+    print(f"  cached (pre-encoded bytes):                         {t_cached / n * 1e6:8.2f} us/row")
+    print(f"  speedup: {t_before / t_after:.1f}x (full), {t_before / t_summary:.1f}x (summary)")
+    print(f"  payload: {len(after(rows)):,} bytes (full), {len(summary(rows)):,} bytes (summary)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,53 @@
+import os
+import tempfile
+
+# The minimum bcrypt cost keeps the auth-heavy suite fast; set before the
+# app reads its config.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# Exercise the shared limiter storage through its SQLite file backend.
+os.environ.setdefault(
+    "RATE_LIMIT_STORAGE_URI",
+    f"sql+sqlite:///{os.path.join(tempfile.mkdtemp(), 'rate_limits.db')}",
+)
+os.environ.setdefault("UPLOAD_DIR", tempfile.mkdtemp())
+
 import pytest
-from bcrypt import gensalt, hashpw
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.core.database import Base, get_db
+from app.core.cache import catalog_cache
+from app.core.database import Base, get_async_db, get_async_read_db, get_db
+from app.core.deps import identity_cache, revocations
+from app.core.health import health_cache
 from app.core.limiter import limiter
-from app.core.security import create_access_token
+from app.core.security import create_access_token, hash_password
 from app.main import app
 from app.models.user import User, UserRole
 
-# Use in-memory SQLite for tests — StaticPool ensures a single shared connection
+# Use a temporary SQLite file for tests so the sync and async engines
+# (one per driver) see the same database
+DB_PATH = os.path.join(tempfile.mkdtemp(), "test.db")
+
 engine = create_engine(
-    "sqlite://",
+    f"sqlite:///{DB_PATH}",
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{DB_PATH}")
 
 # SQLite doesn't enforce FK constraints by default
 @event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
 def _set_sqlite_pragma(dbapi_connection, _connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
 TestSession = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+AsyncTestSession = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
 
 
 def override_get_db():
@@ -36,7 +58,18 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with AsyncTestSession() as db:
+        yield db
+
+
+# One process on SQLite: nothing to listen to, so trust the caches as a
+# connected revocation listener would.
+revocations.connected = True
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
+app.dependency_overrides[get_async_read_db] = override_get_async_db
 
 ADMIN_EMAIL = "test@admin.com"
 ADMIN_PASSWORD = "testpassword123"
@@ -48,10 +81,19 @@ CLIENT_EMAIL = "client@test.com"
 CLIENT_PASSWORD = "clientpass123"
 
 
+@pytest.fixture
+def anyio_backend():
+    """The async SQLAlchemy stack only runs on asyncio."""
+    return "asyncio"
+
+
 @pytest.fixture(autouse=True)
 def setup_db():
-    """Create all tables before each test, drop after. Reset rate limiter."""
+    """Create all tables before each test, drop after. Reset rate limiter and caches."""
     limiter.reset()
+    catalog_cache.clear()
+    identity_cache.clear()
+    health_cache.clear()
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
@@ -70,10 +112,9 @@ def db():
 @pytest.fixture()
 def admin_user(db):
     """Create an admin user and return it."""
-    password_hash = hashpw(
-        ADMIN_PASSWORD.encode("utf-8"), gensalt()
-    ).decode("utf-8")
-    user = User(email=ADMIN_EMAIL, password_hash=password_hash, role=UserRole.admin)
+    user = User(
+        email=ADMIN_EMAIL, password_hash=hash_password(ADMIN_PASSWORD), role=UserRole.admin
+    )
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -83,10 +124,9 @@ def admin_user(db):
 @pytest.fixture()
 def editor_user(db):
     """Create an editor user and return it."""
-    password_hash = hashpw(
-        EDITOR_PASSWORD.encode("utf-8"), gensalt()
-    ).decode("utf-8")
-    user = User(email=EDITOR_EMAIL, password_hash=password_hash, role=UserRole.editor)
+    user = User(
+        email=EDITOR_EMAIL, password_hash=hash_password(EDITOR_PASSWORD), role=UserRole.editor
+    )
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -96,10 +136,9 @@ def editor_user(db):
 @pytest.fixture()
 def client_user(db):
     """Create a client user and return it."""
-    password_hash = hashpw(
-        CLIENT_PASSWORD.encode("utf-8"), gensalt()
-    ).decode("utf-8")
-    user = User(email=CLIENT_EMAIL, password_hash=password_hash, role=UserRole.client)
+    user = User(
+        email=CLIENT_EMAIL, password_hash=hash_password(CLIENT_PASSWORD), role=UserRole.client
+    )
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -109,21 +148,27 @@ def client_user(db):
 @pytest.fixture()
 def auth_headers(admin_user):
     """Return Authorization headers for the admin user."""
-    token = create_access_token(str(admin_user.id), admin_user.role.value)
+    token = create_access_token(
+        str(admin_user.id), admin_user.role.value, admin_user.email, admin_user.token_version
+    )
     return {"Authorization": f"Bearer {token}"}
 
 
 @pytest.fixture()
 def editor_headers(editor_user):
     """Return Authorization headers for the editor user."""
-    token = create_access_token(str(editor_user.id), editor_user.role.value)
+    token = create_access_token(
+        str(editor_user.id), editor_user.role.value, editor_user.email, editor_user.token_version
+    )
     return {"Authorization": f"Bearer {token}"}
 
 
 @pytest.fixture()
 def client_headers(client_user):
     """Return Authorization headers for the client user."""
-    token = create_access_token(str(client_user.id), client_user.role.value)
+    token = create_access_token(
+        str(client_user.id), client_user.role.value, client_user.email, client_user.token_version
+    )
     return {"Authorization": f"Bearer {token}"}
 
 
@@ -113,3 +113,99 @@ async def test_create_and_list_notes(client, auth_headers):
     )
     assert res.status_code == 200
     assert len(res.json()) == 1
+
+
+def seed_requirements(db, count, **overrides):
+    """Insert requirements with distinct created_at values, oldest first."""
+    from datetime import datetime, timedelta, timezone
+
+    from app.models.requirement import Requirement, RequirementType
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        Requirement(
+            name=f"Lead {i}",
+            email=f"lead{i}@example.com",
+            title=f"Project {i}",
+            description="Details",
+            type=RequirementType.contract,
+            created_at=start + timedelta(days=i),
+            **overrides,
+        )
+        for i in range(count)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+@pytest.mark.anyio
+async def test_list_requirements_keyset_pages(client, auth_headers, db):
+    seed_requirements(db, 5)
+
+    titles = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "include_total": "true"}
+        if cursor:
+            params["cursor"] = cursor
+        res = await client.get("/api/admin/requirements", headers=auth_headers, params=params)
+        assert res.status_code == 200
+        assert res.headers["x-total-count"] == "5"
+        titles += [r["title"] for r in res.json()]
+        cursor = res.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert titles == [f"Project {i}" for i in (4, 3, 2, 1, 0)]
+
+
+@pytest.mark.anyio
+async def test_empty_page_past_the_end_omits_total(client, auth_headers, db):
+    from datetime import datetime, timezone
+    from uuid import UUID
+
+    from app.core.pagination import encode_cursor
+
+    seed_requirements(db, 2)
+    cursor = encode_cursor(datetime(2000, 1, 1, tzinfo=timezone.utc), UUID(int=0))
+    res = await client.get(
+        "/api/admin/requirements",
+        headers=auth_headers,
+        params={"limit": 2, "include_total": "true", "cursor": cursor},
+    )
+    assert res.status_code == 200
+    assert res.json() == []
+    assert "x-total-count" not in res.headers
+
+
+@pytest.mark.anyio
+async def test_list_requirements_filters(client, auth_headers, db):
+    from app.models.requirement import RequirementStatus
+
+    seed_requirements(db, 3)
+    seed_requirements(db, 2, status=RequirementStatus.completed)
+
+    res = await client.get(
+        "/api/admin/requirements",
+        headers=auth_headers,
+        params={"status": "completed", "type": "contract"},
+    )
+    assert res.status_code == 200
+    assert len(res.json()) == 2
+    assert all(r["status"] == "completed" for r in res.json())
+
+    res = await client.get(
+        "/api/admin/requirements",
+        headers=auth_headers,
+        params={"created_after": "2026-01-02T00:00:00+00:00", "type": "one_off"},
+    )
+    assert res.json() == []
+
+
+@pytest.mark.anyio
+async def test_list_requirements_rejects_bad_cursor(client, auth_headers):
+    res = await client.get(
+        "/api/admin/requirements", headers=auth_headers, params={"cursor": "garbage"}
+    )
+    assert res.status_code == 400
@@ -167,3 +167,74 @@ async def test_register_then_login(client):
     )
     assert res.status_code == 200
     assert res.json()["role"] == "client"
+
+
+@pytest.mark.anyio
+async def test_login_fails_fast_when_password_executor_is_saturated(client, admin_user, monkeypatch):
+    import asyncio
+    import threading
+
+    from app.api import auth
+    from app.core.security import PasswordExecutor
+
+    executor = PasswordExecutor(workers=1, max_pending=0)
+    monkeypatch.setattr(auth, "password_executor", executor)
+    release = threading.Event()
+    busy = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0)
+
+    res = await client.post(
+        "/api/auth/login",
+        json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+    )
+    assert res.status_code == 503
+    assert res.headers["retry-after"] == "1"
+    assert executor.status()["rejected"] == 1
+
+    release.set()
+    await busy
+    res = await client.post(
+        "/api/auth/login",
+        json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+    )
+    assert res.status_code == 200
+    assert executor.status()["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_login_rehashes_password_with_outdated_cost(client, db):
+    from bcrypt import gensalt, hashpw
+
+    from app.core.config import BCRYPT_ROUNDS
+    from app.models.user import User, UserRole
+
+    old_hash = hashpw(b"oldcostpass", gensalt(BCRYPT_ROUNDS + 1)).decode("utf-8")
+    user = User(email="legacy@test.com", password_hash=old_hash, role=UserRole.client)
+    db.add(user)
+    db.commit()
+
+    res = await client.post(
+        "/api/auth/login",
+        json={"email": "legacy@test.com", "password": "oldcostpass"},
+    )
+    assert res.status_code == 200
+
+    db.refresh(user)
+    assert user.password_hash != old_hash
+    assert user.password_hash.split("$")[2] == f"{BCRYPT_ROUNDS:02d}"
+
+    # The new hash still verifies
+    res = await client.post(
+        "/api/auth/login",
+        json={"email": "legacy@test.com", "password": "oldcostpass"},
+    )
+    assert res.status_code == 200
+
+
+def test_password_needs_rehash():
+    from app.core.config import BCRYPT_ROUNDS
+    from app.core.security import hash_password, password_needs_rehash
+
+    assert not password_needs_rehash(hash_password("pw"))
+    assert password_needs_rehash(f"$2b${BCRYPT_ROUNDS + 1:02d}$" + "x" * 53)
+    assert password_needs_rehash("not-a-bcrypt-hash")
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+def loader_for(value, calls=None):
+    async def loader():
+        if calls is not None:
+            calls.append(1)
+        return value
+    return loader
+
+
+@pytest.mark.anyio
+async def test_hit_skips_loader():
+    cache = TTLCache(max_entries=8, ttl=60)
+    calls = []
+
+    assert await cache.get_or_load(("case_studies",), loader_for("value", calls)) == "value"
+    assert await cache.get_or_load(("case_studies",), loader_for("value", calls)) == "value"
+    assert cache.get(("case_studies",)) == "value"
+    assert len(calls) == 1
+
+
+@pytest.mark.anyio
+async def test_entries_expire_after_ttl():
+    cache = TTLCache(max_entries=8, ttl=0.01)
+
+    assert await cache.get_or_load(("case_studies",), loader_for(1)) == 1
+    await asyncio.sleep(0.02)
+    assert cache.get(("case_studies",)) is None
+    assert await cache.get_or_load(("case_studies",), loader_for(2)) == 2
+
+
+@pytest.mark.anyio
+async def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_entries=2, ttl=60)
+    await cache.get_or_load(("site_content", "a"), loader_for("a"))
+    await cache.get_or_load(("site_content", "b"), loader_for("b"))
+    await cache.get_or_load(("site_content", "a"), loader_for("unused"))
+    await cache.get_or_load(("site_content", "c"), loader_for("c"))
+
+    assert len(cache) == 2
+    assert cache.get(("site_content", "a")) == "a"
+    assert cache.get(("site_content", "b")) is None
+
+
+@pytest.mark.anyio
+async def test_invalidate_only_drops_that_entity():
+    cache = TTLCache(max_entries=8, ttl=60)
+    await cache.get_or_load(("site_content", "a"), loader_for("old"))
+    await cache.get_or_load(("site_content", None), loader_for("old"))
+    await cache.get_or_load(("case_studies",), loader_for("kept"))
+
+    # Admin handlers run in the threadpool, so invalidate from another thread.
+    thread = threading.Thread(target=cache.invalidate, args=("site_content",))
+    thread.start()
+    thread.join()
+
+    assert cache.get(("site_content", "a")) is None
+    assert cache.get(("site_content", None)) is None
+    assert cache.get(("case_studies",)) == "kept"
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_load():
+    cache = TTLCache(max_entries=8, ttl=60)
+    release = asyncio.Event()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await release.wait()
+        return "value"
+
+    tasks = [
+        asyncio.create_task(cache.get_or_load(("case_studies",), loader))
+        for _ in range(8)
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(calls) == 1
+    assert results == ["value"] * 8
+
+
+@pytest.mark.anyio
+async def test_load_racing_an_invalidation_is_not_cached():
+    cache = TTLCache(max_entries=8, ttl=60)
+
+    async def loader():
+        cache.invalidate("case_studies")
+        return "stale"
+
+    assert await cache.get_or_load(("case_studies",), loader) == "stale"
+    assert cache.get(("case_studies",)) is None
+
+
+@pytest.mark.anyio
+async def test_loader_errors_reach_waiters_and_are_not_cached():
+    cache = TTLCache(max_entries=8, ttl=60)
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("db down")
+
+    tasks = [
+        asyncio.create_task(cache.get_or_load(("case_studies",), failing))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert await cache.get_or_load(("case_studies",), loader_for("ok")) == "ok"
+
+
+@pytest.mark.anyio
+async def test_cancelled_leader_does_not_fail_waiters():
+    cache = TTLCache(max_entries=8, ttl=60)
+    started = asyncio.Event()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0 if len(calls) > 1 else 60)
+        return "value"
+
+    leader = asyncio.create_task(cache.get_or_load(("case_studies",), loader))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_load(("case_studies",), loader))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    # The waiter takes over the load instead of inheriting the cancellation
+    assert await waiter == "value"
+    assert leader.cancelled()
+    assert len(calls) == 2
+    assert cache.get(("case_studies",)) == "value"
+
@@ -91,3 +91,56 @@ async def test_client_cannot_submit_testimonial_on_incomplete(client, client_hea
 async def test_admin_cannot_access_client_portal(client, auth_headers):
     res = await client.get("/api/client/requirements", headers=auth_headers)
     assert res.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_repeat_requests_reuse_cached_identity(client, client_headers, monkeypatch):
+    from app.core import deps
+
+    calls = []
+    load_identity = deps._load_identity
+
+    async def counting_load(*args):
+        calls.append(1)
+        return await load_identity(*args)
+
+    monkeypatch.setattr(deps, "_load_identity", counting_load)
+    for _ in range(3):
+        res = await client.get("/api/client/requirements", headers=client_headers)
+        assert res.status_code == 200
+    assert len(calls) == 1
+
+
+@pytest.mark.anyio
+async def test_identity_cache_bypassed_while_not_receiving_revocations(
+    client, client_headers, monkeypatch
+):
+    from app.core import deps
+
+    calls = []
+    load_identity = deps._load_identity
+
+    async def counting_load(*args):
+        calls.append(1)
+        return await load_identity(*args)
+
+    monkeypatch.setattr(deps, "_load_identity", counting_load)
+    monkeypatch.setattr(deps.revocations, "connected", False)
+    for _ in range(2):
+        res = await client.get("/api/client/requirements", headers=client_headers)
+        assert res.status_code == 200
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_revocation_from_another_worker_drops_cached_identity(client, client_headers):
+    from app.core.deps import identity_cache, revocations
+
+    res = await client.get("/api/client/requirements", headers=client_headers)
+    assert res.status_code == 200
+    assert len(identity_cache) == 1
+    user_id = next(iter(identity_cache._entries))[0]
+
+    # What the listener does when another worker's NOTIFY arrives
+    revocations._on_notify(None, 0, "identity_revoked", user_id)
+    assert len(identity_cache) == 0
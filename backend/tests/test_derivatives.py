@@ -0,0 +1,111 @@
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from app.models.job import Job
+from app.models.upload import Upload
+from app.services import images
+from app.services.images import render
+from app.services.jobs import Worker
+from tests.conftest import TestSession
+
+
+def png(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 80, 40)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def run_jobs():
+    worker = Worker(sessions=TestSession)
+    while worker.run_once():
+        pass
+
+
+def test_render_builds_each_width_and_format_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(images, "IMAGE_VARIANT_WIDTHS", [100, 200, 5000])
+    (tmp_path / "ab").mkdir()
+    (tmp_path / "ab" / "abc.png").write_bytes(png(400, 200))
+
+    result = render("ab/abc.png")
+    assert (result["width"], result["height"]) == (400, 200)
+    assert result["placeholder"].startswith("data:image/webp;base64,")
+    # Widths above the original collapse to the original, never upscale
+    assert [(v["width"], v["format"]) for v in result["variants"]] == [
+        (100, "avif"), (100, "webp"), (200, "avif"), (200, "webp"), (400, "avif"), (400, "webp"),
+    ]
+    with Image.open(tmp_path / "ab" / "abc-200.webp") as variant:
+        assert variant.size == (200, 100)
+
+    # A rerun keeps what is already on disk
+    def fail(*args):
+        raise AssertionError("variant rebuilt")
+
+    monkeypatch.setattr(images, "_save", fail)
+    assert render("ab/abc.png") == result
+
+
+def test_render_skips_vector_and_animated_formats():
+    assert render("ab/abc.svg")["variants"] == []
+    assert render("ab/abc.gif")["variants"] == []
+
+
+async def upload(client, headers, name, body):
+    res = await client.post(
+        "/api/admin/uploads", files={"file": (name, body, "image/png")}, headers=headers
+    )
+    assert res.status_code == 200
+    return res.json()
+
+
+@pytest.mark.anyio
+async def test_gallery_exposes_processed_derivatives(client, auth_headers, db):
+    image = await upload(client, auth_headers, "shot.png", png(300, 150))
+    run_jobs()
+
+    row = db.query(Upload).filter(Upload.name == image["url"].removeprefix("/uploads/")).one()
+    assert row.processed_at is not None
+    assert (row.width, row.height) == (300, 150)
+    for variant in row.variants:
+        assert os.path.exists(os.path.join(images.UPLOAD_DIR, variant["name"]))
+
+    res = await client.post("/api/admin/case-studies", json={
+        "slug": "responsive",
+        "title": "Responsive",
+        "role": "Lead",
+        "description": "Has derivatives",
+        "industry": "Software",
+        "technologies": [],
+        "gallery": [
+            {"url": image["url"], "caption": "Shot", "type": "screenshot"},
+            {"url": "https://cdn.example.com/x.png", "caption": "External", "type": "screenshot"},
+        ],
+    }, headers=auth_headers)
+    assert res.status_code == 201
+
+    res = await client.get("/api/public/case-studies/responsive")
+    processed, external = res.json()["gallery"]
+    assert processed["url"] == image["url"]
+    assert (processed["width"], processed["height"]) == (300, 150)
+    assert processed["placeholder"].startswith("data:image/webp")
+    stem = image["url"].removesuffix(".png")
+    assert processed["sources"] == [
+        {"type": "image/avif", "srcset": f"{stem}-300.avif 300w"},
+        {"type": "image/webp", "srcset": f"{stem}-300.webp 300w"},
+    ]
+    assert external["sources"] == [] and external["placeholder"] is None
+
+
+@pytest.mark.anyio
+async def test_unreadable_image_is_not_retried(client, auth_headers, db):
+    await upload(client, auth_headers, "broken.png", b"not an image")
+    assert db.query(Job).one().kind == "image.derivatives"
+    run_jobs()
+
+    row = db.query(Upload).one()
+    assert row.processed_at is not None
+    assert row.variants == []
+    assert db.query(Job).count() == 0
@@ -0,0 +1,101 @@
+import socket
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import health
+from app.core.migrations import head_revision
+from tests.conftest import async_engine, engine
+
+
+@pytest.fixture
+def at_head(monkeypatch):
+    """Point the readiness check at the test database, stamped at head."""
+    monkeypatch.setattr(health, "async_engine", async_engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        conn.execute(text("INSERT INTO alembic_version VALUES (:rev)"), {"rev": head_revision()})
+    yield
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE alembic_version"))
+
+
+@pytest.mark.anyio
+async def test_live_checks_nothing(client):
+    res = await client.get("/health/live")
+    assert res.status_code == 200
+    assert res.json() == {"status": "ok"}
+
+
+@pytest.mark.anyio
+async def test_ready_when_every_check_passes(client, at_head):
+    res = await client.get("/health/ready")
+    assert res.status_code == 200
+    assert res.json() == {
+        "status": "ok",
+        "checks": {"database": "ok", "migrations": "ok", "db_pool": "ok", "threadpool": "ok"},
+    }
+
+
+@pytest.mark.anyio
+async def test_not_ready_behind_migrations(client, monkeypatch):
+    monkeypatch.setattr(health, "async_engine", async_engine)
+    res = await client.get("/health/ready")
+    assert res.status_code == 503
+    checks = res.json()["checks"]
+    assert checks["database"] == "ok"
+    assert checks["migrations"].startswith("at no revision")
+
+
+@pytest.mark.anyio
+async def test_not_ready_when_database_is_unreachable(client, monkeypatch, caplog):
+    # A port the OS just handed out and nothing listens on any more
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    unreachable = create_async_engine(f"postgresql+asyncpg://user:pw@127.0.0.1:{port}/db")
+    monkeypatch.setattr(health, "async_engine", unreachable)
+    res = await client.get("/health/ready")
+    await unreachable.dispose()
+    assert res.status_code == 503
+    # The connection error stays in the server log
+    assert res.json()["checks"]["database"] == "unavailable"
+    assert str(port) not in res.text
+    assert str(port) in caplog.text
+
+
+@pytest.mark.anyio
+async def test_not_ready_when_threadpool_is_saturated(client, at_head, monkeypatch):
+    class Saturated:
+        borrowed_tokens = total_tokens = 40
+
+    monkeypatch.setattr(
+        health.anyio.to_thread, "current_default_thread_limiter", lambda: Saturated
+    )
+    res = await client.get("/health/ready")
+    assert res.status_code == 503
+    assert res.json()["checks"]["threadpool"] == "all 40 threads busy"
+
+
+@pytest.mark.anyio
+async def test_ready_result_is_cached(client, at_head, monkeypatch):
+    calls = []
+    check = health._check
+
+    async def counted():
+        calls.append(1)
+        return await check()
+
+    monkeypatch.setattr(health, "_check", counted)
+    for _ in range(3):
+        assert (await client.get("/health/ready")).status_code == 200
+    assert len(calls) == 1
+
+
+def test_pool_headroom(tmp_path):
+    small = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=1, max_overflow=0)
+    assert health.pool_headroom(small.pool) is None
+    with small.connect():
+        assert health.pool_headroom(small.pool) == "all 1 connections checked out"
+    small.dispose()
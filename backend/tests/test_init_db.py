@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import text
+
+from app.core import migrations
+from app.core.migrations import check_schema, head_revision
+from app.models import User
+from app.models.case_study import CaseStudy
+from app.models.requirement import Requirement
+from app.models.service import Service
+from app.models.site_content import SiteContent
+from app.models import testimonial
+from app.scripts.init_db import seed_all
+from tests.conftest import engine
+
+SEEDED = (User, Requirement, CaseStudy, Service, testimonial.Testimonial, SiteContent)
+
+
+def counts(db):
+    return {model.__tablename__: db.query(model).count() for model in SEEDED}
+
+
+def test_seed_all_is_idempotent(db):
+    seed_all(db)
+    db.commit()
+    first = counts(db)
+    assert all(first.values())
+
+    seed_all(db)
+    db.commit()
+    assert counts(db) == first
+
+
+def test_seed_all_only_fills_empty_tables(db):
+    db.add(Service(slug="existing", title="Existing", description="x", icon="x"))
+    db.commit()
+    seed_all(db)
+    db.commit()
+    assert [service.slug for service in db.query(Service)] == ["existing"]
+    assert db.query(testimonial.Testimonial).count() > 0
+
+
+def test_check_schema_requires_head(monkeypatch):
+    monkeypatch.setattr(migrations, "engine", engine)
+    with pytest.raises(RuntimeError, match="app.scripts.init_db"):
+        check_schema()
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        conn.execute(text("INSERT INTO alembic_version VALUES (:rev)"), {"rev": head_revision()})
+    try:
+        check_schema()
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE alembic_version"))
@@ -0,0 +1,148 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.job import Job
+from app.models.service import Service
+from app.services import jobs
+from app.services.jobs import Worker, backoff, enqueue, queue_status
+from tests.conftest import TestSession
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Register test handlers and record their payloads."""
+    calls = []
+
+    def record(db, payload):
+        calls.append(payload["n"])
+
+    def explode(db, payload):
+        db.add(Service(slug="half-done", title="x", description="x", icon="x"))
+        db.flush()
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(jobs.HANDLERS, "test.record", record)
+    monkeypatch.setitem(jobs.HANDLERS, "test.explode", explode)
+    return calls
+
+
+def test_jobs_run_by_priority_then_age(db, calls):
+    enqueue(db, "test.record", {"n": 1})
+    enqueue(db, "test.record", {"n": 2}, priority=5)
+    enqueue(db, "test.record", {"n": 3})
+    enqueue(db, "test.record", {"n": 4}, delay=3600)
+    db.commit()
+
+    worker = Worker(sessions=TestSession)
+    while worker.run_once():
+        pass
+    assert calls == [2, 1, 3]
+    # The delayed job stays queued
+    assert [job.payload["n"] for job in db.query(Job)] == [4]
+
+
+def test_uncommitted_jobs_are_not_run(db, calls):
+    enqueue(db, "test.record", {"n": 1})
+    db.rollback()
+    assert not Worker(sessions=TestSession).run_once()
+
+
+def test_failed_job_rolls_back_and_backs_off(db, calls):
+    enqueue(db, "test.explode", max_attempts=2)
+    db.commit()
+    worker = Worker(sessions=TestSession)
+
+    assert worker.run_once()
+    db.expire_all()
+    job = db.query(Job).one()
+    assert job.attempts == 1 and job.failed_at is None and job.locked_at is None
+    assert "RuntimeError: boom" in job.last_error
+    assert db.query(Service).count() == 0
+    # Not ready again until the backoff has passed
+    assert not worker.run_once()
+    assert queue_status(db)["test.explode"]["scheduled"] == 1
+
+    job.run_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    db.commit()
+    assert worker.run_once()
+    db.expire_all()
+    job = db.query(Job).one()
+    assert job.attempts == 2 and job.failed_at is not None
+    assert not worker.run_once()
+    assert queue_status(db)["test.explode"]["failed"] == 1
+
+
+def test_abandoned_lease_is_reclaimed(db, calls):
+    enqueue(db, "test.record", {"n": 1})
+    db.commit()
+    job = db.query(Job).one()
+    job.locked_at = datetime.now(timezone.utc)
+    job.locked_by = "worker-that-is-alive"
+    db.commit()
+    assert not Worker(sessions=TestSession).run_once()
+
+    job.locked_at = datetime.now(timezone.utc) - timedelta(seconds=jobs.JOB_LEASE_SECONDS + 1)
+    db.commit()
+    assert Worker(sessions=TestSession).run_once()
+    assert calls == [1]
+
+
+def test_lease_expired_on_last_attempt_fails_the_job(db, calls):
+    enqueue(db, "test.record", {"n": 1}, max_attempts=2)
+    db.commit()
+    job = db.query(Job).one()
+    job.attempts = 2
+    job.locked_at = datetime.now(timezone.utc) - timedelta(seconds=jobs.JOB_LEASE_SECONDS + 1)
+    job.locked_by = "worker-that-crashed"
+    db.commit()
+
+    assert not Worker(sessions=TestSession).run_once()
+    assert calls == []
+    db.expire_all()
+    job = db.query(Job).one()
+    assert job.failed_at is not None and job.locked_at is None
+    assert "worker-that-crashed expired after 2 attempts" in job.last_error
+
+
+def test_worker_survives_database_errors(monkeypatch, caplog):
+    stop = threading.Event()
+    waits = []
+    outcomes = iter([RuntimeError("connection refused"), RuntimeError("again"), True, False])
+
+    def run_once(self):
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def wait(timeout):
+        waits.append(timeout)
+        if len(waits) == 3:
+            stop.set()
+
+    monkeypatch.setattr(Worker, "run_once", run_once)
+    monkeypatch.setattr(stop, "wait", wait)
+    Worker(sessions=TestSession, name="w").run(stop, poll_interval=1)
+
+    # Doubling pauses after each error, then the normal poll once empty
+    assert waits == [2, 4, 1]
+    assert "Job worker w failed" in caplog.text and "connection refused" in caplog.text
+
+
+def test_unknown_kind_fails_like_any_error(db):
+    enqueue(db, "test.missing", max_attempts=1)
+    db.commit()
+    assert Worker(sessions=TestSession).run_once()
+    db.expire_all()
+    assert "No handler registered" in db.query(Job).one().last_error
+
+
+def test_backoff_doubles_up_to_the_cap():
+    assert [backoff(n) for n in (1, 2, 3)] == [
+        jobs.JOB_BACKOFF_SECONDS,
+        jobs.JOB_BACKOFF_SECONDS * 2,
+        jobs.JOB_BACKOFF_SECONDS * 4,
+    ]
+    assert backoff(100) == jobs.JOB_BACKOFF_MAX_SECONDS
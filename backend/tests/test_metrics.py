@@ -0,0 +1,34 @@
+import pytest
+
+from app.core.database import CheckoutWaitStats, TimedQueuePool, pool_status
+
+
+@pytest.mark.anyio
+async def test_metrics_reports_both_pools(client):
+    res = await client.get("/metrics")
+    assert res.status_code == 200
+    pools = res.json()["db_pool"]
+    for name in ("sync", "async"):
+        assert set(pools[name]) >= {"size", "checked_in", "checked_out", "overflow", "checkout_wait"}
+    assert set(res.json()["password_hashing"]) >= {"workers", "in_flight", "rejected", "queue_wait"}
+
+
+def test_timed_pool_records_checkout_waits():
+    import sqlite3
+
+    pool = TimedQueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0)
+    conn = pool.connect()
+    status = pool_status(pool)
+    assert status["checked_out"] == 1
+    assert status["checkout_wait"]["count"] == 1
+    conn.close()
+
+    recreated = pool.recreate()
+    assert recreated.checkout_wait is pool.checkout_wait
+
+
+def test_checkout_wait_stats():
+    stats = CheckoutWaitStats()
+    stats.observe(0.5)
+    stats.observe(0.25)
+    assert stats.snapshot() == {"count": 2, "total_seconds": 0.75, "max_seconds": 0.5}
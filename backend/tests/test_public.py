@@ -60,3 +60,218 @@ async def test_submit_requirement_invalid_type(client):
     payload = {**VALID_REQUIREMENT, "type": "invalid_type"}
     res = await client.post("/api/public/requirements", json=payload)
     assert res.status_code == 400
+
+
+VALID_CASE_STUDY = {
+    "slug": "ruth-ai",
+    "title": "Ruth AI",
+    "role": "Architect",
+    "description": "Conversational assistant.",
+    "industry": "AI / ML",
+    "technologies": [{"name": "Python", "category": "Language"}],
+}
+
+
+@pytest.mark.anyio
+async def test_case_study_list_reflects_admin_writes(client, editor_headers):
+    res = await client.get("/api/public/case-studies")
+    assert res.status_code == 200
+    assert res.json() == []
+
+    res = await client.post(
+        "/api/admin/case-studies", headers=editor_headers, json=VALID_CASE_STUDY
+    )
+    assert res.status_code == 201
+    study_id = res.json()["id"]
+
+    res = await client.get("/api/public/case-studies")
+    assert [s["slug"] for s in res.json()] == ["ruth-ai"]
+
+    res = await client.delete(
+        f"/api/admin/case-studies/{study_id}", headers=editor_headers
+    )
+    assert res.status_code == 204
+
+    res = await client.get("/api/public/case-studies")
+    assert res.json() == []
+
+
+@pytest.mark.anyio
+async def test_site_content_reflects_admin_writes(client, editor_headers):
+    res = await client.post(
+        "/api/admin/site-content",
+        headers=editor_headers,
+        json={"key": "hero_description", "content": "Before"},
+    )
+    assert res.status_code == 201
+    content_id = res.json()["id"]
+
+    res = await client.get("/api/public/site-content?key=hero_description")
+    assert res.json()[0]["content"] == "Before"
+
+    res = await client.patch(
+        f"/api/admin/site-content/{content_id}",
+        headers=editor_headers,
+        json={"content": "After"},
+    )
+    assert res.status_code == 200
+
+    res = await client.get("/api/public/site-content?key=hero_description")
+    assert res.json()[0]["content"] == "After"
+
+
+def _write_from_another_worker(db):
+    """A case study committed without touching this worker's cache."""
+    from app.models.case_study import CaseStudy
+
+    db.add(CaseStudy(**VALID_CASE_STUDY))
+    db.commit()
+
+
+@pytest.mark.anyio
+async def test_catalog_invalidation_from_another_worker(client, db):
+    from app.core.deps import revocations
+
+    assert (await client.get("/api/public/case-studies")).json() == []
+    _write_from_another_worker(db)
+    assert (await client.get("/api/public/case-studies")).json() == []
+
+    # What the listener does when the other worker's NOTIFY arrives
+    revocations._on_notify(None, 0, "catalog_invalidated", "case_studies")
+    res = await client.get("/api/public/case-studies")
+    assert [s["slug"] for s in res.json()] == ["ruth-ai"]
+
+
+@pytest.mark.anyio
+async def test_catalog_cache_bypassed_while_not_receiving_invalidations(
+    client, db, monkeypatch
+):
+    from app.core.deps import revocations
+
+    monkeypatch.setattr(revocations, "connected", False)
+    assert (await client.get("/api/public/case-studies")).json() == []
+    _write_from_another_worker(db)
+    res = await client.get("/api/public/case-studies")
+    assert [s["slug"] for s in res.json()] == ["ruth-ai"]
+
+
+@pytest.mark.anyio
+async def test_catalog_lists_send_etag(client):
+    for path in ("case-studies", "services", "testimonials", "site-content"):
+        res = await client.get(f"/api/public/{path}")
+        assert res.status_code == 200
+        assert res.headers["etag"].startswith('"')
+        assert res.headers["cache-control"] == "no-cache"
+
+
+@pytest.mark.anyio
+async def test_if_none_match_returns_304(client):
+    res = await client.get("/api/public/testimonials")
+    etag = res.headers["etag"]
+
+    res = await client.get("/api/public/testimonials", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert res.headers["etag"] == etag
+
+
+@pytest.mark.anyio
+async def test_if_none_match_on_cache_miss_skips_loading(client, monkeypatch):
+    from app.api import public
+    from app.core.cache import catalog_cache
+
+    res = await client.get("/api/public/case-studies")
+    etag = res.headers["etag"]
+    catalog_cache.clear()
+
+    def fail(db):
+        raise AssertionError("rows should not be loaded")
+
+    monkeypatch.setattr(public, "_load_case_studies", fail)
+    res = await client.get("/api/public/case-studies", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_etag_changes_after_admin_write(client, editor_headers):
+    res = await client.get("/api/public/case-studies")
+    etag = res.headers["etag"]
+
+    await client.post(
+        "/api/admin/case-studies", headers=editor_headers, json=VALID_CASE_STUDY
+    )
+
+    res = await client.get("/api/public/case-studies", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["etag"] != etag
+    assert len(res.json()) == 1
+
+
+@pytest.mark.anyio
+async def test_home_bundle(client, editor_headers):
+    await client.post(
+        "/api/admin/case-studies", headers=editor_headers, json=VALID_CASE_STUDY
+    )
+    for key in ("hero_description", "about_story"):
+        await client.post(
+            "/api/admin/site-content",
+            headers=editor_headers,
+            json={"key": key, "content": key},
+        )
+
+    res = await client.get("/api/public/bundle/home")
+    assert res.status_code == 200
+    data = res.json()
+    assert [s["slug"] for s in data["case_studies"]] == ["ruth-ai"]
+    assert data["testimonials"] == []
+    assert [c["key"] for c in data["site_content"]] == ["hero_description"]
+
+
+@pytest.mark.anyio
+async def test_portfolio_and_about_bundles(client):
+    res = await client.get("/api/public/bundle/portfolio")
+    assert res.status_code == 200
+    assert set(res.json()) == {"case_studies", "testimonials", "site_content"}
+
+    res = await client.get("/api/public/bundle/about")
+    assert res.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_bundle_etag_tracks_its_parts(client, editor_headers):
+    res = await client.get("/api/public/bundle/home")
+    etag = res.headers["etag"]
+
+    res = await client.get("/api/public/bundle/home", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+
+    await client.post(
+        "/api/admin/site-content",
+        headers=editor_headers,
+        json={"key": "home_services", "content": "Services"},
+    )
+
+    res = await client.get("/api/public/bundle/home", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["etag"] != etag
+    assert res.json()["site_content"][0]["key"] == "home_services"
+
+
+@pytest.mark.anyio
+async def test_case_study_list_returns_summaries(client, editor_headers):
+    await client.post(
+        "/api/admin/case-studies",
+        headers=editor_headers,
+        json={**VALID_CASE_STUDY, "problem": "Long problem statement", "impact": "Big"},
+    )
+
+    res = await client.get("/api/public/case-studies")
+    summary = res.json()[0]
+    assert summary["visual"] == {"color": "primary", "icon": "code"}
+    assert "problem" not in summary
+    assert "gallery" not in summary
+
+    res = await client.get("/api/public/case-studies/ruth-ai")
+    assert res.status_code == 200
+    assert res.json()["problem"] == "Long problem statement"
+    assert res.json()["impact"] == "Big"
@@ -0,0 +1,189 @@
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import func, select
+from starlette.requests import Request
+
+from app.core import rate_limit_storage
+from app.core.limiter import client_address, rate_limit_key
+from app.core.rate_limit_storage import SQLStorage, counters
+from app.core.security import create_access_token
+from tests.conftest import ADMIN_EMAIL
+from tests.test_public import VALID_REQUIREMENT
+
+
+def make_storage(path=None):
+    path = path or os.path.join(tempfile.mkdtemp(), "limits.db")
+    return SQLStorage(f"sql+sqlite:///{path}", evict_interval=3600)
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock(6000.0)  # the start of a 60s window
+    monkeypatch.setattr(rate_limit_storage.time, "time", clock.time)
+    return clock
+
+
+@pytest.mark.anyio
+async def test_requirement_submissions_are_limited(client):
+    for _ in range(5):
+        res = await client.post("/api/public/requirements", json=VALID_REQUIREMENT)
+        assert res.status_code == 201
+    res = await client.post("/api/public/requirements", json=VALID_REQUIREMENT)
+    assert res.status_code == 429
+
+
+def make_request(peer, headers=()):
+    return Request({
+        "type": "http",
+        "client": (peer, 50000),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+    })
+
+
+def test_forwarded_for_is_read_from_trusted_proxy():
+    request = make_request("172.18.0.5", [("X-Forwarded-For", "198.51.100.7, 10.0.0.2")])
+    assert client_address(request) == "198.51.100.7"
+
+    request = make_request("172.18.0.5", [("X-Real-IP", "198.51.100.8")])
+    assert client_address(request) == "198.51.100.8"
+
+
+def test_forwarded_for_from_untrusted_peer_is_ignored():
+    request = make_request("203.0.113.9", [("X-Forwarded-For", "198.51.100.7")])
+    assert client_address(request) == "203.0.113.9"
+
+
+def test_client_cannot_spoof_past_the_proxy():
+    # nginx appends the real peer, so a forged leading entry is skipped
+    request = make_request("172.18.0.5", [("X-Forwarded-For", "1.1.1.1, 198.51.100.7")])
+    assert client_address(request) == "198.51.100.7"
+
+
+def test_authenticated_requests_are_keyed_by_user():
+    token = create_access_token("1f6b3a52-8f7e-4f59-9c1a-2f0e4b6f7a10", "client")
+    request = make_request("172.18.0.5", [("Authorization", f"Bearer {token}")])
+    assert rate_limit_key(request) == "user:1f6b3a52-8f7e-4f59-9c1a-2f0e4b6f7a10"
+
+    request = make_request("172.18.0.5", [("Authorization", "Bearer not-a-token")])
+    assert rate_limit_key(request) == "ip:172.18.0.5"
+
+
+@pytest.mark.anyio
+async def test_login_budget_is_per_forwarded_client(client, admin_user):
+    attacker = {"X-Forwarded-For": "198.51.100.7"}
+    body = {"email": ADMIN_EMAIL, "password": "wrong"}
+    # Logins cost 10 of the 60/minute budget
+    for _ in range(6):
+        res = await client.post("/api/auth/login", json=body, headers=attacker)
+        assert res.status_code == 401
+    res = await client.post("/api/auth/login", json=body, headers=attacker)
+    assert res.status_code == 429
+
+    res = await client.post(
+        "/api/auth/login", json=body, headers={"X-Forwarded-For": "198.51.100.8"}
+    )
+    assert res.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_signed_tokens_do_not_escape_the_login_limit(client, admin_user):
+    body = {"email": ADMIN_EMAIL, "password": "wrong"}
+    statuses = []
+    for n in range(7):
+        token = create_access_token(f"00000000-0000-0000-0000-00000000000{n}", "client")
+        res = await client.post(
+            "/api/auth/login", json=body, headers={"Authorization": f"Bearer {token}"}
+        )
+        statuses.append(res.status_code)
+    # Still one address, so the 60/minute budget runs out after six logins
+    assert statuses == [401] * 6 + [429]
+
+
+def test_workers_share_counters(clock):
+    path = os.path.join(tempfile.mkdtemp(), "limits.db")
+    worker_a, worker_b = make_storage(path), make_storage(path)
+
+    assert worker_a.acquire_sliding_window_entry("login/1.2.3.4", 3, 60)
+    assert worker_b.acquire_sliding_window_entry("login/1.2.3.4", 3, 60)
+    assert worker_a.acquire_sliding_window_entry("login/1.2.3.4", 3, 60)
+    assert not worker_b.acquire_sliding_window_entry("login/1.2.3.4", 3, 60)
+
+
+def test_previous_window_is_weighted(clock):
+    storage = make_storage()
+    for _ in range(4):
+        assert storage.acquire_sliding_window_entry("key", 4, 60)
+    assert not storage.acquire_sliding_window_entry("key", 4, 60)
+
+    # A quarter into the next window, 3/4 of the previous count still applies
+    clock.now += 75
+    assert storage.get_sliding_window("key", 60)[0::2] == (4, 0)
+    assert storage.acquire_sliding_window_entry("key", 4, 60)
+    assert not storage.acquire_sliding_window_entry("key", 4, 60)
+
+    # Two windows later nothing carries over
+    clock.now += 120
+    assert storage.get_sliding_window("key", 60)[0::2] == (0, 0)
+    for _ in range(4):
+        assert storage.acquire_sliding_window_entry("key", 4, 60)
+
+
+def test_each_key_is_a_single_row_and_expired_rows_are_evicted(clock):
+    storage = make_storage()
+    for _ in range(10):
+        storage.acquire_sliding_window_entry("a", 100, 60)
+        clock.now += 30
+    storage.acquire_sliding_window_entry("b", 100, 60)
+
+    with storage.engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(counters)).scalar() == 2
+
+    clock.now += 180
+    assert storage.evict_expired() == 2
+    assert storage.get_sliding_window("a", 60)[2] == 0
+
+
+def test_fixed_window_counter(clock):
+    storage = make_storage()
+    assert storage.incr("key", 60) == 1
+    assert storage.incr("key", 60, amount=2) == 3
+    assert storage.get("key") == 3
+    assert storage.get_expiry("key") == 6060
+
+    clock.now += 61
+    assert storage.get("key") == 0
+    assert storage.incr("key", 60) == 1
+
+
+@pytest.mark.anyio
+async def test_async_route_checks_run_off_the_event_loop(client, monkeypatch):
+    import asyncio
+
+    from app.core.limiter import limiter
+
+    on_loop = []
+    check = limiter._check_request_limit
+
+    def recording_check(*args):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return check(*args)
+
+    monkeypatch.setattr(limiter, "_check_request_limit", recording_check)
+    res = await client.post("/api/public/requirements", json=VALID_REQUIREMENT)
+    assert res.status_code == 201
+    # One check for the route limit and the shared budget together, on a thread
+    assert on_loop == [False]
@@ -0,0 +1,100 @@
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api import public
+from app.core import database
+from app.core.cache import catalog_cache
+from app.core.database import ReplicaRouter, TimedAsyncQueuePool, get_async_read_db
+from tests.conftest import DB_PATH, AsyncTestSession
+
+UNREACHABLE = os.path.join(tempfile.mkdtemp(), "missing", "replica.db")
+
+
+def make_engine(path):
+    return create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=TimedAsyncQueuePool)
+
+
+async def read_session_engine():
+    """Run the dependency the way FastAPI does and return the engine it picked."""
+    dependency = get_async_read_db()
+    db = await dependency.__anext__()
+    try:
+        await db.execute(text("SELECT 1"))
+        return db.bind
+    finally:
+        await dependency.aclose()
+
+
+@pytest.mark.anyio
+async def test_reads_skip_unreachable_replica(monkeypatch):
+    down, up = make_engine(UNREACHABLE), make_engine(DB_PATH)
+    router = ReplicaRouter([down, up], retry_after=60)
+    monkeypatch.setattr(database, "replica_router", router)
+
+    assert await read_session_engine() is up
+    assert [r["healthy"] for r in router.status()] == [False, True]
+    # The failed replica stays out of rotation until retry_after passes.
+    assert list(router.candidates()) == [up]
+    await down.dispose()
+    await up.dispose()
+
+
+@pytest.mark.anyio
+async def test_reads_fall_back_to_primary(monkeypatch):
+    down = make_engine(UNREACHABLE)
+    monkeypatch.setattr(database, "replica_router", ReplicaRouter([down], retry_after=60))
+    monkeypatch.setattr(database, "AsyncSessionLocal", AsyncTestSession)
+
+    assert await read_session_engine() is AsyncTestSession.kw["bind"]
+    await down.dispose()
+
+
+@pytest.mark.anyio
+async def test_no_replicas_reads_from_primary(monkeypatch):
+    monkeypatch.setattr(database, "replica_router", ReplicaRouter([], retry_after=60))
+    monkeypatch.setattr(database, "AsyncSessionLocal", AsyncTestSession)
+
+    assert await read_session_engine() is AsyncTestSession.kw["bind"]
+
+
+def test_replicas_take_turns():
+    a, b = object(), object()
+    router = ReplicaRouter([a, b], retry_after=0)
+    assert [next(router.candidates()) for _ in range(4)] == [a, b, a, b]
+
+
+@pytest.mark.anyio
+async def test_catalog_reload_after_a_write_reads_the_primary(client, auth_headers, monkeypatch):
+    # Treat the test database as a replica and count primary sessions
+    monkeypatch.setattr(
+        database, "replica_router", ReplicaRouter([AsyncTestSession.kw["bind"]], retry_after=60)
+    )
+    opened = []
+
+    def primary_session():
+        opened.append(1)
+        return AsyncTestSession()
+
+    monkeypatch.setattr(public, "AsyncSessionLocal", primary_session)
+
+    assert (await client.get("/api/public/case-studies")).status_code == 200
+    assert opened == []
+
+    res = await client.post("/api/admin/case-studies", json={
+        "slug": "fresh", "title": "Fresh", "role": "Lead", "description": "New",
+        "industry": "Software", "technologies": [],
+    }, headers=auth_headers)
+    assert res.status_code == 201
+    res = await client.get("/api/public/case-studies")
+    assert [s["slug"] for s in res.json()] == ["fresh"]
+    assert opened == [1]
+
+    # Once the lag window has passed, replicas serve the reload again
+    monkeypatch.setattr(catalog_cache, "recent_window", 0)
+    catalog_cache.invalidate("case_studies")
+    assert (await client.get("/api/public/case-studies")).status_code == 200
+    assert opened == [1]
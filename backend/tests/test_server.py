@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app import server
+from app.core import config
+from app.scripts.profile_startup import BACKEND_DIR
+
+
+@pytest.mark.parametrize(
+    "cpu_max, expected",
+    [("max 100000", 4), ("150000 100000", 2), ("50000 100000", 1), ("800000 100000", 4)],
+)
+def test_available_cpus_honours_cgroup_quota(tmp_path, monkeypatch, cpu_max, expected):
+    monkeypatch.setattr(config.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3}, raising=False)
+    path = tmp_path / "cpu.max"
+    path.write_text(cpu_max + "\n")
+    monkeypatch.setattr(config, "CGROUP_CPU_MAX", str(path))
+    assert config.available_cpus() == expected
+
+
+def test_available_cpus_without_cgroup(tmp_path, monkeypatch):
+    monkeypatch.setattr(config.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+    monkeypatch.setattr(config, "CGROUP_CPU_MAX", str(tmp_path / "missing"))
+    assert config.available_cpus() == 2
+
+
+@pytest.mark.parametrize("workers", ["1", "2", "4", "8"])
+def test_default_pools_fit_the_connection_budget(workers):
+    code = (
+        "from app.core.config import *\n"
+        "print(WEB_CONCURRENCY * (2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) + RATE_LIMIT_POOL_SIZE + 1))"
+    )
+    env = {**os.environ, "DB_CONNECTION_BUDGET": "80", "WEB_CONCURRENCY": workers}
+    for name in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "RATE_LIMIT_POOL_SIZE"):
+        env.pop(name, None)
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    assert 0 < int(result.stdout) <= 80
+
+
+def test_server_preloads_into_uvicorn_workers():
+    cfg = server.Server(server.options()).cfg
+    assert cfg.preload_app
+    assert cfg.worker_class_str == "uvicorn_worker.UvicornWorker"
+    assert cfg.max_requests == server.WEB_MAX_REQUESTS
+    assert cfg.workers == config.WEB_CONCURRENCY
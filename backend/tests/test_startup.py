@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+from app.scripts.profile_startup import BACKEND_DIR, ImportTime, parse_importtime
+
+
+def test_web_import_path_skips_deploy_and_worker_only_modules():
+    code = (
+        "import sys, app.main\n"
+        "print(' '.join(m for m in ('alembic', 'PIL', 'app.scripts.init_db') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     _io\n"
+        "import time:      2985 |      78047 |   app.core.database\n"
+    )
+    assert parse_importtime(output) == [
+        ImportTime("_io", 120, 120),
+        ImportTime("app.core.database", 2985, 78047),
+    ]
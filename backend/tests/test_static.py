@@ -0,0 +1,88 @@
+import hashlib
+
+import pytest
+
+from app.core.static import IMMUTABLE
+from app.main import app
+
+BODY = bytes(range(256)) * 64
+SHA256 = hashlib.sha256(BODY).hexdigest()
+
+
+@pytest.fixture
+async def url(client, auth_headers):
+    res = await client.post(
+        "/api/admin/uploads", files={"file": ("image.png", BODY, "image/png")}, headers=auth_headers
+    )
+    assert res.status_code == 200
+    return res.json()["url"]
+
+
+@pytest.fixture
+def uploads_mount():
+    return next(route for route in app.routes if getattr(route, "name", None) == "uploads").app
+
+
+@pytest.mark.anyio
+async def test_uploads_are_immutable_with_content_hash_etag(client, url):
+    res = await client.get(url)
+    assert res.status_code == 200
+    assert res.content == BODY
+    assert res.headers["cache-control"] == IMMUTABLE
+    assert res.headers["etag"] == f'"{SHA256}"'
+    assert res.headers["accept-ranges"] == "bytes"
+
+    res = await client.get(url, headers={"If-None-Match": f'"{SHA256}"'})
+    assert res.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_byte_ranges(client, url):
+    res = await client.get(url, headers={"Range": "bytes=10-19"})
+    assert res.status_code == 206
+    assert res.content == BODY[10:20]
+    assert res.headers["content-range"] == f"bytes 10-19/{len(BODY)}"
+    assert res.headers["content-length"] == "10"
+
+    res = await client.get(url, headers={"Range": "bytes=-5"})
+    assert res.status_code == 206
+    assert res.content == BODY[-5:]
+
+    res = await client.get(url, headers={"Range": f"bytes={len(BODY) - 3}-99999999"})
+    assert res.content == BODY[-3:]
+
+    res = await client.get(url, headers={"Range": f"bytes={len(BODY)}-"})
+    assert res.status_code == 416
+    assert res.headers["content-range"] == f"bytes */{len(BODY)}"
+
+
+@pytest.mark.anyio
+async def test_whole_file_when_range_cannot_be_honoured(client, url):
+    # Several ranges, or an If-Range for another version, get the full body
+    for headers in (
+        {"Range": "bytes=0-1,5-6"},
+        {"Range": "bytes=0-9", "If-Range": '"stale"'},
+    ):
+        res = await client.get(url, headers=headers)
+        assert res.status_code == 200
+        assert res.content == BODY
+
+    res = await client.get(url, headers={"Range": "bytes=0-9", "If-Range": f'"{SHA256}"'})
+    assert res.status_code == 206
+
+
+@pytest.mark.anyio
+async def test_accel_redirect_hands_the_file_to_nginx(client, url, uploads_mount, monkeypatch):
+    monkeypatch.setattr(uploads_mount, "accel_prefix", "/_uploads/")
+    res = await client.get(url)
+    assert res.status_code == 200
+    assert res.content == b""
+    assert res.headers["x-accel-redirect"] == "/_uploads/" + url.removeprefix("/uploads/")
+    assert res.headers["cache-control"] == IMMUTABLE
+    assert res.headers["content-type"] == "image/png"
+
+
+@pytest.mark.anyio
+async def test_partial_uploads_are_not_served(client, url):
+    res = await client.get("/uploads/.incoming/anything")
+    assert res.status_code == 404
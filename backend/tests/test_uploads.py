@@ -0,0 +1,254 @@
+import hashlib
+import os
+from uuid import UUID
+
+import pytest
+
+from app.models.upload import Upload, UploadReference
+from app.services import uploads
+from app.services.uploads import referenced_names, store_stream
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 2048
+
+
+@pytest.mark.anyio
+async def test_upload_is_written_to_disk(client, auth_headers):
+    res = await client.post(
+        "/api/admin/uploads",
+        files={"file": ("diagram one.png", PNG, "image/png")},
+        headers=auth_headers,
+    )
+    assert res.status_code == 200
+    sha256 = hashlib.sha256(PNG).hexdigest()
+    url = res.json()["url"]
+    assert url == f"/uploads/{sha256[:2]}/{sha256}.png"
+
+    with open(os.path.join(uploads.UPLOAD_DIR, url.removeprefix("/uploads/")), "rb") as f:
+        assert f.read() == PNG
+
+
+@pytest.mark.anyio
+async def test_oversized_upload_is_rejected_and_cleaned_up(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(uploads, "MAX_UPLOAD_SIZE", len(PNG) - 1)
+    before = set(os.listdir(uploads.UPLOAD_DIR))
+
+    res = await client.post(
+        "/api/admin/uploads",
+        files={"file": ("big.png", PNG, "image/png")},
+        headers=auth_headers,
+    )
+    assert res.status_code == 400
+    assert "too large" in res.json()["detail"]
+    assert set(os.listdir(uploads.UPLOAD_DIR)) == before
+    assert os.listdir(uploads.INCOMING_DIR) == []
+
+
+@pytest.mark.anyio
+async def test_upload_rejects_disallowed_extension(client, auth_headers):
+    res = await client.post(
+        "/api/admin/uploads",
+        files={"file": ("script.exe", b"MZ", "application/octet-stream")},
+        headers=auth_headers,
+    )
+    assert res.status_code == 400
+
+
+async def upload(client, headers, name="logo.png", body=PNG):
+    res = await client.post(
+        "/api/admin/uploads", files={"file": (name, body, "image/png")}, headers=headers
+    )
+    assert res.status_code == 200
+    return res.json()
+
+
+@pytest.mark.anyio
+async def test_identical_uploads_share_one_file(client, auth_headers, editor_headers, db):
+    first = await upload(client, auth_headers, "logo.png")
+    second = await upload(client, editor_headers, "Logo copy.PNG")
+    other = await upload(client, auth_headers, "other.png", PNG + b"\0")
+
+    assert second == first
+    assert other["id"] != first["id"]
+    rows = db.query(Upload).filter(Upload.sha256 == hashlib.sha256(PNG).hexdigest()).all()
+    assert [(r.filename, r.size) for r in rows] == [("logo.png", len(PNG))]
+
+
+@pytest.mark.anyio
+async def test_gallery_and_metadata_references_are_tracked(client, auth_headers, db):
+    logo = await upload(client, auth_headers)
+    shot = await upload(client, auth_headers, "shot.png", PNG + b"\0")
+
+    res = await client.post("/api/admin/case-studies", json={
+        "slug": "with-gallery",
+        "title": "With Gallery",
+        "role": "Lead",
+        "description": "Has images",
+        "industry": "Software",
+        "technologies": [],
+        "gallery": [
+            {"url": logo["url"], "caption": "Logo", "type": "image"},
+            {"url": shot["url"], "caption": "Shot", "type": "image"},
+            {"url": "https://cdn.example.com/x.png", "caption": "External", "type": "image"},
+        ],
+    }, headers=auth_headers)
+    assert res.status_code == 201
+    study_id = res.json()["id"]
+
+    res = await client.post("/api/admin/site-content", json={
+        "key": "hero",
+        "content": "Hello",
+        "metadata": {"background": {"image": logo["url"]}},
+    }, headers=auth_headers)
+    assert res.status_code == 201
+    content_id = res.json()["id"]
+
+    def referrers(upload_id):
+        return sorted(
+            r.owner_table
+            for r in db.query(UploadReference).filter(UploadReference.upload_id == UUID(upload_id))
+        )
+
+    db.expire_all()
+    assert referrers(logo["id"]) == ["case_studies", "site_content"]
+    assert referrers(shot["id"]) == ["case_studies"]
+
+    res = await client.patch(f"/api/admin/case-studies/{study_id}", json={
+        "gallery": [{"url": logo["url"], "caption": "Logo", "type": "image"}],
+    }, headers=auth_headers)
+    assert res.status_code == 200
+    res = await client.delete(f"/api/admin/site-content/{content_id}", headers=auth_headers)
+    assert res.status_code == 204
+
+    db.expire_all()
+    assert referrers(logo["id"]) == ["case_studies"]
+    assert referrers(shot["id"]) == []
+
+
+def test_referenced_names_walks_nested_json():
+    value = {"a": ["/uploads/ab/ab.png", {"b": "/uploads/cd/cd.svg"}], "c": "/static/x.png", "d": 3}
+    assert referenced_names(value) == {"ab/ab.png", "cd/cd.svg"}
+
+
+def test_store_stream_hashes_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads, "CHUNK_SIZE", 1000)
+    path = tmp_path / "source.png"
+    path.write_bytes(PNG)
+
+    with open(path, "rb") as source:
+        stored = store_stream(source, "source.png")
+    assert stored.size == len(PNG)
+    assert stored.sha256 == hashlib.sha256(PNG).hexdigest()
+
+
+# ── Resumable sessions ──
+
+
+async def create_session(client, headers, filename="diagram.png", size=len(PNG)):
+    res = await client.post(
+        "/api/admin/uploads/sessions", json={"filename": filename, "size": size}, headers=headers
+    )
+    assert res.status_code == 201
+    return res.json()
+
+
+async def append(client, headers, session_id, offset, body):
+    return await client.patch(
+        f"/api/admin/uploads/sessions/{session_id}",
+        content=body,
+        headers={**headers, "Upload-Offset": str(offset)},
+    )
+
+
+@pytest.mark.anyio
+async def test_resumable_upload(client, auth_headers):
+    session = await create_session(client, auth_headers)
+    assert session["offset"] == 0
+    half = len(PNG) // 2
+
+    res = await append(client, auth_headers, session["id"], 0, PNG[:half])
+    assert res.json()["offset"] == half
+
+    # A retry of the first chunk is told where to resume from
+    res = await append(client, auth_headers, session["id"], 0, PNG[:half])
+    assert res.status_code == 409
+    assert res.headers["upload-offset"] == str(half)
+
+    res = await client.get(f"/api/admin/uploads/sessions/{session['id']}", headers=auth_headers)
+    assert res.json()["offset"] == half
+
+    res = await client.post(
+        f"/api/admin/uploads/sessions/{session['id']}/complete", headers=auth_headers
+    )
+    assert res.status_code == 409
+
+    res = await append(client, auth_headers, session["id"], half, PNG[half:])
+    assert res.json()["offset"] == len(PNG)
+    res = await client.post(
+        f"/api/admin/uploads/sessions/{session['id']}/complete", headers=auth_headers
+    )
+    assert res.status_code == 200
+    sha256 = hashlib.sha256(PNG).hexdigest()
+    assert res.json()["url"] == f"/uploads/{sha256[:2]}/{sha256}.png"
+    with open(os.path.join(uploads.UPLOAD_DIR, sha256[:2], f"{sha256}.png"), "rb") as f:
+        assert f.read() == PNG
+
+    res = await client.get(f"/api/admin/uploads/sessions/{session['id']}", headers=auth_headers)
+    assert res.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_chunk_appended_between_open_and_lock_is_seen(client, auth_headers, monkeypatch):
+    from app.services import upload_sessions
+
+    session = await create_session(client, auth_headers)
+    flock = upload_sessions.fcntl.flock
+
+    def finish_other_writer_first(fd, operation):
+        # A retry of the same chunk that got its lock and wrote after our open
+        with open(os.path.join(upload_sessions.SESSIONS_DIR, session["id"]), "ab") as other:
+            other.write(PNG[:10])
+        monkeypatch.setattr(upload_sessions.fcntl, "flock", flock)
+        flock(fd, operation)
+
+    monkeypatch.setattr(upload_sessions.fcntl, "flock", finish_other_writer_first)
+    res = await append(client, auth_headers, session["id"], 0, PNG[:10])
+    assert res.status_code == 409
+    assert res.headers["upload-offset"] == "10"
+    res = await client.get(f"/api/admin/uploads/sessions/{session['id']}", headers=auth_headers)
+    assert res.json()["offset"] == 10
+
+
+@pytest.mark.anyio
+async def test_session_rejects_bytes_past_declared_size(client, auth_headers):
+    session = await create_session(client, auth_headers, size=10)
+    res = await append(client, auth_headers, session["id"], 0, b"0123456789abc")
+    assert res.status_code == 400
+    res = await client.get(f"/api/admin/uploads/sessions/{session['id']}", headers=auth_headers)
+    assert res.json()["offset"] == 0
+
+
+@pytest.mark.anyio
+async def test_session_applies_upload_checks(client, auth_headers, monkeypatch):
+    res = await client.post(
+        "/api/admin/uploads/sessions", json={"filename": "run.exe", "size": 10}, headers=auth_headers
+    )
+    assert res.status_code == 400
+
+    monkeypatch.setattr(uploads, "MAX_UPLOAD_SIZE", 100)
+    res = await client.post(
+        "/api/admin/uploads/sessions", json={"filename": "big.png", "size": 101}, headers=auth_headers
+    )
+    assert res.status_code == 400
+    assert "too large" in res.json()["detail"]
+
+
+@pytest.mark.anyio
+async def test_sessions_are_private_to_their_creator(client, auth_headers, editor_headers):
+    session = await create_session(client, auth_headers)
+    res = await append(client, editor_headers, session["id"], 0, PNG[:10])
+    assert res.status_code == 404
+
+    res = await client.delete(f"/api/admin/uploads/sessions/{session['id']}", headers=auth_headers)
+    assert res.status_code == 204
+    res = await client.get(f"/api/admin/uploads/sessions/{session['id']}", headers=auth_headers)
+    assert res.status_code == 404
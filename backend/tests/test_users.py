@@ -82,3 +82,45 @@ async def test_admin_cannot_delete_self(client, auth_headers, admin_user):
         headers=auth_headers,
     )
     assert res.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_role_change_revokes_existing_tokens(client, auth_headers, editor_headers, editor_user):
+    # Warm the identity cache with the editor's current token
+    res = await client.get("/api/admin/case-studies", headers=editor_headers)
+    assert res.status_code == 200
+
+    res = await client.patch(
+        f"/api/admin/users/{editor_user.id}",
+        headers=auth_headers,
+        json={"role": "admin"},
+    )
+    assert res.status_code == 200
+
+    res = await client.get("/api/admin/case-studies", headers=editor_headers)
+    assert res.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_deleted_user_token_is_rejected(client, auth_headers, editor_headers, editor_user):
+    res = await client.get("/api/admin/case-studies", headers=editor_headers)
+    assert res.status_code == 200
+
+    res = await client.delete(f"/api/admin/users/{editor_user.id}", headers=auth_headers)
+    assert res.status_code == 204
+
+    res = await client.get("/api/admin/case-studies", headers=editor_headers)
+    assert res.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_unchanged_update_keeps_tokens_valid(client, auth_headers, editor_headers, editor_user):
+    res = await client.patch(
+        f"/api/admin/users/{editor_user.id}",
+        headers=auth_headers,
+        json={"role": "editor"},
+    )
+    assert res.status_code == 200
+
+    res = await client.get("/api/admin/case-studies", headers=editor_headers)
+    assert res.status_code == 200
@@ -10,6 +10,7 @@ import {
   createCaseStudy,
   updateCaseStudy,
   deleteCaseStudy,
+  fetchPageBundle,
 } from "../client";
 
 function mockFetch(body: unknown, status = 200) {
@@ -118,6 +119,18 @@ describe("fetchRequirements", () => {
   });
 });
 
+describe("fetchPageBundle", () => {
+  it("calls GET /api/public/bundle/{page}", async () => {
+    const bundle = { case_studies: [], testimonials: [], site_content: [] };
+    const spy = mockFetch(bundle);
+
+    const result = await fetchPageBundle("home");
+
+    expect(spy).toHaveBeenCalledWith("/api/public/bundle/home", undefined);
+    expect(result).toEqual(bundle);
+  });
+});
+
 describe("fetchCaseStudiesAdmin", () => {
   it("calls GET /api/admin/case-studies with auth", async () => {
     setToken("token");
@@ -1,4 +1,4 @@
-import type { LoginResponse, Note, Requirement, RequirementStatusResponse, CaseStudy, CaseStudyFormData, Service, Testimonial, SiteContent, SiteContentFormData, UserRole, UserInfo, ClientTestimonialPayload, InviteInfo } from "../types";
+import type { LoginResponse, Note, Requirement, RequirementStatusResponse, CaseStudy, CaseStudySummary, CaseStudyFormData, Service, Testimonial, SiteContent, SiteContentFormData, PageBundle, BundlePage, UserRole, UserInfo, ClientTestimonialPayload, InviteInfo } from "../types";
 
 const API_BASE = "/api";
 
@@ -169,9 +169,9 @@ export async function createNote(id: string, content: string): Promise<Note> {
 }
 
 // Public API endpoints
-export async function fetchCaseStudies(): Promise<CaseStudy[]> {
+export async function fetchCaseStudies(): Promise<CaseStudySummary[]> {
   const res = await safeFetch(`${API_BASE}/public/case-studies`);
-  return handleResponse<CaseStudy[]>(res);
+  return handleResponse<CaseStudySummary[]>(res);
 }
 
 export async function fetchCaseStudy(slug: string): Promise<CaseStudy> {
@@ -200,6 +200,12 @@ export async function fetchSiteContent(key?: string): Promise<SiteContent[]> {
   return handleResponse<SiteContent[]>(res);
 }
 
+// Everything a public page renders, in one request
+export async function fetchPageBundle(page: BundlePage): Promise<PageBundle> {
+  const res = await safeFetch(`${API_BASE}/public/bundle/${page}`);
+  return handleResponse<PageBundle>(res);
+}
+
 // Admin: Case Study Management
 export async function fetchCaseStudiesAdmin(): Promise<CaseStudy[]> {
   const res = await safeFetch(`${API_BASE}/admin/case-studies`, {
@@ -272,7 +278,7 @@ export async function updateSiteContent(id: string, payload: Partial<SiteContent
 }
 
 // Admin: File Upload
-export async function uploadFile(file: File): Promise<{ url: string }> {
+export async function uploadFile(file: File): Promise<{ id: string; url: string }> {
   const formData = new FormData();
   formData.append("file", file);
   const headers: Record<string, string> = {};
@@ -285,7 +291,7 @@ export async function uploadFile(file: File): Promise<{ url: string }> {
     headers,
     body: formData,
   });
-  return handleResponse<{ url: string }>(res);
+  return handleResponse<{ id: string; url: string }>(res);
 }
 
 export async function deleteSiteContent(id: string): Promise<void> {
@@ -1,7 +1,7 @@
 import { useState, useEffect, useMemo } from 'react';
 import Layout from '../components/Layout';
-import { fetchTestimonials, fetchSiteContent, fetchCaseStudies } from '../api/client';
-import type { Testimonial, SiteContent, CaseStudy } from '../types';
+import { fetchPageBundle } from '../api/client';
+import type { Testimonial, SiteContent, CaseStudySummary } from '../types';
 import Skeleton from '../components/Skeleton';
 import useCountUp from '../hooks/useCountUp';
 import './AboutPage.css';
@@ -78,7 +78,7 @@ export default function AboutPage() {
   const [storyHtml, setStoryHtml] = useState(STORY_DEFAULT);
   const [whyPlatformHtml, setWhyPlatformHtml] = useState(WHY_PLATFORM_DEFAULT);
   const [philosophy, setPhilosophy] = useState(PHILOSOPHY_DEFAULTS);
-  const [caseStudies, setCaseStudies] = useState<CaseStudy[]>([]);
+  const [caseStudies, setCaseStudies] = useState<CaseStudySummary[]>([]);
   const [techStack, setTechStack] = useState<TechStackData>(TECH_STACK_DEFAULTS);
 
   // Derive hero display values from API data or fallbacks
@@ -124,14 +124,10 @@ export default function AboutPage() {
     async function loadData() {
       try {
         setLoading(true);
-        const [testimonialsData, siteContentData, caseStudiesData] = await Promise.allSettled([
-          fetchTestimonials(),
-          fetchSiteContent(),
-          fetchCaseStudies(),
-        ]);
+        const bundle = await fetchPageBundle("about").catch(() => null);
 
-        if (testimonialsData.status === "fulfilled") {
-          setTestimonials(testimonialsData.value);
+        if (bundle) {
+          setTestimonials(bundle.testimonials);
         } else {
           // Fallback mock data if API fails
           setTestimonials([
@@ -168,8 +164,8 @@ export default function AboutPage() {
           ]);
         }
 
-        if (siteContentData.status === "fulfilled") {
-          const items = siteContentData.value;
+        if (bundle) {
+          const items = bundle.site_content;
           const hero = items.find((i) => i.key === "about_hero");
           const story = items.find((i) => i.key === "about_story");
           const whyPlatform = items.find((i) => i.key === "about_why_platform");
@@ -200,8 +196,8 @@ export default function AboutPage() {
           }
         }
 
-        if (caseStudiesData.status === "fulfilled") {
-          setCaseStudies(caseStudiesData.value);
+        if (bundle) {
+          setCaseStudies(bundle.case_studies);
         }
       } finally {
         setLoading(false);
@@ -2,7 +2,7 @@ import { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import Layout from '../components/Layout';
 import { fetchCaseStudy, fetchCaseStudies } from '../api/client';
-import type { CaseStudy } from '../types';
+import type { CaseStudy, CaseStudySummary } from '../types';
 import Skeleton from '../components/Skeleton';
 import './CaseStudyDetail.css';
 
@@ -31,7 +31,7 @@ const getIconEmoji = (icon: string) => {
 export default function CaseStudyDetail() {
   const { slug } = useParams<{ slug: string }>();
   const [caseStudy, setCaseStudy] = useState<CaseStudy | null>(null);
-  const [relatedStudies, setRelatedStudies] = useState<CaseStudy[]>([]);
+  const [relatedStudies, setRelatedStudies] = useState<CaseStudySummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(false);
 
@@ -1,8 +1,8 @@
 import { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import Layout from '../components/Layout';
-import { fetchCaseStudies, fetchTestimonials, fetchSiteContent } from '../api/client';
-import type { CaseStudy, Testimonial } from '../types';
+import { fetchPageBundle } from '../api/client';
+import type { CaseStudySummary, Testimonial } from '../types';
 import Skeleton from '../components/Skeleton';
 import './HomePage.css';
 
@@ -74,7 +74,7 @@ const SERVICES_DEFAULTS = {
 
 export default function HomePage() {
   const [visibleElements, setVisibleElements] = useState<Set<number>>(new Set());
-  const [caseStudies, setCaseStudies] = useState<CaseStudy[]>([]);
+  const [caseStudies, setCaseStudies] = useState<CaseStudySummary[]>([]);
   const [testimonials, setTestimonials] = useState<Testimonial[]>([]);
   const [loading, setLoading] = useState(true);
   const [heroTagline, setHeroTagline] = useState(TAGLINE_DEFAULT);
@@ -86,15 +86,11 @@ export default function HomePage() {
     async function loadData() {
       try {
         setLoading(true);
-        const [caseStudiesData, testimonialsData, siteContentData] = await Promise.allSettled([
-          fetchCaseStudies(),
-          fetchTestimonials(),
-          fetchSiteContent(),
-        ]);
-        if (caseStudiesData.status === "fulfilled") setCaseStudies(caseStudiesData.value);
-        if (testimonialsData.status === "fulfilled") setTestimonials(testimonialsData.value);
-        if (siteContentData.status === "fulfilled") {
-          const items = siteContentData.value;
+        const bundle = await fetchPageBundle("home").catch(() => null);
+        if (bundle) {
+          setCaseStudies(bundle.case_studies);
+          setTestimonials(bundle.testimonials);
+          const items = bundle.site_content;
           const description = items.find((i) => i.key === "hero_description");
           if (description) {
             if (description.title) setHeroTagline(description.title);
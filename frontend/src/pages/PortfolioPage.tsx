@@ -1,8 +1,8 @@
 import { useState, useEffect, useMemo } from 'react';
 import { Link } from 'react-router-dom';
 import Layout from '../components/Layout';
-import { fetchCaseStudies, fetchSiteContent } from '../api/client';
-import type { CaseStudy } from '../types';
+import { fetchPageBundle } from '../api/client';
+import type { CaseStudySummary } from '../types';
 import Skeleton from '../components/Skeleton';
 import useCountUp from '../hooks/useCountUp';
 import './PortfolioPage.css';
@@ -22,7 +22,7 @@ const CATEGORY_ORDER = ["Language", "Framework", "Infrastructure", "Data & Messa
 export default function PortfolioPage() {
   const [selectedIndustry, setSelectedIndustry] = useState('All Projects');
   const [selectedTech, setSelectedTech] = useState<string[]>([]);
-  const [caseStudies, setCaseStudies] = useState<CaseStudy[]>([]);
+  const [caseStudies, setCaseStudies] = useState<CaseStudySummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [visibleElements, setVisibleElements] = useState<Set<number>>(new Set());
 
@@ -37,13 +37,10 @@ export default function PortfolioPage() {
     async function loadData() {
       try {
         setLoading(true);
-        const [caseStudiesData, siteContentData] = await Promise.allSettled([
-          fetchCaseStudies(),
-          fetchSiteContent(),
-        ]);
+        const bundle = await fetchPageBundle("portfolio").catch(() => null);
 
-        if (caseStudiesData.status === "fulfilled") {
-          setCaseStudies(caseStudiesData.value);
+        if (bundle) {
+          setCaseStudies(bundle.case_studies);
         } else {
           setCaseStudies([
             {
@@ -52,34 +49,34 @@ export default function PortfolioPage() {
               industry: 'AI / ML',
               technologies: [{ name: 'Python', category: 'Language' }, { name: 'LangChain', category: 'AI & ML' }, { name: 'OpenAI', category: 'AI & ML' }, { name: 'FastAPI', category: 'Framework' }, { name: 'React', category: 'Framework' }],
               featured: true, metrics: [{ value: '60%', label: 'Faster Response Time' }, { value: '85%', label: 'Query Resolution Rate' }, { value: '24/7', label: 'Availability' }],
-              visual: { color: 'ai', icon: 'microphone' }, display_order: 0, is_active: true,
+              visual: { color: 'ai', icon: 'microphone' },
             },
             {
               id: 'hit-platform', slug: 'hit-platform', title: 'HIT Platform', role: 'Lead Backend Engineer',
               description: 'A healthcare information technology platform designed to streamline clinical workflows, improve patient data management, and enable seamless interoperability across hospital systems.',
               industry: 'Healthcare',
               technologies: [{ name: 'Python', category: 'Language' }, { name: 'FastAPI', category: 'Framework' }, { name: 'React', category: 'Framework' }, { name: 'PostgreSQL', category: 'Data & Messaging' }, { name: 'Docker', category: 'Infrastructure' }],
-              featured: false, visual: { color: 'healthcare', icon: 'activity' }, display_order: 1, is_active: true,
+              featured: false, visual: { color: 'healthcare', icon: 'activity' },
             },
             {
               id: 'vas-platform', slug: 'vas-platform', title: 'VAS Platform', role: 'Full Stack Developer',
               description: 'A value-added services platform enabling telecom operators to deliver digital content, subscription management, and billing integration at scale for millions of subscribers.',
               industry: 'Telecom',
               technologies: [{ name: 'Java', category: 'Language' }, { name: 'Spring Boot', category: 'Framework' }, { name: 'Kafka', category: 'Data & Messaging' }, { name: 'Redis', category: 'Data & Messaging' }, { name: 'AWS', category: 'Infrastructure' }],
-              featured: false, visual: { color: 'telecom', icon: 'bar-chart' }, display_order: 2, is_active: true,
+              featured: false, visual: { color: 'telecom', icon: 'bar-chart' },
             },
             {
               id: 'cloud-migration', slug: 'cloud-migration', title: 'Cloud Migration Strategy', role: 'Solutions Architect',
               description: 'Architecture review, migration planning, and hands-on support for containerizing on-premise services and migrating infrastructure to AWS for a mid-size enterprise.',
               industry: 'Cloud / DevOps',
               technologies: [{ name: 'AWS', category: 'Infrastructure' }, { name: 'Docker', category: 'Infrastructure' }, { name: 'Kubernetes', category: 'Infrastructure' }, { name: 'Terraform', category: 'Infrastructure' }],
-              featured: false, visual: { color: 'fintech', icon: 'cloud' }, display_order: 3, is_active: true,
+              featured: false, visual: { color: 'fintech', icon: 'cloud' },
             },
           ]);
         }
 
-        if (siteContentData.status === "fulfilled") {
-          const items = siteContentData.value;
+        if (bundle) {
+          const items = bundle.site_content;
           const portfolio = items.find((i) => i.key === "portfolio_hero");
           if (portfolio) {
             setHeroSubtitle(portfolio.content || PORTFOLIO_DEFAULTS.subtitle);
@@ -67,7 +67,9 @@ export interface GalleryItem {
   type: "screenshot" | "architecture";
 }
 
-export interface CaseStudy {
+/** List and bundle shape: the narrative, gallery and admin fields are only
+ * returned by the detail and admin endpoints. */
+export interface CaseStudySummary {
   id: string;
   slug: string;
   title: string;
@@ -80,6 +82,15 @@ export interface CaseStudy {
     value: string;
     label: string;
   }[];
+  visual: {
+    color: string;
+    icon: string;
+  };
+  created_at?: string;
+  updated_at?: string;
+}
+
+export interface CaseStudy extends CaseStudySummary {
   problem?: string;
   solution?: string;
   role_description?: string;
@@ -88,14 +99,8 @@ export interface CaseStudy {
   challenges?: string;
   impact?: string;
   gallery?: GalleryItem[];
-  visual: {
-    color: string;
-    icon: string;
-  };
   display_order: number;
   is_active: boolean;
-  created_at?: string;
-  updated_at?: string;
 }
 
 export interface CaseStudyFormData {
@@ -155,6 +160,14 @@ export interface SiteContent {
   updated_at?: string;
 }
 
+export interface PageBundle {
+  case_studies: CaseStudySummary[];
+  testimonials: Testimonial[];
+  site_content: SiteContent[];
+}
+
+export type BundlePage = "home" | "portfolio" | "about";
+
 export interface SiteContentFormData {
   key: string;
   title?: string;